@@ -12,7 +12,7 @@ import re          # Pour les expressions régulières (extraction d'information
 from tabulate import tabulate  # Pour formater les tableaux de résultats
 
 # Récupérer la liste des instances depuis le module taquin_complet
-from src.taquin_complet import INSTANCES
+from src.taquin_complet import INSTANCES, Taquin
 
 def analyser_instance(instance_name):
     """
@@ -37,6 +37,18 @@ def analyser_instance(instance_name):
     """
     print(f"\nAnalyse de l'instance: {instance_name}")
     
+    # Rejeter les instances non résolubles sans lancer de résolution
+    taquin = Taquin()
+    if taquin.charger_depuis_chaine(INSTANCES[instance_name]) and not taquin.est_resoluble():
+        print(f"Instance non résoluble ({taquin.resolubilite['raison']})")
+        return {
+            "instance": instance_name,
+            "succes": False,
+            "noeuds": None,
+            "etapes": None,
+            "temps": 0.0
+        }
+    
     # Préparer la commande à exécuter
     # L'algorithme A* avec l'heuristique combinée est utilisé
     # avec une limite de temps de 30 secondes
@@ -23,9 +23,14 @@ from src.taquin_complet import (
     resolution_dfs, 
     resolution_bfs,
     resolution_best_first, 
-    resolution_a_star
+    resolution_a_star,
+    resolution_ida_star,
+    resolution_mm
 )
 
+# Algorithmes guidés par une heuristique (testés avec chacune des heuristiques)
+ALGORITHMES_INFORMES = ['best-first', 'a-star', 'ida-star', 'mm']
+
 
 def mesurer_performances(
     taquin: Taquin, 
@@ -42,7 +47,7 @@ def mesurer_performances(
         taquin: Instance du jeu de Taquin
         algo_fonction: Fonction de résolution à mesurer
         algo_nom: Nom de l'algorithme
-        heuristique: Nom de l'heuristique (pour Best-First et A*)
+        heuristique: Nom de l'heuristique (pour les algorithmes informés)
         limite_noeuds: Limite de nœuds à explorer
         limite_temps: Limite de temps en secondes
         
@@ -59,6 +64,7 @@ def mesurer_performances(
     debut = time.time()
     
     # Exécuter l'algorithme avec ou sans heuristique
+    taquin.statistiques = {}
     if algo_nom == "dfs":
         chemin = algo_fonction(taquin, limite_profondeur=limite_noeuds, limite_temps=limite_temps)
     elif heuristique:
@@ -87,7 +93,11 @@ def mesurer_performances(
         "mem_utilisee": mem_apres - mem_avant,
         "mem_pic": pic_memoire / (1024 * 1024),  # en MB
         "longueur_solution": len(chemin) if chemin else None,
-        "noeuds_explores": None  # Cette information est affichée mais pas retournée par les fonctions
+        # Compteurs renseignés par les algorithmes qui les exposent (None sinon)
+        "noeuds_explores": taquin.statistiques.get("noeuds_explores"),
+        "noeuds_generes": taquin.statistiques.get("noeuds_generes"),
+        "noeuds_explores_avant": taquin.statistiques.get("noeuds_explores_avant"),
+        "noeuds_explores_arriere": taquin.statistiques.get("noeuds_explores_arriere")
     }
     
     return resultats
@@ -126,7 +136,7 @@ def executer_tests_comparatifs(
             continue
             
         if not taquin.est_resoluble():
-            print(f"L'instance {nom_instance} n'est pas résoluble")
+            print(f"L'instance {nom_instance} n'est pas résoluble ({taquin.resolubilite['raison']})")
             continue
             
         resultats[nom_instance] = {}
@@ -136,8 +146,8 @@ def executer_tests_comparatifs(
             print(f"\n  Algorithme: {algo_nom}")
             resultats[nom_instance][algo_nom] = []
             
-            if algo_nom in ['best-first', 'a-star']:
-                # Tester chaque heuristique pour Best-First et A*
+            if algo_nom in ALGORITHMES_INFORMES:
+                # Tester chaque heuristique pour les algorithmes informés
                 for h in heuristiques:
                     print(f"    Heuristique: {h}")
                     try:
@@ -181,6 +191,24 @@ def executer_tests_comparatifs(
     return resultats
 
 
+def formater_noeuds(res: Dict[str, Any]) -> str:
+    """
+    Formate le nombre de nœuds explorés, avec la répartition par direction
+    pour les recherches bidirectionnelles.
+    
+    Args:
+        res: Résultats d'une mesure de performances
+        
+    Returns:
+        str: Texte de la cellule ("-" si le compteur n'est pas disponible)
+    """
+    if res.get("noeuds_explores") is None:
+        return "-"
+    if res.get("noeuds_explores_avant") is None:
+        return str(res["noeuds_explores"])
+    return f"{res['noeuds_explores']} ({res['noeuds_explores_avant']} + {res['noeuds_explores_arriere']})"
+
+
 def generer_tableaux(resultats: Dict[str, Dict[str, List[Dict[str, Any]]]]) -> List[str]:
     """
     Génère des tableaux formatés à partir des résultats.
@@ -204,11 +232,12 @@ def generer_tableaux(resultats: Dict[str, Dict[str, List[Dict[str, Any]]]]) -> L
                     "Oui" if res["succes"] else "Non",
                     f"{res['longueur_solution']}" if res["succes"] else "-",
                     f"{res['temps_execution']:.4f}",
-                    f"{res['mem_utilisee']:.2f}"
+                    f"{res['mem_utilisee']:.2f}",
+                    formater_noeuds(res)
                 ]
                 tableau_data.append(row)
         
-        headers = ["Algorithme", "Heuristique", "Succès", "Étapes", "Temps (s)", "Mémoire (MB)"]
+        headers = ["Algorithme", "Heuristique", "Succès", "Étapes", "Temps (s)", "Mémoire (MB)", "Nœuds"]
         tableau = f"\nInstance: {nom_instance}\n"
         tableau += tabulate(tableau_data, headers=headers, tablefmt="grid")
         tableaux.append(tableau)
@@ -238,7 +267,7 @@ def generer_graphiques(resultats: Dict[str, Dict[str, List[Dict[str, Any]]]]) ->
         
         for algo_nom, results_list in algos.items():
             for res in results_list:
-                if algo_nom in ['best-first', 'a-star']:
+                if algo_nom in ALGORITHMES_INFORMES:
                     cat = f"{algo_nom}\n({res['heuristique']})"
                 else:
                     cat = algo_nom
@@ -264,7 +293,7 @@ def generer_graphiques(resultats: Dict[str, Dict[str, List[Dict[str, Any]]]]) ->
         for algo_nom, results_list in algos.items():
             for res in results_list:
                 if res["succes"]:
-                    if algo_nom in ['best-first', 'a-star']:
+                    if algo_nom in ALGORITHMES_INFORMES:
                         cat = f"{algo_nom}\n({res['heuristique']})"
                     else:
                         cat = algo_nom
@@ -289,7 +318,7 @@ def generer_graphiques(resultats: Dict[str, Dict[str, List[Dict[str, Any]]]]) ->
         
         for algo_nom, results_list in algos.items():
             for res in results_list:
-                if algo_nom in ['best-first', 'a-star']:
+                if algo_nom in ALGORITHMES_INFORMES:
                     cat = f"{algo_nom}\n({res['heuristique']})"
                 else:
                     cat = algo_nom
@@ -315,7 +344,7 @@ def generer_graphiques(resultats: Dict[str, Dict[str, List[Dict[str, Any]]]]) ->
         for algo_nom, results_list in algos.items():
             for res in results_list:
                 if res["succes"] and res["temps_execution"] > 0:
-                    if algo_nom in ['best-first', 'a-star']:
+                    if algo_nom in ALGORITHMES_INFORMES:
                         cat = f"{algo_nom}\n({res['heuristique']})"
                     else:
                         cat = algo_nom
@@ -351,8 +380,10 @@ Ce rapport présente une analyse comparative des performances de différents alg
 - Parcours en largeur (BFS)
 - Parcours meilleur d'abord (Best-First Search)
 - Algorithme A* (A-Star)
+- Algorithme IDA* (A* itératif en profondeur)
+- Recherche bidirectionnelle heuristique MM (Meet in the Middle)
 
-Deux heuristiques optimisées ont été testées pour les algorithmes Best-First et A*:
+Deux heuristiques optimisées ont été testées pour les algorithmes informés:
 - Heuristique linéaire (prise en compte des conflits linéaires)
 - Heuristique combinée (approche hybride optimisée)
 
@@ -371,6 +402,7 @@ Pour chaque combinaison d'algorithme et d'heuristique, les métriques suivantes
 - Longueur de la solution (nombre d'étapes)
 - Temps d'exécution (en secondes)
 - Mémoire utilisée (en MB)
+- Nœuds explorés (avec la répartition départ + but pour MM)
 
 ## Résultats
 
@@ -454,7 +486,9 @@ def main():
         ("dfs", resolution_dfs),
         ("bfs", resolution_bfs),
         ("best-first", resolution_best_first),
-        ("a-star", resolution_a_star)
+        ("a-star", resolution_a_star),
+        ("ida-star", resolution_ida_star),
+        ("mm", resolution_mm)
     ]
     
     # Définir les heuristiques à tester (uniquement les deux retenues)
@@ -71,6 +71,11 @@ def analyser_instance(nom_instance, contenu_instance, algorithmes=None, limite_t
             print(f"Erreur lors du chargement de l'instance {nom_instance}")
             return {"erreur": "Échec du chargement"}
         
+        # Rejeter immédiatement les configurations non résolubles
+        if not taquin.est_resoluble():
+            print(f"L'instance {nom_instance} n'est pas résoluble ({taquin.resolubilite['raison']})")
+            return {"erreur": "Non résoluble", "resolubilite": taquin.resolubilite}
+        
         # Analyser avec chaque algorithme
         for algo in algorithmes:
             print(f"Analyse de {nom_instance} avec {algo}...")
@@ -6,49 +6,1219 @@ Le fichier regroupe toutes les fonctionnalités en un seul module.
 import os
 import sys
 import time
+import json
+import mmap
+import zlib
+import heapq
+import random
+import struct
+import hashlib
 import argparse
+import tempfile
+import itertools
+from array import array
 from collections import deque
+from functools import lru_cache
+from math import factorial
 import numpy as np
-from typing import List, Tuple, Optional, Dict, Set
+from typing import Any, List, Tuple, Optional, Dict, Set, Callable
 
 # ============================================================================
 # PARTIE 1: STRUCTURES DE DONNÉES
 # ============================================================================
 
+# Directions de déplacement de la case vide, indexées par leur code.
+# Le code du mouvement inverse s'obtient par `code ^ 1`.
+DIRECTIONS = ('haut', 'bas', 'gauche', 'droite')
+CODES_DIRECTIONS = {direction: code for code, direction in enumerate(DIRECTIONS)}
+
+
+@lru_cache(maxsize=None)
+def table_deplacements(taille_x: int, taille_y: int) -> Tuple[Tuple[Tuple[int, int], ...], ...]:
+    """
+    Précalcule les déplacements possibles pour une taille de grille.
+    
+    Args:
+        taille_x: Nombre de lignes de la grille
+        taille_y: Nombre de colonnes de la grille
+        
+    Returns:
+        Pour chaque position de la case vide, la liste des couples
+        (case cible, code de direction) dans l'ordre de DIRECTIONS
+    """
+    table = []
+    for vide in range(taille_x * taille_y):
+        i, j = divmod(vide, taille_y)
+        deplacements = []
+        if i > 0:
+            deplacements.append((vide - taille_y, 0))
+        if i < taille_x - 1:
+            deplacements.append((vide + taille_y, 1))
+        if j > 0:
+            deplacements.append((vide - 1, 2))
+        if j < taille_y - 1:
+            deplacements.append((vide + 1, 3))
+        table.append(tuple(deplacements))
+    return tuple(table)
+
+
+class CodageEtat:
+    """
+    Codage compact des caractères d'une instance en petits entiers.
+    
+    La case vide reçoit toujours le code 0 et les autres caractères sont
+    numérotés à partir de 1 dans l'ordre lexicographique. Un état est stocké
+    sous la forme d'un seul entier où chaque case occupe `bits` bits, la case
+    (0, 0) occupant les bits de poids fort.
+    
+    Le codage porte aussi la table de Zobrist de l'alphabet: une valeur
+    aléatoire par couple (code, case), nulle pour la case vide. Le hachage
+    d'un état est le XOR des valeurs de ses tuiles, ce qui permet de le
+    mettre à jour en O(1) lors d'un déplacement.
+    """
+    _cache: Dict[Tuple[int, int, frozenset], 'CodageEtat'] = {}
+    
+    def __init__(self, taille_x: int, taille_y: int, caracteres, caractere_vide: str = ' '):
+        """
+        Initialise le codage d'une instance.
+        
+        Args:
+            taille_x: Nombre de lignes de la grille
+            taille_y: Nombre de colonnes de la grille
+            caracteres: Caractères présents dans l'instance
+            caractere_vide: Caractère représentant la case vide
+        """
+        self.taille_x = taille_x
+        self.taille_y = taille_y
+        self.nb_cases = taille_x * taille_y
+        autres = sorted(set(caracteres) - {caractere_vide})
+        self.caracteres = (caractere_vide,) + tuple(autres)
+        self.codes = {caractere: code for code, caractere in enumerate(self.caracteres)}
+        self.bits = max(1, (len(self.caracteres) - 1).bit_length())
+        self.masque = (1 << self.bits) - 1
+        self.decalages = tuple(self.bits * (self.nb_cases - 1 - k) for k in range(self.nb_cases))
+        
+        # Table de Zobrist indexée par code * nb_cases + case (graine fixe pour
+        # que les hachages soient reproductibles d'une exécution à l'autre)
+        generateur = random.Random(len(self.caracteres) * 1000 + self.nb_cases)
+        self.zobrist = [0] * self.nb_cases + [
+            generateur.getrandbits(62) for _ in range((len(self.caracteres) - 1) * self.nb_cases)
+        ]
+    
+    @classmethod
+    def pour(cls, taille_x: int, taille_y: int, caracteres, caractere_vide: str = ' ') -> 'CodageEtat':
+        """
+        Retourne le codage partagé pour une taille et un alphabet donnés.
+        
+        Deux états construits séparément sur le même alphabet partagent ainsi
+        le même codage et restent comparables en O(1).
+        """
+        cle = (taille_x, taille_y, frozenset(caracteres) | {caractere_vide})
+        codage = cls._cache.get(cle)
+        if codage is None:
+            codage = cls(taille_x, taille_y, cle[2], caractere_vide)
+            cls._cache[cle] = codage
+        return codage
+    
+    def encoder(self, valeurs) -> int:
+        """Encode une séquence de caractères (ordre ligne par ligne) en entier compact"""
+        cle = 0
+        for valeur in valeurs:
+            cle = (cle << self.bits) | self.codes[valeur]
+        return cle
+    
+    def decoder(self, cle: int) -> Tuple[int, ...]:
+        """Décode un entier compact en la séquence des codes de chaque case"""
+        masque = self.masque
+        return tuple((cle >> decalage) & masque for decalage in self.decalages)
+    
+    def hacher(self, cle: int) -> int:
+        """Calcule complètement le hachage de Zobrist d'un entier compact"""
+        zobrist = self.zobrist
+        n = self.nb_cases
+        valeur = 0
+        for case, code in enumerate(self.decoder(cle)):
+            valeur ^= zobrist[code * n + case]
+        return valeur
+
+
 class Etat:
     """
     Classe représentant un état du jeu de Taquin avec des caractères.
+    
+    La grille est stockée sous forme d'un entier compact (voir CodageEtat)
+    et la case vide par son indice linéaire. La grille NumPy reste disponible
+    via la propriété `grille` pour l'affichage.
     """
-    def __init__(self, grille: np.ndarray, pos_vide: Tuple[int, int]):
+    __slots__ = ('cle', 'vide', 'codage', '_hash')
+    
+    def __init__(self, grille: np.ndarray, pos_vide: Tuple[int, int], codage: Optional[CodageEtat] = None):
         """
         Initialise un état du jeu.
         
         Args:
             grille: La grille de jeu sous forme de tableau numpy 2D de caractères
             pos_vide: La position de la case vide (ligne, colonne)
+            codage: Codage de l'alphabet (déduit de la grille par défaut)
+        """
+        grille = np.asarray(grille)
+        valeurs = grille.ravel().tolist()
+        if codage is None:
+            codage = CodageEtat.pour(grille.shape[0], grille.shape[1], valeurs)
+        self.codage = codage
+        self.cle = codage.encoder(valeurs)
+        self.vide = pos_vide[0] * codage.taille_y + pos_vide[1]
+        self._hash = None
+    
+    @classmethod
+    def depuis_cle(cls, codage: CodageEtat, cle: int, vide: int, hachage: Optional[int] = None) -> 'Etat':
+        """
+        Construit directement un état à partir de son entier compact.
+        
+        Args:
+            codage: Codage de l'alphabet
+            cle: Entier compact de la grille
+            vide: Indice linéaire de la case vide
+            hachage: Hachage de Zobrist déjà connu (calculé à la demande sinon)
         """
-        self.grille = grille
-        self.pos_vide = pos_vide
+        etat = cls.__new__(cls)
+        etat.codage = codage
+        etat.cle = cle
+        etat.vide = vide
+        etat._hash = hachage
+        return etat
+    
+    def __getitem__(self, case: int) -> int:
+        """Code de la case d'indice linéaire `case`"""
+        codage = self.codage
+        return (self.cle >> codage.decalages[case]) & codage.masque
+    
+    @property
+    def pos_vide(self) -> Tuple[int, int]:
+        """Position de la case vide (ligne, colonne)"""
+        return divmod(self.vide, self.codage.taille_y)
+    
+    @property
+    def cases(self) -> Tuple[int, ...]:
+        """Codes des cases dans l'ordre ligne par ligne"""
+        return self.codage.decoder(self.cle)
+    
+    @property
+    def grille(self) -> np.ndarray:
+        """Grille de caractères sous forme de tableau numpy (pour l'affichage)"""
+        caracteres = self.codage.caracteres
+        grille = np.array([caracteres[code] for code in self.cases], dtype='U1')
+        return grille.reshape(self.codage.taille_x, self.codage.taille_y)
     
     def __eq__(self, other):
-        """Vérifie si deux états sont identiques"""
+        """
+        Vérifie si deux états sont identiques.
+        
+        Seuls les états d'un même codage sont comparables (le hachage de
+        Zobrist dépend du codage): des états de codages différents sont
+        considérés distincts, même si leurs grilles coïncident. Le Taquin
+        réencode ses états sur un codage commun (voir _harmoniser_codage).
+        """
         if not isinstance(other, Etat):
             return False
-        return np.array_equal(self.grille, other.grille)
+        return self.codage is other.codage and self.cle == other.cle
     
     def __hash__(self):
-        """Permet d'utiliser les états comme clés de dictionnaire"""
-        return hash(str(self.grille))
+        """Permet d'utiliser les états comme clés de dictionnaire (hachage de Zobrist)"""
+        if self._hash is None:
+            self._hash = self.codage.hacher(self.cle)
+        return self._hash
     
     def copier(self) -> 'Etat':
-        """Crée une copie profonde de l'état actuel"""
-        return Etat(self.grille.copy(), self.pos_vide)
+        """Crée une copie de l'état actuel (l'entier compact est immuable)"""
+        return Etat.depuis_cle(self.codage, self.cle, self.vide, self._hash)
+
+
+class ClassementEtats:
+    """
+    Classement des états d'une instance en indices denses.
+    
+    Les états atteignables sont les permutations du multiensemble des codes
+    de l'état de référence. Le rang d'un état est son rang lexicographique
+    parmi ces permutations (code de Lehmer généralisé aux lettres répétées),
+    compris entre 0 et `nb_permutations - 1`.
+    """
+    def __init__(self, etat_reference: Etat):
+        """
+        Prépare les tables de classement.
+        
+        Args:
+            etat_reference: État dont on reprend le multiensemble de codes
+        """
+        codage = etat_reference.codage
+        self.codage = codage
+        self.comptes = [0] * len(codage.caracteres)
+        for code in etat_reference.cases:
+            self.comptes[code] += 1
+        
+        self.nb_permutations = factorial(codage.nb_cases)
+        for compte in self.comptes:
+            self.nb_permutations //= factorial(compte)
+        
+        # Chaque exemplaire d'un code occupe un bit d'un masque "unaire": le
+        # nombre de codes restants inférieurs à c est alors un simple popcount
+        self.masque_initial = 0
+        self.debuts = []
+        self.masques_inferieurs = []
+        position = 0
+        for compte in self.comptes:
+            self.debuts.append(position)
+            self.masques_inferieurs.append((1 << position) - 1)
+            position += compte
+        self.masque_initial = (1 << position) - 1
+    
+    def rang(self, cle: int) -> int:
+        """
+        Calcule le rang d'un état à partir de son entier compact.
+        
+        Args:
+            cle: Entier compact de l'état
+            
+        Returns:
+            int: Rang dans [0, nb_permutations)
+        """
+        codage = self.codage
+        masque_code = codage.masque
+        comptes = list(self.comptes)
+        debuts = self.debuts
+        inferieurs = self.masques_inferieurs
+        restants = self.masque_initial
+        m = codage.nb_cases
+        multinomial = self.nb_permutations
+        rang = 0
+        
+        for decalage in codage.decalages:
+            code = (cle >> decalage) & masque_code
+            # Permutations qui commencent par un code plus petit à cette case
+            rang += multinomial * (restants & inferieurs[code]).bit_count() // m
+            multinomial = multinomial * comptes[code] // m
+            comptes[code] -= 1
+            restants ^= 1 << (debuts[code] + comptes[code])
+            m -= 1
+        
+        return rang
+
+
+def affectation_minimale(couts: List[List[float]]) -> float:
+    """
+    Coût minimal d'une affectation (méthode hongroise, en O(n² m)).
+    
+    Chaque ligne est affectée à une colonne distincte; s'il y a plus de
+    lignes que de colonnes, seules min(n, m) lignes sont affectées.
+    
+    Args:
+        couts: Matrice n x m des coûts
+        
+    Returns:
+        Somme minimale des coûts des couples affectés
+    """
+    if not couts or not couts[0]:
+        return 0
+    if len(couts) > len(couts[0]):
+        couts = [list(colonne) for colonne in zip(*couts)]
+    n, m = len(couts), len(couts[0])
+    infini = float('inf')
+    # Potentiels des lignes (u) et des colonnes (v), ligne affectée à chaque colonne (p)
+    u = [0] * (n + 1)
+    v = [0] * (m + 1)
+    p = [0] * (m + 1)
+    chemin = [0] * (m + 1)
+    for i in range(1, n + 1):
+        p[0] = i
+        j0 = 0
+        minimums = [infini] * (m + 1)
+        utilisees = [False] * (m + 1)
+        while True:
+            utilisees[j0] = True
+            i0, delta, j1 = p[j0], infini, 0
+            for j in range(1, m + 1):
+                if not utilisees[j]:
+                    reduit = couts[i0 - 1][j - 1] - u[i0] - v[j]
+                    if reduit < minimums[j]:
+                        minimums[j], chemin[j] = reduit, j0
+                    if minimums[j] < delta:
+                        delta, j1 = minimums[j], j
+            for j in range(m + 1):
+                if utilisees[j]:
+                    u[p[j]] += delta
+                    v[j] -= delta
+                else:
+                    minimums[j] -= delta
+            j0 = j1
+            if p[j0] == 0:
+                break
+        # Inverser le chemin augmentant
+        while j0:
+            j1 = chemin[j0]
+            p[j0] = p[j1]
+            j0 = j1
+    return sum(couts[p[j] - 1][j - 1] for j in range(1, m + 1) if p[j])
+
+
+class IndexBut:
+    """
+    Tables précalculées pour un état final (« GoalIndex »).
+    
+    Construit une seule fois par état final et partagé par toutes les
+    heuristiques, il remplace le dictionnaire des positions finales que
+    chaque heuristique reconstruisait à chaque appel. Les tables sont
+    indexées par code de caractère (voir CodageEtat) et par case; un code
+    absent de l'état final a pour position (-1, -1) et ne compte pas.
+    
+    Les exemplaires d'une lettre répétée sont interchangeables: leur
+    distance est le coût minimal d'une affectation de leurs cases courantes
+    à leurs cases finales (voir affectation_minimale), ce qui reste
+    admissible. Les tables par code ne couvrent donc que les lettres uniques.
+    """
+    def __init__(self, etat_final: Etat):
+        """
+        Construit les tables de l'état final.
+        
+        Args:
+            etat_final: État but de l'instance
+        """
+        codage = etat_final.codage
+        taille_x, taille_y = codage.taille_x, codage.taille_y
+        nb_cases = codage.nb_cases
+        nb_codes = len(codage.caracteres)
+        self.etat_final = etat_final
+        self.taille_y = taille_y
+        self.nb_cases = nb_cases
+        self.finales = etat_final.cases
+        self.codes_tries = sorted(self.finales)
+        
+        # Ligne et colonne finales de chaque code (la dernière occurrence
+        # l'emporte pour les lettres répétées, comme auparavant)
+        self.lignes_finales = [-1] * nb_codes
+        self.colonnes_finales = [-1] * nb_codes
+        for case, code in enumerate(self.finales):
+            self.lignes_finales[code], self.colonnes_finales[code] = divmod(case, taille_y)
+        
+        # Lettres répétées: cases finales de chacune, et distances case x case
+        # pour leurs matrices d'affectation
+        self.cases_finales = {}
+        for case, code in enumerate(self.finales):
+            if code:
+                self.cases_finales.setdefault(code, []).append(case)
+        self.codes_repetes = [code for code, cases in self.cases_finales.items() if len(cases) > 1]
+        self.est_repete = [False] * nb_codes
+        for code in self.codes_repetes:
+            self.est_repete[code] = True
+        self.distances_cases = []
+        self.distances_cases_euclidiennes = []
+        for case in range(nb_cases):
+            i, j = divmod(case, taille_y)
+            self.distances_cases.append([abs(i - i2) + abs(j - j2)
+                                         for i2, j2 in (divmod(c, taille_y) for c in range(nb_cases))])
+            self.distances_cases_euclidiennes.append([((i - i2)**2 + (j - j2)**2)**0.5
+                                                      for i2, j2 in (divmod(c, taille_y) for c in range(nb_cases))])
+        
+        # Distances code x case, à l'indice code * nb_cases + case (nulles
+        # pour la case vide, les lettres répétées et les codes absents)
+        self.distances = [0] * (nb_codes * nb_cases)
+        self.distances_euclidiennes = [0.0] * (nb_codes * nb_cases)
+        for code in range(1, nb_codes):
+            i_final, j_final = self.lignes_finales[code], self.colonnes_finales[code]
+            if i_final < 0 or self.est_repete[code]:
+                continue
+            for case in range(nb_cases):
+                i, j = divmod(case, taille_y)
+                self.distances[code * nb_cases + case] = abs(i - i_final) + abs(j - j_final)
+                self.distances_euclidiennes[code * nb_cases + case] = ((i - i_final)**2 + (j - j_final)**2)**0.5
+        
+        # Masques des codes dont la ligne (colonne) finale est la ligne (colonne) k
+        # (une lettre répétée n'a pas de ligne finale unique: pas de conflit compté)
+        self.masques_lignes = [0] * taille_x
+        self.masques_colonnes = [0] * taille_y
+        for code in range(1, nb_codes):
+            if self.lignes_finales[code] >= 0 and not self.est_repete[code]:
+                self.masques_lignes[self.lignes_finales[code]] |= 1 << code
+                self.masques_colonnes[self.colonnes_finales[code]] |= 1 << code
+        
+        # Coins de la grille et pénalité (3 x distance au coin) d'un code de
+        # coin sur chaque case; les bords ne sont pas pénalisés. Une lettre
+        # répétée n'est pénalisée que pour sa dernière occurrence dans l'état
+        # (ordre ligne par ligne), comme auparavant: elle est traitée à part
+        self.coins = [(0, 0), (0, taille_y-1), (taille_x-1, 0), (taille_x-1, taille_y-1)]
+        self.penalites_coins = [0] * (nb_codes * nb_cases)
+        self.coins_repetes = []
+        for i_coin, j_coin in self.coins:
+            code = self.finales[i_coin * taille_y + j_coin]
+            if code == 0:
+                continue
+            if self.est_repete[code]:
+                self.coins_repetes.append((code, i_coin, j_coin))
+                continue
+            for case in range(nb_cases):
+                i, j = divmod(case, taille_y)
+                self.penalites_coins[code * nb_cases + case] += 3 * (abs(i - i_coin) + abs(j - j_coin))
+        
+        # Versions numpy des tables pour l'évaluation par lots: distances
+        # (code, case), positions finales avec -1 pour la case vide, et
+        # couples de cases (case1 avant case2) de chaque ligne puis colonne
+        self.distances_lot = np.array(self.distances, dtype=np.int64).reshape(nb_codes, nb_cases)
+        self.distances_euclidiennes_lot = np.array(self.distances_euclidiennes).reshape(nb_codes, nb_cases)
+        self.finales_lot = np.array(self.finales, dtype=np.int64)
+        self.lignes_finales_lot = np.array([-1 if code == 0 or self.est_repete[code] else ligne
+                                            for code, ligne in enumerate(self.lignes_finales)], dtype=np.int64)
+        self.colonnes_finales_lot = np.array([-1 if code == 0 or self.est_repete[code] else colonne
+                                              for code, colonne in enumerate(self.colonnes_finales)], dtype=np.int64)
+        self.distances_cases_lot = np.array(self.distances_cases, dtype=np.int64)
+        self.distances_cases_euclidiennes_lot = np.array(self.distances_cases_euclidiennes)
+        couples = []
+        for i in range(taille_x):
+            for j1 in range(taille_y):
+                for j2 in range(j1 + 1, taille_y):
+                    couples.append((0, i, i * taille_y + j1, i * taille_y + j2))
+        for j in range(taille_y):
+            for i1 in range(taille_x):
+                for i2 in range(i1 + 1, taille_x):
+                    couples.append((1, j, i1 * taille_y + j, i2 * taille_y + j))
+        self.couples_alignes = np.array(couples, dtype=np.int64).reshape(-1, 4)
+    
+    def conflits_alignement(self, codes, indice: int, axe: int) -> int:
+        """
+        Compte les conflits linéaires (x2) d'une ligne (axe 0) ou colonne (axe 1).
+        
+        Args:
+            codes: Codes des cases de l'alignement, dans l'ordre
+            indice: Numéro de la ligne ou de la colonne
+            axe: 0 pour une ligne, 1 pour une colonne
+        """
+        if axe == 0:
+            masque, positions = self.masques_lignes[indice], self.colonnes_finales
+        else:
+            masque, positions = self.masques_colonnes[indice], self.lignes_finales
+        ordre_final = [positions[code] for code in codes if masque >> code & 1]
+        
+        conflits = 0
+        for idx, position in enumerate(ordre_final):
+            for position_suivante in ordre_final[idx+1:]:
+                if position > position_suivante:
+                    conflits += 2
+        return conflits
+    
+    def cout_repetees(self, cases, euclidienne: bool = False) -> float:
+        """
+        Somme, sur les lettres répétées, du coût minimal d'affectation de
+        leurs cases courantes à leurs cases finales.
+        
+        Args:
+            cases: Codes des cases de l'état
+            euclidienne: Distances euclidiennes au lieu de Manhattan
+        """
+        courantes = {code: [] for code in self.codes_repetes}
+        for case, code in enumerate(cases):
+            if code in courantes:
+                courantes[code].append(case)
+        return sum(self.cout_lettre(code, positions, euclidienne) for code, positions in courantes.items())
+    
+    def cout_lettre(self, code: int, positions: List[int], euclidienne: bool = False) -> float:
+        """Coût minimal d'affectation des exemplaires d'une lettre placés sur `positions`"""
+        distances = self.distances_cases_euclidiennes if euclidienne else self.distances_cases
+        finales = self.cases_finales[code]
+        return affectation_minimale([[distances[case][finale] for finale in finales] for case in positions])
+    
+    def delta_repetee(self, cases, tuile: int, depart: int, arrivee: int, euclidienne: bool = False) -> float:
+        """
+        Variation du coût d'affectation d'une lettre répétée quand un de ses
+        exemplaires va de `depart` à `arrivee` (`cases`: état APRÈS le déplacement).
+        """
+        apres = [case for case, code in enumerate(cases) if code == tuile]
+        avant = [depart if case == arrivee else case for case in apres]
+        return self.cout_lettre(tuile, apres, euclidienne) - self.cout_lettre(tuile, avant, euclidienne)
+    
+    def _cout_repetees_lot(self, plateaux: np.ndarray, distances: np.ndarray) -> np.ndarray:
+        """Coûts d'affectation des lettres répétées d'un lot d'états"""
+        total = np.zeros(len(plateaux), dtype=distances.dtype)
+        for code in self.codes_repetes:
+            finales = np.array(self.cases_finales[code])
+            k = len(finales)
+            lignes, cases = np.nonzero(plateaux == code)
+            if len(cases) != k * len(plateaux):
+                # Nombre d'exemplaires différent de l'état final: calcul ligne par ligne
+                for n, plateau in enumerate(plateaux):
+                    positions = [int(case) for case in np.flatnonzero(plateau == code)]
+                    total[n] += self.cout_lettre(code, positions, distances.dtype.kind == 'f')
+                continue
+            couts = distances[cases.reshape(-1, k)[:, :, None], finales[None, None, :]]
+            if k <= 6:
+                # Peu d'exemplaires: toutes les permutations en une opération
+                meilleur = None
+                for permutation in itertools.permutations(range(k)):
+                    somme = couts[:, np.arange(k), list(permutation)].sum(axis=1)
+                    meilleur = somme if meilleur is None else np.minimum(meilleur, somme)
+                total += meilleur
+            else:
+                total += np.array([affectation_minimale(matrice.tolist()) for matrice in couts])
+        return total
+    
+    # ----- ÉVALUATION PAR LOTS -----
+    #
+    # Les méthodes *_lot prennent un tableau (N x cases) de codes, une ligne
+    # par état, et retournent les N valeurs de l'heuristique en un seul appel
+    # numpy (indexation avancée dans les tables précalculées).
+    
+    def manhattan_lot(self, plateaux: np.ndarray) -> np.ndarray:
+        """Distances de Manhattan d'un lot d'états"""
+        distances = self.distances_lot[plateaux, np.arange(self.nb_cases)].sum(axis=1)
+        if self.codes_repetes:
+            distances += self._cout_repetees_lot(plateaux, self.distances_cases_lot)
+        return distances
+    
+    def mal_places_lot(self, plateaux: np.ndarray) -> np.ndarray:
+        """Nombres de cases mal placées d'un lot d'états"""
+        return ((plateaux != self.finales_lot) & (plateaux != 0)).sum(axis=1)
+    
+    def euclidienne_lot(self, plateaux: np.ndarray) -> np.ndarray:
+        """Distances euclidiennes d'un lot d'états"""
+        distances = self.distances_euclidiennes_lot[plateaux, np.arange(self.nb_cases)].sum(axis=1)
+        if self.codes_repetes:
+            distances += self._cout_repetees_lot(plateaux, self.distances_cases_euclidiennes_lot)
+        return distances
+    
+    def lineaire_lot(self, plateaux: np.ndarray) -> np.ndarray:
+        """Manhattan plus conflits linéaires d'un lot d'états"""
+        axes, indices, cases1, cases2 = self.couples_alignes.T
+        codes1, codes2 = plateaux[:, cases1], plateaux[:, cases2]
+        # Alignement final (ligne pour l'axe 0, colonne pour l'axe 1) et
+        # position finale le long de cet alignement, pour chaque couple
+        lignes, colonnes = self.lignes_finales_lot, self.colonnes_finales_lot
+        aligne1 = np.where(axes == 0, lignes[codes1], colonnes[codes1])
+        aligne2 = np.where(axes == 0, lignes[codes2], colonnes[codes2])
+        rang1 = np.where(axes == 0, colonnes[codes1], lignes[codes1])
+        rang2 = np.where(axes == 0, colonnes[codes2], lignes[codes2])
+        conflits = (aligne1 == indices) & (aligne2 == indices) & (rang1 > rang2)
+        return self.manhattan_lot(plateaux) + 2 * conflits.sum(axis=1)
+    
+    def combinee_lot(self, plateaux: np.ndarray) -> np.ndarray:
+        """Heuristique combinée (Manhattan + 3 x mal placées + linéaire) d'un lot d'états"""
+        return self.manhattan_lot(plateaux) + 3 * self.mal_places_lot(plateaux) + self.lineaire_lot(plateaux)
+
+
+# ----- CACHE DISQUE DES TABLES -----
+#
+# Les tables précalculées (bases de motifs...) ne dépendent que de la grille
+# finale: elles sont enregistrées une fois dans un dossier de cache puis
+# projetées en mémoire (mmap), ce qui permet à plusieurs processus de partager
+# les mêmes pages. Un fichier contient:
+#   signature (8 octets) | longueur de l'en-tête (u32) | en-tête JSON
+#   | crc32 des données (u32) | longueur des données (u64) | alignement | données
+# Si l'en-tête ou la somme de contrôle ne correspond pas, la table est reconstruite.
+
+SIGNATURE_CACHE = b'TAQUINTB'
+
+
+def dossier_cache() -> str:
+    """Dossier du cache des tables (variable TAQUIN_CACHE_DIR, sinon ~/.cache/taquin)"""
+    return os.environ.get('TAQUIN_CACHE_DIR') or os.path.join(os.path.expanduser('~'), '.cache', 'taquin')
+
+
+def chemin_cache(prefixe: str, entete: Dict) -> str:
+    """Chemin du fichier de cache d'une table, dérivé de son en-tête"""
+    empreinte = hashlib.sha1(json.dumps(entete, sort_keys=True).encode('utf-8')).hexdigest()[:16]
+    return os.path.join(dossier_cache(), f"{prefixe}_{empreinte}.bin")
+
+
+def charger_table_cache(chemin: str, entete: Dict) -> Optional[memoryview]:
+    """
+    Projette en mémoire une table du cache.
+    
+    Args:
+        chemin: Fichier de cache
+        entete: En-tête attendu (taille, grille finale, partition...)
+        
+    Returns:
+        Les octets de la table (vue sur le mmap), ou None si le fichier est
+        absent, d'un autre en-tête ou corrompu
+    """
+    attendu = json.dumps(entete, sort_keys=True).encode('utf-8')
+    try:
+        with open(chemin, 'rb') as fichier:
+            projection = mmap.mmap(fichier.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):
+        return None
+    
+    taille_fixe = len(SIGNATURE_CACHE) + 4
+    if len(projection) < taille_fixe or projection[:len(SIGNATURE_CACHE)] != SIGNATURE_CACHE:
+        return None
+    longueur_entete, = struct.unpack_from('<I', projection, len(SIGNATURE_CACHE))
+    if projection[taille_fixe:taille_fixe + longueur_entete] != attendu:
+        return None
+    position = taille_fixe + longueur_entete
+    if len(projection) < position + 12:
+        return None
+    crc, longueur = struct.unpack_from('<IQ', projection, position)
+    debut = (position + 12 + 7) // 8 * 8
+    if len(projection) != debut + longueur:
+        return None
+    donnees = memoryview(projection)[debut:]
+    if zlib.crc32(donnees) != crc:
+        print(f"Cache corrompu, reconstruction de la table: {chemin}")
+        return None
+    return donnees
+
+
+def enregistrer_table_cache(chemin: str, entete: Dict, donnees: bytes) -> memoryview:
+    """
+    Écrit une table dans le cache (écriture atomique) puis la projette en mémoire.
+    
+    Args:
+        chemin: Fichier de cache
+        entete: En-tête de la table
+        donnees: Octets de la table
+        
+    Returns:
+        Les octets de la table, projetés depuis le fichier si l'écriture a réussi
+    """
+    meta = json.dumps(entete, sort_keys=True).encode('utf-8')
+    prefixe = SIGNATURE_CACHE + struct.pack('<I', len(meta)) + meta + struct.pack('<IQ', zlib.crc32(donnees), len(donnees))
+    prefixe += b'\0' * (-len(prefixe) % 8)
+    try:
+        os.makedirs(os.path.dirname(chemin), exist_ok=True)
+        # Un fichier temporaire renommé: un autre processus ne voit jamais de table partielle
+        descripteur, temporaire = tempfile.mkstemp(dir=os.path.dirname(chemin), suffix='.tmp')
+        try:
+            with os.fdopen(descripteur, 'wb') as fichier:
+                fichier.write(prefixe)
+                fichier.write(donnees)
+            os.chmod(temporaire, 0o644)
+            os.replace(temporaire, chemin)
+        except BaseException:
+            os.unlink(temporaire)
+            raise
+    except OSError as e:
+        print(f"Impossible d'écrire le cache {chemin}: {e}")
+        return memoryview(donnees)
+    return charger_table_cache(chemin, entete) or memoryview(donnees)
+
+
+class BaseMotifs:
+    """
+    Bases de motifs additives disjointes (« pattern databases »).
+    
+    Les tuiles sont réparties en groupes disjoints. Pour chaque groupe, une
+    table donne le nombre minimal de déplacements des tuiles du groupe pour
+    les amener à leur place finale, les autres cases étant considérées
+    libres (abstraction sans case vide). Un déplacement réel ne bouge
+    qu'une tuile, donc d'un seul groupe: la somme des tables est admissible
+    et cohérente, et au moins égale à la distance de Manhattan.
+    
+    Une table est indexée par le rang de l'arrangement des positions des
+    tuiles du groupe (k-permutation de n cases). Elle stocke, sur 4 bits,
+    l'écart entre la distance du groupe et la somme des distances de
+    Manhattan de ses tuiles (plafonné à 15, ce qui reste admissible). Les
+    exemplaires d'une lettre répétée sont interchangeables: ils restent
+    dans le même groupe et leurs positions sont triées avant le classement.
+    
+    Les tables sont enregistrées dans le cache disque (voir dossier_cache)
+    et projetées en mémoire: seule la première résolution d'une grille
+    finale donnée les construit.
+    """
+    # Nombre maximal d'entrées d'une table (8 Mo par table)
+    TAILLE_MAX_TABLE = 1 << 23
+    
+    # Valeur des entrées non encore atteintes pendant la construction
+    INCONNU = 255
+    
+    # Plus grand écart stocké (4 bits)
+    ECART_MAX = 15
+    
+    def __init__(self, etat_final: Etat, taille_max_table: Optional[int] = None):
+        """
+        Répartit les tuiles en groupes et charge ou construit leurs tables.
+        
+        Args:
+            etat_final: État but de l'instance
+            taille_max_table: Nombre maximal d'entrées par table
+                (par défaut TAILLE_MAX_TABLE)
+        """
+        codage = etat_final.codage
+        self.nb_cases = codage.nb_cases
+        self.taille_max_table = taille_max_table or self.TAILLE_MAX_TABLE
+        
+        # Tuiles dans l'ordre de l'état final (les exemplaires d'une même
+        # lettre sont regroupés sur des colonnes consécutives)
+        cases_finales = {}
+        for case, code in enumerate(etat_final.cases):
+            if code:
+                cases_finales.setdefault(code, []).append(case)
+        
+        # Plus grande taille de groupe dont la table tient dans le budget
+        taille_groupe = 1
+        while (taille_groupe < len(cases_finales)
+               and self._nb_arrangements(taille_groupe + 1) <= self.taille_max_table):
+            taille_groupe += 1
+        
+        # Groupes de codes consécutifs (dans l'ordre de l'état final)
+        self.groupes = []
+        for code, cases in cases_finales.items():
+            if self.groupes and len(self.groupes[-1]) + len(cases) <= taille_groupe:
+                self.groupes[-1].extend([code] * len(cases))
+            else:
+                self.groupes.append([code] * len(cases))
+        
+        # Colonne de chaque tuile dans le vecteur global des positions:
+        # premier[code] <= colonne < fin[code] (-1 pour un code hors motifs)
+        nb_codes = len(codage.caracteres)
+        self.premiers = [-1] * nb_codes
+        self.fins = [-1] * nb_codes
+        self.groupe_de = [-1] * nb_codes
+        self.debuts_groupes = []
+        colonne = 0
+        for numero, groupe in enumerate(self.groupes):
+            self.debuts_groupes.append(colonne)
+            for code in groupe:
+                if self.premiers[code] < 0:
+                    self.premiers[code] = colonne
+                    self.groupe_de[code] = numero
+                colonne += 1
+                self.fins[code] = colonne
+        self.nb_tuiles = colonne
+        
+        # Facteurs du rang d'une k-permutation: (n-1-i)! / (n-k)!
+        self.facteurs = []
+        for groupe in self.groupes:
+            k = len(groupe)
+            self.facteurs.append([factorial(self.nb_cases - 1 - i) // factorial(self.nb_cases - k)
+                                  for i in range(k)])
+        
+        # Distance de chaque case à la plus proche case finale de la lettre
+        # de chaque colonne: leur somme est la base dont les tables stockent l'écart
+        self.distances_min = []
+        for groupe in self.groupes:
+            self.distances_min.append([
+                [min(abs(case // codage.taille_y - finale // codage.taille_y)
+                     + abs(case % codage.taille_y - finale % codage.taille_y)
+                     for finale in cases_finales[code])
+                 for case in range(self.nb_cases)]
+                for code in groupe])
+        
+        # Tables de 4 bits: deux entrées par octet, à partir de decalages[numero]
+        self.tailles_tables = [self._nb_arrangements(len(groupe)) for groupe in self.groupes]
+        self.decalages = []
+        decalage = 0
+        for taille in self.tailles_tables:
+            self.decalages.append(decalage)
+            decalage += (taille + 1) // 2
+        
+        self.entete = {
+            'type': 'motifs',
+            'version': 1,
+            'taille': [codage.taille_x, codage.taille_y],
+            'but': ''.join(codage.caracteres[code] for code in etat_final.cases),
+            'partition': [''.join(codage.caracteres[code] for code in groupe) for groupe in self.groupes],
+        }
+        self.chemin = chemin_cache(f"motifs_{codage.taille_x}x{codage.taille_y}", self.entete)
+        self.octets = charger_table_cache(self.chemin, self.entete)
+        self.depuis_cache = self.octets is not None
+        if self.octets is None:
+            # Tables de travail de la construction: popcount sur 13 bits et
+            # marques pour garder un représentant par rang
+            self._popcount = np.array([bin(i).count('1') for i in range(1 << 13)], dtype=np.int64)
+            self._marques = np.zeros(max(self.tailles_tables), dtype=np.int64)
+            self._brouillon = np.arange(len(self._marques), dtype=np.int64)
+            tables = []
+            for numero in range(len(self.groupes)):
+                ecarts = self._construire_table(numero, cases_finales, codage)
+                if len(ecarts) % 2:
+                    ecarts = np.append(ecarts, np.uint8(0))
+                tables.append((ecarts[0::2] | (ecarts[1::2] << 4)).astype(np.uint8).tobytes())
+            del self._popcount, self._marques, self._brouillon
+            self.octets = enregistrer_table_cache(self.chemin, self.entete, b''.join(tables))
+    
+    def _nb_arrangements(self, k: int) -> int:
+        """Nombre de k-permutations des cases (taille d'une table de k tuiles)"""
+        return factorial(self.nb_cases) // factorial(self.nb_cases - k)
+    
+    @property
+    def description(self) -> str:
+        """Tailles des groupes, par exemple '6-6-3'"""
+        return '-'.join(str(len(groupe)) for groupe in self.groupes)
+    
+    def _sous_groupes(self, numero: int) -> List[Tuple[int, int]]:
+        """Colonnes [debut, fin) des lettres répétées d'un groupe"""
+        groupe = self.groupes[numero]
+        sous_groupes = []
+        debut = 0
+        for i in range(1, len(groupe) + 1):
+            if i == len(groupe) or groupe[i] != groupe[debut]:
+                if i - debut > 1:
+                    sous_groupes.append((debut, i))
+                debut = i
+        return sous_groupes
+    
+    def _rangs_lot(self, numero: int, positions: np.ndarray) -> np.ndarray:
+        """Rangs d'un lot d'arrangements (N x k positions distinctes)"""
+        rangs = np.zeros(len(positions), dtype=np.int64)
+        occupees = np.zeros(len(positions), dtype=np.int64)
+        for i, facteur in enumerate(self.facteurs[numero]):
+            colonne = positions[:, i]
+            rangs += (colonne - self._compter_inferieures(occupees, colonne)) * facteur
+            occupees |= 1 << colonne
+        return rangs
+    
+    def _compter_inferieures(self, occupees: np.ndarray, cases: np.ndarray) -> np.ndarray:
+        """Nombre de cases occupées inférieures à `cases` (popcount par table, 13 bits à la fois)"""
+        inferieures = occupees & ((1 << cases) - 1)
+        compte = self._popcount[inferieures & 0x1FFF]
+        for decalage in range(13, self.nb_cases, 13):
+            compte += self._popcount[(inferieures >> decalage) & 0x1FFF]
+        return compte
+    
+    def _construire_table(self, numero: int, cases_finales: Dict[int, List[int]], codage: CodageEtat) -> np.ndarray:
+        """
+        Construit la table d'un groupe par parcours en largeur rétrograde
+        depuis l'arrangement final, une couche entière à la fois (numpy).
+        
+        Returns:
+            np.ndarray: Écarts à la base de Manhattan, plafonnés à ECART_MAX
+        """
+        groupe = self.groupes[numero]
+        distances_min = np.array(self.distances_min[numero], dtype=np.int64)
+        k = len(groupe)
+        sous_groupes = self._sous_groupes(numero)
+        voisins = np.full((self.nb_cases, 4), -1, dtype=np.int64)
+        for case, mouvements in enumerate(table_deplacements(codage.taille_x, codage.taille_y)):
+            for cible, code_direction in mouvements:
+                voisins[case, code_direction] = cible
+        
+        initial = []
+        for code in dict.fromkeys(groupe):
+            initial.extend(cases_finales[code])
+        frontiere = np.array([initial], dtype=np.int64)
+        
+        table = np.full(self._nb_arrangements(k), self.INCONNU, dtype=np.uint8)
+        rangs_frontiere = self._rangs_lot(numero, frontiere)
+        table[rangs_frontiere] = 0
+        facteurs = self.facteurs[numero]
+        distance = 0
+        while len(frontiere):
+            distance += 1
+            suivants, rangs_suivants = [], []
+            occupees = np.bitwise_or.reduce(1 << frontiere, axis=1)
+            prefixe = np.zeros(len(frontiere), dtype=np.int64)
+            for t in range(k):
+                depart = frontiere[:, t]
+                if not sous_groupes:
+                    # Rang privé de la contribution de la tuile t: le rang
+                    # d'un voisin s'en déduit sans reclasser tout l'arrangement
+                    base = rangs_frontiere - (depart - self._compter_inferieures(prefixe, depart)) * facteurs[t]
+                    for j in range(t + 1, k):
+                        base = base + facteurs[j] * (depart < frontiere[:, j])
+                for direction in range(4):
+                    cibles = voisins[depart, direction]
+                    # Case voisine dans la grille et non occupée par le groupe
+                    libres = np.flatnonzero((cibles >= 0) & ((occupees >> (cibles & 63)) & 1 == 0))
+                    if len(libres) == 0:
+                        continue
+                    arrivees = cibles[libres]
+                    if sous_groupes:
+                        positions = frontiere[libres]
+                        positions[:, t] = arrivees
+                        for debut, fin in sous_groupes:
+                            positions[:, debut:fin].sort(axis=1)
+                        rangs = self._rangs_lot(numero, positions)
+                    else:
+                        rangs = base[libres] + (arrivees - self._compter_inferieures(prefixe[libres], arrivees)) * facteurs[t]
+                        for j in range(t + 1, k):
+                            rangs -= facteurs[j] * (arrivees < frontiere[libres, j])
+                    nouveaux = np.flatnonzero(table[rangs] == self.INCONNU)
+                    if len(nouveaux) == 0:
+                        continue
+                    # Un seul représentant par rang: le dernier écrit l'emporte
+                    rangs = rangs[nouveaux]
+                    representants = self._brouillon[:len(rangs)]
+                    self._marques[rangs] = representants
+                    gardes = self._marques[rangs] == representants
+                    if sous_groupes:
+                        positions = positions[nouveaux[gardes]]
+                    else:
+                        positions = frontiere[libres[nouveaux[gardes]]]
+                        positions[:, t] = arrivees[nouveaux[gardes]]
+                    # La table reçoit l'écart entre la distance et la base de Manhattan
+                    table[rangs[gardes]] = distance - distances_min[np.arange(k), positions].sum(axis=1)
+                    suivants.append(positions)
+                    rangs_suivants.append(rangs[gardes])
+                prefixe |= 1 << depart
+            if not suivants:
+                break
+            frontiere = np.concatenate(suivants)
+            rangs_frontiere = np.concatenate(rangs_suivants)
+        # Les arrangements jamais atteints (parité) reçoivent aussi le plafond
+        return np.minimum(table, self.ECART_MAX)
+    
+    def positions(self, cases) -> List[int]:
+        """
+        Positions des tuiles des motifs dans un état.
+        
+        Args:
+            cases: Codes des cases de l'état
+            
+        Returns:
+            Positions dans l'ordre des colonnes des groupes
+        """
+        prochaines = list(self.premiers)
+        fins = self.fins
+        positions = [0] * self.nb_tuiles
+        for case, code in enumerate(cases):
+            colonne = prochaines[code]
+            if 0 <= colonne < fins[code]:
+                positions[colonne] = case
+                prochaines[code] = colonne + 1
+        return positions
+    
+    def valeur_groupe(self, numero: int, positions: List[int]) -> int:
+        """
+        Valeur de la table d'un groupe pour un arrangement.
+        
+        Args:
+            numero: Numéro du groupe
+            positions: Positions des tuiles du groupe (triées par lettre répétée)
+        """
+        rang = 0
+        occupees = 0
+        base = 0
+        for position, facteur, distances in zip(positions, self.facteurs[numero], self.distances_min[numero]):
+            # Cases déjà prises par les tuiles précédentes et inférieures
+            rang += (position - (occupees & ((1 << position) - 1)).bit_count()) * facteur
+            occupees |= 1 << position
+            base += distances[position]
+        octet = self.octets[self.decalages[numero] + (rang >> 1)]
+        return base + ((octet >> ((rang & 1) << 2)) & 0xF)
+    
+    def evaluer(self, cases) -> int:
+        """
+        Somme des tables de tous les groupes pour un état.
+        
+        Args:
+            cases: Codes des cases de l'état
+        """
+        positions = self.positions(cases)
+        h = 0
+        for numero, debut in enumerate(self.debuts_groupes):
+            h += self.valeur_groupe(numero, positions[debut:debut + len(self.groupes[numero])])
+        return h
+    
+    def delta(self, cases, tuile: int, depart: int, arrivee: int) -> int:
+        """
+        Variation de la somme quand `tuile` va de `depart` à `arrivee`.
+        
+        Seule la table du groupe de la tuile change.
+        
+        Args:
+            cases: Codes des cases APRÈS le déplacement
+        """
+        numero = self.groupe_de[tuile]
+        if numero < 0:
+            return 0
+        groupe = self.groupes[numero]
+        debut = self.debuts_groupes[numero]
+        apres = self.positions(cases)[debut:debut + len(groupe)]
+        avant = list(apres)
+        premier, fin = self.premiers[tuile] - debut, self.fins[tuile] - debut
+        avant[avant.index(arrivee, premier, fin)] = depart
+        if fin - premier > 1:
+            avant[premier:fin] = sorted(avant[premier:fin])
+        return self.valeur_groupe(numero, apres) - self.valeur_groupe(numero, avant)
+
+
+class TableMarche:
+    """
+    Table de la distance de marche (« walking distance ») selon un axe.
+    
+    Pour l'axe des lignes, un état abstrait retient seulement, pour chaque
+    ligne i de la grille, combien de ses tuiles ont pour ligne finale r
+    (une matrice de comptes), et la ligne de la case vide. Un déplacement
+    vertical fait passer une tuile d'une ligne voisine dans celle de la case
+    vide. La table donne, pour chaque état abstrait, le nombre minimal de
+    déplacements verticaux pour atteindre l'état final; l'axe des colonnes
+    est identique sur la grille transposée. La somme des deux valeurs est
+    admissible (un déplacement est soit vertical, soit horizontal) et
+    domine la distance de Manhattan.
+    
+    Un état abstrait est codé par un entier: la ligne de la case vide puis
+    les comptes (la dernière colonne de la matrice se déduit des sommes des
+    lignes). Les états sont numérotés dans l'ordre de leurs codes; la table
+    de transitions donne le numéro de l'état suivant pour chaque déplacement,
+    ce qui permet de suivre le numéro de façon incrémentale pendant la recherche.
+    """
+    # Au-delà de 4 lignes, la table dépasse la dizaine de millions d'états
+    # (65 millions pour une grille 5x5)
+    NB_LIGNES_MAX = 4
+    
+    def __init__(self, nb_lignes: int, largeur: int, ligne_vide: int):
+        """
+        Charge la table depuis le cache disque ou la construit.
+        
+        Args:
+            nb_lignes: Nombre de lignes selon l'axe (au plus NB_LIGNES_MAX)
+            largeur: Nombre de cases par ligne
+            ligne_vide: Ligne de la case vide dans l'état final
+        """
+        self.nb_lignes = nb_lignes
+        self.largeur = largeur
+        self.ligne_vide = ligne_vide
+        self.bits = largeur.bit_length()
+        self.masque = (1 << self.bits) - 1
+        nb_champs = nb_lignes * (nb_lignes - 1)
+        self.decalage_vide = self.bits * nb_champs
+        # decalages[i][r]: position du compte (ligne i, ligne finale r < n-1)
+        self.decalages = [[self.bits * (nb_champs - 1 - (i * (nb_lignes - 1) + r)) for r in range(nb_lignes - 1)]
+                          for i in range(nb_lignes)]
+        
+        self.entete = {
+            'type': 'marche',
+            'version': 1,
+            'lignes': nb_lignes,
+            'largeur': largeur,
+            'vide': ligne_vide,
+            'ordre': sys.byteorder,
+        }
+        self.chemin = chemin_cache(f"marche_{nb_lignes}x{largeur}", self.entete)
+        octets = charger_table_cache(self.chemin, self.entete)
+        self.depuis_cache = octets is not None
+        if octets is None:
+            cles, distances = self._construire()
+            transitions = self._calculer_transitions(cles)
+            octets = enregistrer_table_cache(self.chemin, self.entete,
+                                             cles.tobytes() + transitions.tobytes() + distances.tobytes())
+        
+        # Clés (8 octets), transitions (2 x n x 4 octets) puis distances (1 octet) par état
+        nb_etats = len(octets) // (9 + 8 * nb_lignes)
+        self.cles = np.frombuffer(octets, dtype=np.int64, count=nb_etats)
+        self.transitions = octets[8 * nb_etats:8 * nb_etats * (1 + nb_lignes)].cast('i')
+        self.distances = octets[8 * nb_etats * (1 + nb_lignes):]
+    
+    def cle(self, comptes: List[List[int]], ligne_vide: int) -> int:
+        """Code d'un état abstrait (comptes[i][r]: tuiles de la ligne i dont la ligne finale est r)"""
+        cle = ligne_vide
+        for ligne in comptes:
+            for compte in ligne[:-1]:
+                cle = (cle << self.bits) | compte
+        return cle
+    
+    def indice(self, comptes: List[List[int]], ligne_vide: int) -> int:
+        """Numéro d'un état abstrait dans la table (-1 s'il n'en fait pas partie)"""
+        cle = self.cle(comptes, ligne_vide)
+        indice = int(np.searchsorted(self.cles, cle))
+        if indice < len(self.cles) and self.cles[indice] == cle:
+            return indice
+        return -1
+    
+    def transition(self, indice: int, sens: int, ligne_finale: int) -> int:
+        """
+        Numéro de l'état atteint quand la case vide change de ligne.
+        
+        Args:
+            indice: Numéro de l'état courant
+            sens: 0 si la case vide monte d'une ligne, 1 si elle descend
+            ligne_finale: Ligne finale de la tuile qui prend la place de la case vide
+        """
+        return self.transitions[(indice * 2 + sens) * self.nb_lignes + ligne_finale]
+    
+    def _voisins(self, cles: np.ndarray) -> List[np.ndarray]:
+        """
+        Codes des voisins d'un lot d'états, pour chaque (sens, ligne finale)
+        dans l'ordre des transitions (-1 quand le déplacement est impossible).
+        """
+        n = self.nb_lignes
+        decalages = np.array(self.decalages, dtype=np.int64)
+        vides = cles >> self.decalage_vide
+        champs = cles & ((1 << self.decalage_vide) - 1)
+        voisins = []
+        for pas in (-1, 1):
+            lignes = vides + pas
+            dans_grille = (lignes >= 0) & (lignes < n)
+            lignes = np.clip(lignes, 0, n - 1)
+            somme = np.zeros(len(cles), dtype=np.int64)
+            for r in range(n):
+                if r < n - 1:
+                    compte = (cles >> decalages[lignes, r]) & self.masque
+                    somme += compte
+                    suivants = champs - (1 << decalages[lignes, r]) + (1 << decalages[vides, r])
+                else:
+                    # La ligne voisine est pleine: son dernier compte se déduit des autres
+                    compte = self.largeur - somme
+                    suivants = champs
+                suivants = suivants | (lignes << self.decalage_vide)
+                voisins.append(np.where(dans_grille & (compte > 0), suivants, -1))
+        return voisins
+    
+    def _construire(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Parcours en largeur depuis l'état final, une couche à la fois"""
+        n = self.nb_lignes
+        comptes = [[(self.largeur - (r == self.ligne_vide)) * (i == r) for r in range(n)] for i in range(n)]
+        precedente = np.zeros(0, dtype=np.int64)
+        courante = np.array([self.cle(comptes, self.ligne_vide)], dtype=np.int64)
+        couches = []
+        # Les déplacements sont réversibles: les voisins d'une couche sont
+        # dans la couche précédente, la couche courante ou la suivante
+        while len(courante):
+            couches.append(courante)
+            candidats = np.unique(np.concatenate(self._voisins(courante)))
+            candidats = candidats[candidats >= 0]
+            candidats = np.setdiff1d(candidats, precedente, assume_unique=True)
+            candidats = np.setdiff1d(candidats, courante, assume_unique=True)
+            precedente, courante = courante, candidats
+        
+        cles = np.concatenate(couches)
+        distances = np.concatenate([np.full(len(couche), d, dtype=np.uint8) for d, couche in enumerate(couches)])
+        ordre = np.argsort(cles)
+        return cles[ordre], distances[ordre]
+    
+    def _calculer_transitions(self, cles: np.ndarray) -> np.ndarray:
+        """Table (états x 2 x n) des numéros des voisins (-1 si impossible)"""
+        voisins = np.stack(self._voisins(cles), axis=1)
+        transitions = np.searchsorted(cles, voisins).astype(np.int32)
+        transitions[voisins < 0] = -1
+        return transitions
 
 
 class Taquin:
     """
     Classe principale du jeu de Taquin pour des caractères.
     """
+    # Heuristiques disponibles: nom -> méthode de calcul complet
+    HEURISTIQUES = {
+        'manhattan': 'calculer_distance_manhattan',
+        'mal_places': 'calculer_cases_mal_placees',
+        'euclidienne': 'calculer_distance_euclidienne',
+        'nilsson': 'calculer_heuristique_nilsson',
+        'lineaire': 'calculer_heuristique_lineaire',
+        'combinee': 'calculer_heuristique_combinee',
+        'pattern': 'calculer_heuristique_pattern_database',
+        'pdb': 'calculer_heuristique_pdb',
+        'marche': 'calculer_heuristique_marche',
+    }
+    
+    # Heuristiques calculables à partir de la valeur du parent: nom -> méthode delta
+    HEURISTIQUES_INCREMENTALES = {
+        'manhattan': 'calculer_delta_manhattan',
+        'mal_places': 'calculer_delta_mal_placees',
+        'euclidienne': 'calculer_delta_euclidienne',
+        'lineaire': 'calculer_delta_lineaire',
+        'combinee': 'calculer_delta_combinee',
+        'pdb': 'calculer_delta_pdb',
+    }
+    
+    # Heuristiques à valeurs entières positives (file de priorité à seaux possible)
+    HEURISTIQUES_ENTIERES = {'manhattan', 'mal_places', 'nilsson', 'lineaire', 'combinee', 'pattern', 'pdb', 'marche'}
+    
+    # Heuristiques évaluables par lots: nom -> méthode de IndexBut
+    HEURISTIQUES_LOT = {
+        'manhattan': 'manhattan_lot',
+        'mal_places': 'mal_places_lot',
+        'euclidienne': 'euclidienne_lot',
+        'lineaire': 'lineaire_lot',
+        'combinee': 'combinee_lot',
+    }
+    
     def __init__(self, taille_x: int = 3, taille_y: int = 3):
         """
         Initialise un jeu de Taquin avec des caractères.
@@ -63,6 +1233,59 @@ class Taquin:
         self.etat_final = None
         self.etat_courant = None
         self.caractere_vide = ' '  # Espace vide
+        self.taille_max_motifs = None  # Entrées par table de motifs (None: BaseMotifs.TAILLE_MAX_TABLE)
+        self.resolubilite = None  # Diagnostic du dernier appel à est_resoluble
+        self.statistiques = {}  # Compteurs de la dernière résolution (selon l'algorithme)
+    
+    @property
+    def etat_final(self) -> Optional[Etat]:
+        """État but de l'instance"""
+        return self._etat_final
+    
+    @etat_final.setter
+    def etat_final(self, etat: Optional[Etat]):
+        # Changer d'état final invalide les tables précalculées
+        self._etat_final = etat
+        self._index_but = None
+        self._base_motifs = None
+        self._tables_marche = None
+    
+    @property
+    def index_but(self) -> IndexBut:
+        """Tables précalculées de l'état final, construites au premier usage"""
+        if self._index_but is None:
+            self._index_but = IndexBut(self.etat_final)
+        return self._index_but
+    
+    @property
+    def tables_marche(self) -> Optional[Tuple[TableMarche, TableMarche]]:
+        """
+        Tables de distance de marche (lignes, colonnes) de l'état final.
+        
+        None si la grille a plus de TableMarche.NB_LIGNES_MAX lignes ou
+        colonnes, ou si l'état final contient une lettre répétée: les tables
+        supposent une seule ligne et une seule colonne finales par lettre, ce
+        que deux exemplaires sur des cases distinctes ne peuvent pas avoir.
+        """
+        if self._tables_marche is None:
+            self._tables_marche = False
+            index = self.index_but
+            if max(self.taille_x, self.taille_y) <= TableMarche.NB_LIGNES_MAX and not index.codes_repetes:
+                ligne_vide, colonne_vide = divmod(self.etat_final.vide, self.taille_y)
+                self._tables_marche = (TableMarche(self.taille_x, self.taille_y, ligne_vide),
+                                       TableMarche(self.taille_y, self.taille_x, colonne_vide))
+        return self._tables_marche or None
+    
+    @property
+    def base_motifs(self) -> BaseMotifs:
+        """Bases de motifs additives de l'état final, construites au premier usage"""
+        if self._base_motifs is None:
+            debut = time.time()
+            self._base_motifs = BaseMotifs(self.etat_final, self.taille_max_motifs)
+            origine = "chargées depuis le cache" if self._base_motifs.depuis_cache else "construites"
+            print(f"Bases de motifs {self._base_motifs.description} {origine} "
+                  f"en {time.time() - debut:.2f} secondes.")
+        return self._base_motifs
         
     def charger_depuis_fichier(self, chemin_fichier: str) -> bool:
         """
@@ -198,12 +1421,35 @@ class Taquin:
                 print("Configuration finale non fournie, utilisation d'une configuration arbitraire.")
                 return False
             
+            self._harmoniser_codage()
             return True
             
         except Exception as e:
             print(f"Erreur lors du chargement du fichier: {e}")
             return False
     
+    def _harmoniser_codage(self):
+        """
+        Réencode les états initial et final avec un codage commun.
+        
+        Les deux grilles sont normalement écrites sur le même alphabet et
+        partagent déjà le même codage; sinon on les réencode sur l'union
+        de leurs caractères pour qu'elles restent comparables.
+        """
+        if self.etat_initial.codage is self.etat_final.codage:
+            return
+        caracteres = set(self.etat_initial.codage.caracteres) | set(self.etat_final.codage.caracteres)
+        codage = CodageEtat.pour(self.taille_x, self.taille_y, caracteres, self.caractere_vide)
+        self.etat_initial = Etat(self.etat_initial.grille, self.etat_initial.pos_vide, codage)
+        self.etat_final = Etat(self.etat_final.grille, self.etat_final.pos_vide, codage)
+        self.etat_courant = self.etat_initial.copier()
+    
+    @property
+    def codage(self) -> Optional[CodageEtat]:
+        """Codage de l'alphabet de l'instance chargée"""
+        etat = self.etat_final if self.etat_final is not None else self.etat_initial
+        return etat.codage if etat is not None else None
+    
     def charger_depuis_chaine(self, contenu: str) -> bool:
         """
         Charge une grille de Taquin depuis une chaîne de caractères.
@@ -250,10 +1496,11 @@ class Taquin:
         print(f"Grille {self.taille_x}x{self.taille_y}:")
         print('-' * (self.taille_y * 4 + 1))
         
+        grille = etat.grille
         for i in range(self.taille_x):
             ligne = '|'
             for j in range(self.taille_y):
-                caractere = etat.grille[i, j]
+                caractere = grille[i, j]
                 if caractere == self.caractere_vide:
                     ligne += '   |'  # Case vide
                 else:
@@ -271,6 +1518,21 @@ class Taquin:
         if self.etat_courant is None or self.etat_final is None:
             return False
         return self.etat_courant == self.etat_final
+    
+    def inverser(self) -> 'Taquin':
+        """
+        Retourne le problème inverse: de l'état final vers l'état initial.
+        
+        Ses heuristiques estiment la distance d'un état à l'état initial,
+        ce dont ont besoin les recherches bidirectionnelles informées.
+        """
+        inverse = Taquin(self.taille_x, self.taille_y)
+        inverse.caractere_vide = self.caractere_vide
+        inverse.taille_max_motifs = self.taille_max_motifs
+        inverse.etat_initial = self.etat_final
+        inverse.etat_final = self.etat_initial
+        inverse.etat_courant = self.etat_final.copier() if self.etat_final is not None else None
+        return inverse
         
     def deplacer(self, etat: Etat, direction: str) -> Optional[Etat]:
         """
@@ -283,38 +1545,35 @@ class Taquin:
         Returns:
             Etat: Nouvel état après déplacement, None si le déplacement est impossible
         """
-        i, j = etat.pos_vide
-        nouvel_etat = None
+        code = CODES_DIRECTIONS.get(direction)
+        for cible, code_possible in table_deplacements(self.taille_x, self.taille_y)[etat.vide]:
+            if code_possible == code:
+                return self._glisser(etat, cible)
+        return None
+    
+    def _glisser(self, etat: Etat, cible: int) -> Etat:
+        """
+        Fait glisser la tuile de la case `cible` (voisine de la case vide) dans la case vide.
         
-        if direction == 'haut' and i > 0:
-            # Déplacer la case du haut vers le bas
-            nouvel_etat = etat.copier()
-            nouvel_etat.grille[i, j] = nouvel_etat.grille[i-1, j]
-            nouvel_etat.grille[i-1, j] = self.caractere_vide
-            nouvel_etat.pos_vide = (i-1, j)
-            
-        elif direction == 'bas' and i < self.taille_x - 1:
-            # Déplacer la case du bas vers le haut
-            nouvel_etat = etat.copier()
-            nouvel_etat.grille[i, j] = nouvel_etat.grille[i+1, j]
-            nouvel_etat.grille[i+1, j] = self.caractere_vide
-            nouvel_etat.pos_vide = (i+1, j)
-            
-        elif direction == 'gauche' and j > 0:
-            # Déplacer la case de gauche vers la droite
-            nouvel_etat = etat.copier()
-            nouvel_etat.grille[i, j] = nouvel_etat.grille[i, j-1]
-            nouvel_etat.grille[i, j-1] = self.caractere_vide
-            nouvel_etat.pos_vide = (i, j-1)
-            
-        elif direction == 'droite' and j < self.taille_y - 1:
-            # Déplacer la case de droite vers la gauche
-            nouvel_etat = etat.copier()
-            nouvel_etat.grille[i, j] = nouvel_etat.grille[i, j+1]
-            nouvel_etat.grille[i, j+1] = self.caractere_vide
-            nouvel_etat.pos_vide = (i, j+1)
+        Args:
+            etat: État actuel
+            cible: Indice linéaire de la tuile à déplacer
             
-        return nouvel_etat
+        Returns:
+            Etat: Nouvel état, dont la case vide est en `cible`
+        """
+        # Échanger la tuile de la case cible avec la case vide (code 0)
+        # directement dans l'entier compact, sans copier de grille
+        codage = etat.codage
+        decalage_cible = codage.decalages[cible]
+        tuile = (etat.cle >> decalage_cible) & codage.masque
+        cle = etat.cle ^ (tuile << decalage_cible) ^ (tuile << codage.decalages[etat.vide])
+        
+        # Mise à jour incrémentale du hachage de Zobrist: la tuile quitte la
+        # case cible pour la case vide (la case vide a une valeur nulle)
+        base = tuile * codage.nb_cases
+        hachage = hash(etat) ^ codage.zobrist[base + cible] ^ codage.zobrist[base + etat.vide]
+        return Etat.depuis_cle(codage, cle, cible, hachage)
     
     def obtenir_etats_voisins(self, etat: Etat) -> List[Etat]:
         """
@@ -326,31 +1585,121 @@ class Taquin:
         Returns:
             List[Etat]: Liste des états voisins possibles
         """
-        directions = ['haut', 'bas', 'gauche', 'droite']
-        etats_voisins = []
+        return [self._glisser(etat, cible)
+                for cible, _ in table_deplacements(self.taille_x, self.taille_y)[etat.vide]]
+    
+    def obtenir_successeurs(self, etat: Etat, action_precedente: Optional[str] = None) -> List[Tuple[str, Etat]]:
+        """
+        Obtient les états successeurs avec la direction qui y mène.
         
-        for direction in directions:
-            nouvel_etat = self.deplacer(etat, direction)
-            if nouvel_etat is not None:
-                etats_voisins.append(nouvel_etat)
-                
-        return etats_voisins
+        Le mouvement inverse de celui qui a mené à `etat` n'est pas généré:
+        il ramènerait simplement au nœud parent.
+        
+        Args:
+            etat: État actuel
+            action_precedente: Direction qui a mené à cet état (None à la racine)
+            
+        Returns:
+            List[Tuple[str, Etat]]: Liste de couples (direction, état voisin)
+        """
+        interdit = CODES_DIRECTIONS[action_precedente] ^ 1 if action_precedente is not None else -1
+        return [(DIRECTIONS[code], self._glisser(etat, cible))
+                for cible, code in table_deplacements(self.taille_x, self.taille_y)[etat.vide]
+                if code != interdit]
     
     def est_resoluble(self) -> bool:
         """
         Vérifie si la configuration actuelle du jeu est résoluble.
-        Pour un jeu de taquin avec des caractères, on suppose que
-        toutes les configurations sont résolubles pour simplifier.
+        Le diagnostic détaillé (voir analyser_resolubilite) est conservé
+        dans l'attribut `resolubilite`.
         
         Returns:
             bool: True si la configuration est résoluble, False sinon
         """
         if self.etat_courant is None or self.etat_final is None:
+            self.resolubilite = {'resoluble': False, 'raison': "état courant ou état final manquant",
+                                 'classe': None, 'parite_permutation': None,
+                                 'distance_vide': None, 'lettres_repetees': None}
             return False
         
-        # Pour un jeu de taquin alpha, on simplifie en supposant que
-        # toutes les configurations sont résolubles
-        return True
+        self.resolubilite = self.analyser_resolubilite(self.etat_courant)
+        return self.resolubilite['resoluble']
+    
+    def analyser_resolubilite(self, etat: Etat) -> Dict[str, Any]:
+        """
+        Détermine si l'état final est atteignable depuis `etat`.
+        
+        Sur une grille d'au moins 2 lignes et 2 colonnes, chaque déplacement
+        est une transposition de la case vide avec une voisine et change de 1
+        la distance de Manhattan de la case vide à sa position finale: la
+        parité de la permutation qui mène de l'état à l'état final doit donc
+        égaler celle de cette distance, et cette condition suffit. Quand une
+        lettre est répétée, échanger deux de ses exemplaires change la parité
+        de la permutation sans changer l'état: une affectation de parité paire
+        existe toujours. Sur une seule ligne (ou colonne), les lettres ne
+        peuvent pas se croiser: leur ordre doit être celui de l'état final.
+        
+        Args:
+            etat: État de départ
+            
+        Returns:
+            Dict: 'resoluble', 'raison', 'classe' ('paire', 'impaire' ou None),
+            'parite_permutation', 'distance_vide' et 'lettres_repetees'
+        """
+        final = self.etat_final
+        cases, finales = etat.cases, final.cases
+        taille_x, taille_y = etat.codage.taille_x, etat.codage.taille_y
+        i_vide, j_vide = etat.pos_vide
+        i_final, j_final = final.pos_vide
+        diagnostic = {
+            'resoluble': False,
+            'raison': '',
+            'classe': None,
+            'parite_permutation': None,
+            'distance_vide': abs(i_vide - i_final) + abs(j_vide - j_final),
+            'lettres_repetees': len(set(finales)) < len(finales),
+        }
+        
+        if sorted(cases) != sorted(finales):
+            diagnostic['raison'] = "les caractères diffèrent de ceux de l'état final"
+            return diagnostic
+        
+        if taille_x == 1 or taille_y == 1:
+            # Les lettres glissent sans jamais se croiser
+            diagnostic['resoluble'] = [code for code in cases if code] == [code for code in finales if code]
+            diagnostic['raison'] = ("ordre des caractères conservé" if diagnostic['resoluble']
+                                    else "les caractères ne peuvent pas se croiser sur une seule ligne")
+            return diagnostic
+        
+        if diagnostic['lettres_repetees']:
+            diagnostic['resoluble'] = True
+            diagnostic['classe'] = 'paire'
+            diagnostic['raison'] = "lettres répétées: une affectation de parité paire existe"
+            return diagnostic
+        
+        # Permutation case de l'état -> case finale du même caractère (vide compris)
+        case_finale = {code: case for case, code in enumerate(finales)}
+        permutation = [case_finale[code] for code in cases]
+        
+        # Parité = (nombre de cases - nombre de cycles) mod 2
+        vues = [False] * len(permutation)
+        nb_cycles = 0
+        for depart in range(len(permutation)):
+            if not vues[depart]:
+                nb_cycles += 1
+                case = depart
+                while not vues[case]:
+                    vues[case] = True
+                    case = permutation[case]
+        parite = (len(permutation) - nb_cycles) % 2
+        
+        diagnostic['parite_permutation'] = parite
+        diagnostic['classe'] = 'paire' if (parite + diagnostic['distance_vide']) % 2 == 0 else 'impaire'
+        diagnostic['resoluble'] = diagnostic['classe'] == 'paire'
+        diagnostic['raison'] = ("parité de la permutation égale à celle de la distance de la case vide"
+                                if diagnostic['resoluble'] else
+                                "parité de la permutation différente de celle de la distance de la case vide")
+        return diagnostic
         
     # ----- HEURISTIQUES -----
     
@@ -368,26 +1717,19 @@ class Taquin:
         """
         if self.etat_final is None:
             return 0
-            
-        distance = 0
-        # Créer un dictionnaire pour accélérer la recherche des positions finales
-        positions_finales = {}
+        index = self.index_but
+        distances = index.distances
+        nb_cases = index.nb_cases
         
-        # Mémoriser les positions de chaque caractère dans l'état final
-        for i in range(self.taille_x):
-            for j in range(self.taille_y):
-                caractere = self.etat_final.grille[i, j]
-                positions_finales[caractere] = (i, j)
+        # La table vaut 0 pour la case vide et les caractères absents du but
+        cases = etat.cases
+        distance = 0
+        for case, code in enumerate(cases):
+            distance += distances[code * nb_cases + case]
         
-        # Calculer la distance de Manhattan pour chaque caractère
-        for i in range(self.taille_x):
-            for j in range(self.taille_y):
-                caractere = etat.grille[i, j]
-                if caractere != self.caractere_vide:  # Ignorer la case vide
-                    if caractere in positions_finales:
-                        pos_finale = positions_finales[caractere]
-                        # Calculer la distance horizontale + verticale
-                        distance += abs(i - pos_finale[0]) + abs(j - pos_finale[1])
+        # Lettres répétées: meilleure affectation des exemplaires aux cases finales
+        if index.codes_repetes:
+            distance += index.cout_repetees(cases)
         
         return distance
     
@@ -403,14 +1745,13 @@ class Taquin:
         """
         if self.etat_final is None:
             return 0
+        finales = self.index_but.finales
             
         nb_mal_places = 0
         
-        for i in range(self.taille_x):
-            for j in range(self.taille_y):
-                if etat.grille[i, j] != self.caractere_vide:  # Ignorer la case vide
-                    if etat.grille[i, j] != self.etat_final.grille[i, j]:
-                        nb_mal_places += 1
+        for case, code in enumerate(etat.cases):
+            if code and code != finales[case]:  # Ignorer la case vide
+                nb_mal_places += 1
         
         return nb_mal_places
     
@@ -426,26 +1767,18 @@ class Taquin:
         """
         if self.etat_final is None:
             return 0
+        index = self.index_but
+        distances = index.distances_euclidiennes
+        nb_cases = index.nb_cases
             
+        # Distances √((x2-x1)² + (y2-y1)²) précalculées pour chaque caractère
+        cases = etat.cases
         distance = 0.0
-        # Créer un dictionnaire pour accélérer la recherche
-        positions_finales = {}
+        for case, code in enumerate(cases):
+            distance += distances[code * nb_cases + case]
         
-        # Mémoriser les positions de chaque caractère dans l'état final
-        for i in range(self.taille_x):
-            for j in range(self.taille_y):
-                caractere = self.etat_final.grille[i, j]
-                positions_finales[caractere] = (i, j)
-        
-        # Calculer la distance euclidienne pour chaque caractère
-        for i in range(self.taille_x):
-            for j in range(self.taille_y):
-                caractere = etat.grille[i, j]
-                if caractere != self.caractere_vide:  # Ignorer la case vide
-                    if caractere in positions_finales:
-                        pos_finale = positions_finales[caractere]
-                        # Calculer la distance euclidienne (√((x2-x1)² + (y2-y1)²))
-                        distance += ((i - pos_finale[0])**2 + (j - pos_finale[1])**2)**0.5
+        if index.codes_repetes:
+            distance += index.cout_repetees(cases, euclidienne=True)
         
         return distance
     
@@ -462,6 +1795,10 @@ class Taquin:
         """
         if self.etat_final is None:
             return 0
+        index = self.index_but
+        lignes, colonnes = index.lignes_finales, index.colonnes_finales
+        cases = etat.cases
+        taille_y = self.taille_y
             
         # Calculer la distance de Manhattan de base
         manhattan = self.calculer_distance_manhattan(etat)
@@ -469,46 +1806,24 @@ class Taquin:
         # Ajouter une pénalité pour les séquences incorrectes
         penalite = 0
         
-        # Créer un dictionnaire pour les positions finales
-        positions_finales = {}
-        for i in range(self.taille_x):
-            for j in range(self.taille_y):
-                caractere = self.etat_final.grille[i, j]
-                positions_finales[caractere] = (i, j)
-        
         # Vérifier les séquences horizontales et verticales
-        for i in range(self.taille_x):
-            for j in range(self.taille_y):
-                caractere = etat.grille[i, j]
-                if caractere != self.caractere_vide:
-                    # Vérifier les voisins horizontaux et verticaux
-                    # Horizontal: vérifier si le caractère à droite est le successeur dans l'état final
-                    if j < self.taille_y - 1:
-                        voisin_droit = etat.grille[i, j+1]
-                        if voisin_droit != self.caractere_vide:
-                            # On vérifie s'ils sont adjacents dans l'état final
-                            pos_finale_courant = positions_finales.get(caractere, (-1, -1))
-                            pos_finale_voisin = positions_finales.get(voisin_droit, (-1, -1))
-                            
-                            if (pos_finale_courant[0] == pos_finale_voisin[0] and 
-                                abs(pos_finale_courant[1] - pos_finale_voisin[1]) == 1):
-                                # Si adjacents dans l'état final mais pas dans le même ordre
-                                if pos_finale_courant[1] + 1 != pos_finale_voisin[1]:
-                                    penalite += 2
-                    
-                    # Vertical: vérifier si le caractère en dessous est le successeur dans l'état final
-                    if i < self.taille_x - 1:
-                        voisin_bas = etat.grille[i+1, j]
-                        if voisin_bas != self.caractere_vide:
-                            # On vérifie s'ils sont adjacents dans l'état final
-                            pos_finale_courant = positions_finales.get(caractere, (-1, -1))
-                            pos_finale_voisin = positions_finales.get(voisin_bas, (-1, -1))
-                            
-                            if (pos_finale_courant[1] == pos_finale_voisin[1] and 
-                                abs(pos_finale_courant[0] - pos_finale_voisin[0]) == 1):
-                                # Si adjacents dans l'état final mais pas dans le même ordre
-                                if pos_finale_courant[0] + 1 != pos_finale_voisin[0]:
-                                    penalite += 2
+        for case, code in enumerate(cases):
+            if code:
+                i, j = divmod(case, taille_y)
+                # Horizontal: vérifier si le caractère à droite est le successeur dans l'état final
+                if j < taille_y - 1:
+                    voisin_droit = cases[case + 1]
+                    # Si adjacents dans l'état final mais pas dans le même ordre
+                    if (voisin_droit and lignes[code] == lignes[voisin_droit]
+                            and colonnes[code] - 1 == colonnes[voisin_droit]):
+                        penalite += 2
+                
+                # Vertical: vérifier si le caractère en dessous est le successeur dans l'état final
+                if i < self.taille_x - 1:
+                    voisin_bas = cases[case + taille_y]
+                    if (voisin_bas and colonnes[code] == colonnes[voisin_bas]
+                            and lignes[code] - 1 == lignes[voisin_bas]):
+                        penalite += 2
         
         return manhattan + 3 * penalite
     
@@ -529,63 +1844,21 @@ class Taquin:
         """
         if self.etat_final is None:
             return 0
+        index = self.index_but
+        cases = etat.cases
+        taille_y = self.taille_y
             
         # Commencer par calculer la distance de Manhattan simple
         manhattan = self.calculer_distance_manhattan(etat)
         
-        # Ajouter la pénalité pour les conflits linéaires
+        # Ajouter la pénalité pour les conflits linéaires: deux caractères déjà
+        # dans leur ligne (colonne) finale mais dans le désordre. Les masques
+        # de l'index sélectionnent les caractères dont c'est la ligne finale.
         conflits = 0
-        
-        # Dictionnaire pour accélérer la recherche des positions finales
-        # Exemple: {'A': (0, 0), 'B': (0, 1), ...}
-        positions_finales = {}
-        for i in range(self.taille_x):
-            for j in range(self.taille_y):
-                caractere = self.etat_final.grille[i, j]
-                positions_finales[caractere] = (i, j)
-        
-        # Vérifier les conflits sur les lignes
         for i in range(self.taille_x):
-            # Collecter les caractères de cette ligne qui sont déjà dans leur ligne finale
-            dans_ligne_finale = []
-            for j in range(self.taille_y):
-                caractere = etat.grille[i, j]
-                if caractere != self.caractere_vide:
-                    pos_finale = positions_finales.get(caractere, (-1, -1))
-                    if pos_finale[0] == i:  # Si le caractère est dans sa ligne finale
-                        dans_ligne_finale.append((j, caractere))
-            
-            # Vérifier les conflits parmi ces caractères
-            # Un conflit se produit quand deux caractères sont dans le bon ordre dans l'état final
-            # mais dans le mauvais ordre dans l'état actuel
-            for idx1, (j1, car1) in enumerate(dans_ligne_finale):
-                for j2, car2 in dans_ligne_finale[idx1+1:]:
-                    pos_finale1 = positions_finales[car1][1]
-                    pos_finale2 = positions_finales[car2][1]
-                    # Conflit si dans la même ligne et dans le désordre
-                    if pos_finale1 > pos_finale2 and j1 < j2:
-                        conflits += 2
-                    elif pos_finale1 < pos_finale2 and j1 > j2:
-                        conflits += 2
-        
-        # Vérifier les conflits sur les colonnes (même logique que pour les lignes)
-        for j in range(self.taille_y):
-            dans_colonne_finale = []
-            for i in range(self.taille_x):
-                caractere = etat.grille[i, j]
-                if caractere != self.caractere_vide:
-                    pos_finale = positions_finales.get(caractere, (-1, -1))
-                    if pos_finale[1] == j:  # Si le caractère est dans sa colonne finale
-                        dans_colonne_finale.append((i, caractere))
-            
-            for idx1, (i1, car1) in enumerate(dans_colonne_finale):
-                for i2, car2 in dans_colonne_finale[idx1+1:]:
-                    pos_finale1 = positions_finales[car1][0]
-                    pos_finale2 = positions_finales[car2][0]
-                    if pos_finale1 > pos_finale2 and i1 < i2:
-                        conflits += 2
-                    elif pos_finale1 < pos_finale2 and i1 > i2:
-                        conflits += 2
+            conflits += index.conflits_alignement(cases[i * taille_y:(i + 1) * taille_y], i, 0)
+        for j in range(taille_y):
+            conflits += index.conflits_alignement(cases[j::taille_y], j, 1)
         
         # La valeur finale est la distance de Manhattan plus les pénalités
         return manhattan + conflits
@@ -631,40 +1904,297 @@ class Taquin:
         """
         if self.etat_final is None:
             return 0
+        index = self.index_but
+        penalites = index.penalites_coins
+        nb_cases = index.nb_cases
             
         # Utiliser la distance Manhattan comme base
         manhattan = self.calculer_distance_manhattan(etat)
         
-        # Ajouter une pénalité spécifique pour les coins et les bords
+        # Pénalité plus forte si un caractère de coin n'est pas à sa place
+        # (3 x sa distance au coin, nulle pour les autres caractères)
+        cases = etat.cases
         penalite_coins = 0
+        for case, code in enumerate(cases):
+            penalite_coins += penalites[code * nb_cases + case]
         
-        # Positions des coins
-        coins = [(0, 0), (0, self.taille_y-1), (self.taille_x-1, 0), (self.taille_x-1, self.taille_y-1)]
+        # Lettres répétées: seule la dernière occurrence compte
+        for code, i_coin, j_coin in index.coins_repetes:
+            if code in cases:
+                case = len(cases) - 1 - cases[::-1].index(code)
+                i, j = divmod(case, index.taille_y)
+                penalite_coins += 3 * (abs(i - i_coin) + abs(j - j_coin))
         
-        # Récupérer les caractères attendus aux coins dans l'état final
-        caracteres_coins = []
-        for i, j in coins:
-            if i < self.taille_x and j < self.taille_y:
-                caracteres_coins.append(self.etat_final.grille[i, j])
+        return manhattan + penalite_coins
+    
+    def calculer_heuristique_marche(self, etat: Etat) -> int:
+        """
+        Calcule la distance de marche (« walking distance »): la somme des
+        déplacements verticaux et horizontaux minimaux donnés par les tables
+        de TableMarche. Elle domine la distance de Manhattan.
         
-        # Créer un dictionnaire des positions dans l'état courant
-        positions_courantes = {}
-        for i in range(self.taille_x):
-            for j in range(self.taille_y):
-                caractere = etat.grille[i, j]
-                positions_courantes[caractere] = (i, j)
-        
-        # Pénalité pour les coins mal placés
-        for idx, caractere in enumerate(caracteres_coins):
-            if caractere != self.caractere_vide:
-                if caractere in positions_courantes:
-                    i, j = positions_courantes[caractere]
-                    i_coin, j_coin = coins[idx]
-                    if i != i_coin or j != j_coin:
-                        # Pénalité plus forte si un caractère de coin n'est pas à sa place
-                        penalite_coins += 3 * (abs(i - i_coin) + abs(j - j_coin))
+        Args:
+            etat: État pour lequel calculer l'heuristique
+            
+        Returns:
+            int: Distance de marche (distance de Manhattan si les tables sont indisponibles)
+        """
+        if self.etat_final is None:
+            return 0
+        tables = self.tables_marche
+        if tables is None:
+            return self.calculer_distance_manhattan(etat)
+        indice_lignes, indice_colonnes = self.indices_marche(etat)
+        if indice_lignes < 0 or indice_colonnes < 0:
+            return self.calculer_distance_manhattan(etat)
+        return tables[0].distances[indice_lignes] + tables[1].distances[indice_colonnes]
+    
+    def indices_marche(self, etat) -> Tuple[int, int]:
+        """
+        Numéros d'un état dans les tables de distance de marche.
         
-        return manhattan + penalite_coins
+        Args:
+            etat: État (ou liste des codes de ses cases)
+            
+        Returns:
+            (numéro dans la table des lignes, numéro dans la table des colonnes),
+            -1 si l'état n'a pas les mêmes lettres que l'état final
+        """
+        index = self.index_but
+        tx, ty = self.taille_x, self.taille_y
+        cases = etat.cases if isinstance(etat, Etat) else etat
+        # Un code absent du but n'a pas de ligne finale: les comptes seraient faux
+        if sorted(cases) != index.codes_tries:
+            return -1, -1
+        comptes_lignes = [[0] * tx for _ in range(tx)]
+        comptes_colonnes = [[0] * ty for _ in range(ty)]
+        vide = 0
+        for case, code in enumerate(cases):
+            if code:
+                i, j = divmod(case, ty)
+                comptes_lignes[i][index.lignes_finales[code]] += 1
+                comptes_colonnes[j][index.colonnes_finales[code]] += 1
+            else:
+                vide = case
+        table_lignes, table_colonnes = self.tables_marche
+        return (table_lignes.indice(comptes_lignes, vide // ty),
+                table_colonnes.indice(comptes_colonnes, vide % ty))
+    
+    def indices_marche_enfant(self, indices: Tuple[int, int], tuile: int, depart: int, arrivee: int) -> Tuple[int, int]:
+        """
+        Numéros dans les tables de distance de marche après un déplacement.
+        
+        Seule la table de l'axe du déplacement change d'état.
+        
+        Args:
+            indices: Numéros de l'état avant le déplacement
+            tuile: Code de la tuile déplacée de `depart` à `arrivee`
+        """
+        indice_lignes, indice_colonnes = indices
+        table_lignes, table_colonnes = self.tables_marche
+        index = self.index_but
+        # La case vide va de `arrivee` à `depart`: sens 0 si elle recule
+        sens = 0 if depart < arrivee else 1
+        if depart % self.taille_y == arrivee % self.taille_y:
+            indice_lignes = table_lignes.transition(indice_lignes, sens, index.lignes_finales[tuile])
+        else:
+            indice_colonnes = table_colonnes.transition(indice_colonnes, sens, index.colonnes_finales[tuile])
+        return indice_lignes, indice_colonnes
+    
+    def calculer_heuristique_pdb(self, etat: Etat) -> int:
+        """
+        Somme des bases de motifs additives disjointes (voir BaseMotifs).
+        
+        Contrairement à l'heuristique pattern ci-dessus, cette valeur est
+        admissible: A* retourne alors un chemin optimal.
+        
+        Args:
+            etat: État pour lequel calculer l'heuristique
+            
+        Returns:
+            int: Valeur de l'heuristique des bases de motifs
+        """
+        if self.etat_final is None:
+            return 0
+        return self.base_motifs.evaluer(etat.cases)
+    
+    # ----- ÉVALUATION PAR LOTS -----
+    
+    @staticmethod
+    def tableau_etats(etats: List[Etat]) -> np.ndarray:
+        """
+        Rassemble des états dans un tableau numpy (N x cases) de codes.
+        
+        Args:
+            etats: États d'un même codage
+            
+        Returns:
+            np.ndarray: Une ligne de codes par état
+        """
+        if not etats:
+            return np.zeros((0, 0), dtype=np.int64)
+        return np.array([etat.cases for etat in etats], dtype=np.int64)
+    
+    def evaluer_lot(self, nom: str, plateaux) -> np.ndarray:
+        """
+        Évalue une heuristique sur un lot d'états en un seul appel numpy.
+        
+        Sur un état isolé ou les quelques enfants d'un nœud, le calcul
+        incrémental (obtenir_heuristique) reste plus rapide; le lot est
+        intéressant pour évaluer d'un coup des milliers d'états.
+        
+        Args:
+            nom: Nom de l'heuristique (clé de HEURISTIQUES_LOT)
+            plateaux: Tableau (N x cases) de codes, ou liste d'états
+            
+        Returns:
+            np.ndarray: Les N valeurs de l'heuristique
+        """
+        if nom not in self.HEURISTIQUES_LOT:
+            print(f"Heuristique '{nom}' non disponible par lots. Utilisation de l'heuristique combinée par défaut.")
+            nom = 'combinee'
+        if not isinstance(plateaux, np.ndarray):
+            plateaux = self.tableau_etats(plateaux)
+        if len(plateaux) == 0:
+            return np.zeros(0)
+        return getattr(self.index_but, self.HEURISTIQUES_LOT[nom])(plateaux)
+    
+    # ----- ÉVALUATION INCRÉMENTALE DES HEURISTIQUES -----
+    #
+    # Entre un parent et un enfant, une seule tuile a bougé: elle quitte la
+    # case `depart` (la case vide de l'enfant) pour la case `arrivee` (la case
+    # vide du parent). Les méthodes calculer_delta_* retournent la variation
+    # de l'heuristique due à ce déplacement. `plateau` est la grille APRÈS le
+    # déplacement, indexable par case (un Etat ou une liste de codes).
+    
+    def obtenir_heuristique(self, nom: str) -> Tuple[Callable[[Etat], float], Callable[[Etat, float, Etat], float]]:
+        """
+        Sélectionne une heuristique par son nom.
+        
+        Args:
+            nom: Nom de l'heuristique (clé de HEURISTIQUES)
+            
+        Returns:
+            Couple (calcul complet etat -> h, calcul d'un enfant (parent, h_parent, enfant) -> h).
+            Le calcul d'un enfant est incrémental lorsque l'heuristique le permet.
+        """
+        if nom not in self.HEURISTIQUES:
+            print(f"Heuristique '{nom}' non reconnue. Utilisation de l'heuristique combinée par défaut.")
+            nom = 'combinee'
+        
+        if nom == 'pdb':
+            # Construire les tables maintenant, hors du temps de recherche
+            self.base_motifs
+        
+        if nom == 'marche':
+            if self.tables_marche is None:
+                print("Distance de marche indisponible pour cette grille (plus de 4 lignes ou colonnes, "
+                      "ou lettres répétées). Utilisation de la distance de Manhattan.")
+                nom = 'manhattan'
+            else:
+                return self.calculer_heuristique_marche, self._evaluateur_marche()
+        
+        complete = getattr(self, self.HEURISTIQUES[nom])
+        if nom not in self.HEURISTIQUES_INCREMENTALES:
+            return complete, lambda parent, h_parent, enfant: complete(enfant)
+        
+        delta = getattr(self, self.HEURISTIQUES_INCREMENTALES[nom])
+        
+        def evaluer_enfant(parent: Etat, h_parent: float, enfant: Etat) -> float:
+            arrivee = parent.vide
+            return h_parent + delta(enfant, enfant[arrivee], enfant.vide, arrivee)
+        
+        return complete, evaluer_enfant
+    
+    def _evaluateur_marche(self) -> Callable[[Etat, float, Etat], float]:
+        """
+        Calcul incrémental de la distance de marche d'un enfant.
+        
+        Les numéros du parent dans les tables sont recalculés une fois puis
+        gardés pour tous ses enfants (cache d'une entrée): les enfants
+        s'en déduisent par la table de transitions.
+        """
+        table_lignes, table_colonnes = self.tables_marche
+        dernier_parent = [None, (-1, -1)]
+        
+        def evaluer_enfant(parent: Etat, h_parent: float, enfant: Etat) -> float:
+            if dernier_parent[0] != parent.cle:
+                dernier_parent[0] = parent.cle
+                dernier_parent[1] = self.indices_marche(parent)
+            if min(dernier_parent[1]) < 0:
+                return self.calculer_heuristique_marche(enfant)
+            arrivee = parent.vide
+            indice_lignes, indice_colonnes = self.indices_marche_enfant(
+                dernier_parent[1], enfant[arrivee], enfant.vide, arrivee)
+            return table_lignes.distances[indice_lignes] + table_colonnes.distances[indice_colonnes]
+        
+        return evaluer_enfant
+    
+    def calculer_delta_manhattan(self, plateau, tuile: int, depart: int, arrivee: int) -> int:
+        """
+        Variation de la distance de Manhattan quand `tuile` va de `depart` à `arrivee`.
+        
+        Returns:
+            int: h(enfant) - h(parent)
+        """
+        index = self.index_but
+        if index.est_repete[tuile]:
+            cases = plateau.cases if isinstance(plateau, Etat) else plateau
+            return index.delta_repetee(cases, tuile, depart, arrivee)
+        ligne = tuile * index.nb_cases
+        return index.distances[ligne + arrivee] - index.distances[ligne + depart]
+    
+    def calculer_delta_mal_placees(self, plateau, tuile: int, depart: int, arrivee: int) -> int:
+        """Variation du nombre de cases mal placées (seules deux cases changent)"""
+        finales = self.index_but.finales
+        return (finales[arrivee] != tuile) - (finales[depart] != tuile)
+    
+    def calculer_delta_euclidienne(self, plateau, tuile: int, depart: int, arrivee: int) -> float:
+        """Variation de la distance euclidienne de la tuile déplacée"""
+        index = self.index_but
+        if index.est_repete[tuile]:
+            cases = plateau.cases if isinstance(plateau, Etat) else plateau
+            return index.delta_repetee(cases, tuile, depart, arrivee, euclidienne=True)
+        ligne = tuile * index.nb_cases
+        return index.distances_euclidiennes[ligne + arrivee] - index.distances_euclidiennes[ligne + depart]
+    
+    def calculer_delta_lineaire(self, plateau, tuile: int, depart: int, arrivee: int) -> int:
+        """
+        Variation de l'heuristique des conflits linéaires.
+        
+        Un déplacement vertical ne change l'ordre des tuiles que dans les deux
+        lignes concernées, un déplacement horizontal que dans les deux colonnes
+        concernées: seuls ces alignements sont recomptés, en O(n).
+        """
+        ty = self.taille_y
+        if depart % ty == arrivee % ty:
+            axe = 0
+            alignements = [(i, range(i * ty, (i + 1) * ty)) for i in (depart // ty, arrivee // ty)]
+        else:
+            axe = 1
+            nb_cases = self.taille_x * ty
+            alignements = [(j, range(j, nb_cases, ty)) for j in (depart % ty, arrivee % ty)]
+        
+        index = self.index_but
+        delta = self.calculer_delta_manhattan(plateau, tuile, depart, arrivee)
+        for indice, cases in alignements:
+            apres = [plateau[case] for case in cases]
+            # Avant le déplacement, la tuile était en `depart` et la case vide en `arrivee`
+            avant = [tuile if case == depart else 0 if case == arrivee else code
+                     for case, code in zip(cases, apres)]
+            delta += index.conflits_alignement(apres, indice, axe) - index.conflits_alignement(avant, indice, axe)
+        return delta
+    
+    def calculer_delta_combinee(self, plateau, tuile: int, depart: int, arrivee: int) -> int:
+        """Variation de l'heuristique combinée (Manhattan + 3 x mal placées + linéaire)"""
+        return (self.calculer_delta_manhattan(plateau, tuile, depart, arrivee)
+                + 3 * self.calculer_delta_mal_placees(plateau, tuile, depart, arrivee)
+                + self.calculer_delta_lineaire(plateau, tuile, depart, arrivee))
+    
+    def calculer_delta_pdb(self, plateau, tuile: int, depart: int, arrivee: int) -> int:
+        """Variation des bases de motifs (seule la table du groupe de la tuile change)"""
+        cases = plateau.cases if isinstance(plateau, Etat) else plateau
+        return self.base_motifs.delta(cases, tuile, depart, arrivee)
 
 
 # ============================================================================
@@ -729,9 +2259,10 @@ class NoeudPriorise(NoeudRecherche):
     Cette classe étend NoeudRecherche en ajoutant une valeur de priorité
     utilisée par les algorithmes informés pour déterminer l'ordre d'exploration.
     """
-    def __init__(self, etat: Etat, parent=None, action=None, profondeur=0, priorite=0):
+    def __init__(self, etat: Etat, parent=None, action=None, profondeur=0, priorite=0, h=None):
         super().__init__(etat, parent, action, profondeur)
         self.priorite = priorite
+        self.h = h  # Valeur heuristique, transmise aux enfants pour un calcul incrémental
         
     def __lt__(self, other):
         """
@@ -743,18 +2274,1384 @@ class NoeudPriorise(NoeudRecherche):
         return self.priorite < other.priorite
 
 
-def resolution_dfs(taquin: Taquin, limite_profondeur=100, limite_temps=30) -> Optional[List[Tuple[str, Etat]]]:
+class FileTas:
+    """
+    File de priorité sur un tas binaire (heapq), pour des priorités quelconques.
+    
+    Parmi les éléments de même priorité, celui de plus grand coût g sort en
+    premier, puis le dernier ajouté: même ordre que FileSeaux.
+    """
+    def __init__(self):
+        self._tas = []
+        self._compteur = 0
+        
+    def __len__(self) -> int:
+        return len(self._tas)
+        
+    def ajouter(self, priorite, g: int, element):
+        """Ajoute un élément de priorité et de coût g donnés"""
+        self._compteur -= 1
+        heapq.heappush(self._tas, (priorite, -g, self._compteur, element))
+        
+    def extraire(self):
+        """Retire et retourne un élément de plus petite priorité"""
+        return heapq.heappop(self._tas)[3]
+
+
+class FileSeaux:
+    """
+    File de priorité à seaux pour des priorités entières positives.
+    
+    Chaque priorité f a un seau, lui-même découpé en piles indexées par le
+    coût g: à priorité égale, le nœud le plus profond sort en premier (le
+    plus proche du but pour A*), et le dernier ajouté parmi ceux de même g.
+    Un pointeur sur la plus petite priorité non vide n'avance que lorsque
+    son seau est épuisé, et chaque seau garde le plus grand g non vide:
+    ajout et extraction se font en temps constant amorti, sans comparaison
+    ni allocation de tuple, tant que les priorités restent dans une petite
+    plage (distance de Manhattan, de marche...).
+    """
+    def __init__(self):
+        self._seaux = []  # priorité -> liste de piles indexées par g
+        self._g_max = []  # priorité -> plus grand g dont la pile peut être non vide
+        self._f_min = 0
+        self._taille = 0
+        
+    def __len__(self) -> int:
+        return self._taille
+        
+    def ajouter(self, priorite: int, g: int, element):
+        """Ajoute un élément de priorité et de coût g donnés"""
+        seaux = self._seaux
+        while len(seaux) <= priorite:
+            seaux.append([])
+            self._g_max.append(-1)
+        seau = seaux[priorite]
+        while len(seau) <= g:
+            seau.append([])
+        seau[g].append(element)
+        if g > self._g_max[priorite]:
+            self._g_max[priorite] = g
+        if priorite < self._f_min:
+            self._f_min = priorite
+        self._taille += 1
+        
+    def extraire(self):
+        """Retire et retourne un élément de plus petite priorité (au plus grand g)"""
+        if not self._taille:
+            raise IndexError("extraction dans une file vide")
+        f = self._f_min
+        g_max = self._g_max
+        while g_max[f] < 0:
+            f += 1
+        self._f_min = f
+        seau = self._seaux[f]
+        g = g_max[f]
+        while not seau[g]:
+            g -= 1
+        element = seau[g].pop()
+        # Abaisser le pointeur si la pile vient de se vider
+        while g >= 0 and not seau[g]:
+            g -= 1
+        g_max[f] = g
+        self._taille -= 1
+        return element
+
+
+def creer_file_priorite(heuristique: str):
+    """
+    Choisit la file de priorité adaptée à une heuristique: à seaux si ses
+    valeurs sont entières (Taquin.HEURISTIQUES_ENTIERES), sur un tas sinon.
+    """
+    return FileSeaux() if heuristique in Taquin.HEURISTIQUES_ENTIERES else FileTas()
+
+
+class EnsembleVisites:
+    """
+    Ensemble exact des états déjà visités par une recherche.
+    
+    Pour les petites grilles, chaque état est classé par ClassementEtats et
+    sa présence est un bit d'un tableau préalloué (9! bits = 45 Ko pour un
+    3x3). Au-delà de `taille_max_bitmap` permutations, les entiers compacts
+    sont rangés dans une table à adressage ouvert de mots de 64 bits. Dans
+    les deux cas il n'y a aucune collision: un état n'est jamais élagué à tort.
+    """
+    TAILLE_MAX_BITMAP = 1 << 25
+    
+    def __init__(self, etat_reference: Etat, taille_max_bitmap: Optional[int] = None):
+        """
+        Initialise un ensemble vide.
+        
+        Args:
+            etat_reference: État quelconque de l'instance (fixe l'alphabet)
+            taille_max_bitmap: Nombre maximal de bits du tableau de présence
+        """
+        if taille_max_bitmap is None:
+            taille_max_bitmap = self.TAILLE_MAX_BITMAP
+        self.taille = 0
+        self._bitmap = None
+        self._table = None
+        
+        codage = etat_reference.codage
+        classement = ClassementEtats(etat_reference)
+        if classement.nb_permutations <= taille_max_bitmap:
+            self._classement = classement
+            self._bitmap = bytearray((classement.nb_permutations + 7) // 8)
+        else:
+            # Une entrée = `_mots` mots de 64 bits; l'entier compact n'est
+            # jamais nul (il y a au moins une tuile), 0 marque une case libre
+            self._mots = (codage.nb_cases * codage.bits + 63) // 64
+            self._capacite = 1 << 16
+            self._table = array('Q', bytes(8 * self._mots * self._capacite))
+    
+    def __len__(self) -> int:
+        return self.taille
+    
+    def __contains__(self, etat: Etat) -> bool:
+        if self._bitmap is not None:
+            rang = self._classement.rang(etat.cle)
+            return bool(self._bitmap[rang >> 3] & (1 << (rang & 7)))
+        return self._chercher(etat.cle)[1]
+    
+    def ajouter(self, etat: Etat) -> bool:
+        """
+        Ajoute un état à l'ensemble.
+        
+        Args:
+            etat: État à marquer comme visité
+            
+        Returns:
+            bool: True si l'état était nouveau, False s'il était déjà présent
+        """
+        if self._bitmap is not None:
+            rang = self._classement.rang(etat.cle)
+            bit = 1 << (rang & 7)
+            if self._bitmap[rang >> 3] & bit:
+                return False
+            self._bitmap[rang >> 3] |= bit
+            self.taille += 1
+            return True
+        
+        indice, present = self._chercher(etat.cle)
+        if present:
+            return False
+        self._inserer(indice, etat.cle)
+        self.taille += 1
+        if 2 * self.taille > self._capacite:
+            self._agrandir()
+        return True
+    
+    def memoire_octets(self) -> int:
+        """Taille en octets de la structure de stockage"""
+        if self._bitmap is not None:
+            return len(self._bitmap)
+        return self._table.itemsize * len(self._table)
+    
+    def _chercher(self, cle: int) -> Tuple[int, bool]:
+        """Retourne (indice de l'entrée, présence) par sondage linéaire"""
+        table = self._table
+        mots = self._mots
+        masque = self._capacite - 1
+        indice = ((hash(cle) * 0x9E3779B97F4A7C15) >> 17) & masque
+        
+        if mots == 1:
+            while True:
+                valeur = table[indice]
+                if valeur == 0:
+                    return indice, False
+                if valeur == cle:
+                    return indice, True
+                indice = (indice + 1) & masque
+        
+        decoupe = [(cle >> (64 * k)) & 0xFFFFFFFFFFFFFFFF for k in range(mots)]
+        while True:
+            entree = table[indice * mots:(indice + 1) * mots]
+            if not any(entree):
+                return indice, False
+            if entree.tolist() == decoupe:
+                return indice, True
+            indice = (indice + 1) & masque
+    
+    def _inserer(self, indice: int, cle: int):
+        """Écrit l'entier compact dans l'entrée donnée"""
+        mots = self._mots
+        for k in range(mots):
+            self._table[indice * mots + k] = (cle >> (64 * k)) & 0xFFFFFFFFFFFFFFFF
+    
+    def _agrandir(self):
+        """Double la capacité de la table et y réinsère toutes les entrées"""
+        ancienne = self._table
+        mots = self._mots
+        self._capacite *= 2
+        self._table = array('Q', bytes(8 * mots * self._capacite))
+        for debut in range(0, len(ancienne), mots):
+            cle = 0
+            for k in range(mots):
+                cle |= ancienne[debut + k] << (64 * k)
+            if cle:
+                self._inserer(self._chercher(cle)[0], cle)
+
+
+class TableTransposition:
+    """
+    Table de transposition de taille fixe pour IDA*.
+    
+    Chaque entrée retient l'entier compact d'un état, le plus petit coût g
+    auquel il a été exploré, la borne f remontée de son sous-arbre (plus
+    petit f coupé sous lui), un minorant de sa distance au but et l'itération
+    de l'exploration. Les entrées sont rangées par paniers de deux, choisis
+    par le hachage de Zobrist: la première place garde l'état dont le
+    sous-arbre était le plus profond (borne - g la plus grande), la seconde
+    est remplacée à chaque fois. La mémoire est fixée à la construction.
+    """
+    def __init__(self, codage: CodageEtat, memoire_octets: int):
+        """
+        Initialise une table vide.
+        
+        Args:
+            codage: Codage de l'instance (fixe la taille des entiers compacts)
+            memoire_octets: Mémoire allouée à la table
+        """
+        # Une entrée = `_mots` mots de 64 bits pour la clé (0 marque une place libre),
+        # g sur 16 bits, l'itération sur 32 bits, la borne et le minorant en double précision
+        self._mots = (codage.nb_cases * codage.bits + 63) // 64
+        octets_par_panier = 2 * (8 * self._mots + 2 + 4 + 8 + 8)
+        nb_paniers = 1
+        while 2 * nb_paniers * octets_par_panier <= memoire_octets:
+            nb_paniers *= 2
+        self._masque = nb_paniers - 1
+        self.capacite = 2 * nb_paniers
+        self._cles = array('Q', bytes(8 * self._mots * self.capacite))
+        self._g = array('H', bytes(2 * self.capacite))
+        self._iterations = array('I', bytes(4 * self.capacite))
+        self._bornes = array('d', bytes(8 * self.capacite))
+        self._distances = array('d', bytes(8 * self.capacite))
+        self.succes = 0
+        self.echecs = 0
+        self.evictions = 0
+        self.taille = 0
+    
+    def memoire_octets(self) -> int:
+        """Taille en octets des tableaux de la table"""
+        return sum(tableau.itemsize * len(tableau)
+                   for tableau in (self._cles, self._g, self._iterations, self._bornes, self._distances))
+    
+    def _place(self, hachage: int, cle: int) -> Tuple[int, bool]:
+        """Retourne (place de l'état, présence); la place est la première du panier s'il est absent"""
+        place = (hachage & self._masque) << 1
+        cles = self._cles
+        mots = self._mots
+        if mots == 1:
+            if cles[place] == cle:
+                return place, True
+            if cles[place + 1] == cle:
+                return place + 1, True
+            return place, False
+        decoupe = [(cle >> (64 * k)) & 0xFFFFFFFFFFFFFFFF for k in range(mots)]
+        for essai in (place, place + 1):
+            if cles[essai * mots:(essai + 1) * mots].tolist() == decoupe:
+                return essai, True
+        return place, False
+    
+    def _libre(self, place: int) -> bool:
+        """Indique si une place de la table est inoccupée"""
+        mots = self._mots
+        if mots == 1:
+            return not self._cles[place]
+        return not any(self._cles[place * mots:(place + 1) * mots])
+    
+    def _deplacer(self, origine: int, destination: int):
+        """Recopie l'entrée d'une place dans une autre"""
+        mots = self._mots
+        self._cles[destination * mots:(destination + 1) * mots] = self._cles[origine * mots:(origine + 1) * mots]
+        for tableau in (self._g, self._iterations, self._bornes, self._distances):
+            tableau[destination] = tableau[origine]
+    
+    def consulter(self, hachage: int, cle: int) -> Optional[Tuple[int, float, float, int]]:
+        """
+        Cherche un état dans la table.
+        
+        Args:
+            hachage: Hachage de Zobrist de l'état
+            cle: Entier compact de l'état
+            
+        Returns:
+            (g, borne f, minorant de la distance au but, itération), None si l'état est absent
+        """
+        place, present = self._place(hachage, cle)
+        if not present:
+            self.echecs += 1
+            return None
+        self.succes += 1
+        return self._g[place], self._bornes[place], self._distances[place], self._iterations[place]
+    
+    def enregistrer(self, hachage: int, cle: int, g: int, borne: float, distance: float, iteration: int):
+        """
+        Enregistre l'exploration d'un état au coût g.
+        
+        Un état absent prend la première place du panier si elle est libre ou
+        si son sous-arbre est plus profond que celui de l'occupant, qui passe
+        alors à la seconde place; sinon il prend la seconde place.
+        """
+        place, present = self._place(hachage, cle)
+        if not present:
+            seconde = place + 1
+            if self._libre(place):
+                self.taille += 1
+            else:
+                if borne - g >= self._bornes[place] - self._g[place]:
+                    # L'occupant de la première place passe à la seconde
+                    if not self._libre(seconde):
+                        self.evictions += 1
+                    else:
+                        self.taille += 1
+                    self._deplacer(place, seconde)
+                else:
+                    place = seconde
+                    if not self._libre(place):
+                        self.evictions += 1
+                    else:
+                        self.taille += 1
+            mots = self._mots
+            for k in range(mots):
+                self._cles[place * mots + k] = (cle >> (64 * k)) & 0xFFFFFFFFFFFFFFFF
+        self._g[place] = g
+        self._bornes[place] = borne
+        self._distances[place] = distance
+        self._iterations[place] = iteration
+
+
+def resolution_dfs(taquin: Taquin, limite_profondeur=100, limite_temps=30,
+                   iteratif=False) -> Optional[List[Tuple[str, Etat]]]:
+    """
+    Résout le Taquin par parcours en profondeur (DFS).
+    
+    L'algorithme DFS explore l'arbre de recherche en profondeur d'abord.
+    Il n'est pas optimal (ne garantit pas la solution la plus courte)
+    mais peut être efficace en espace mémoire.
+    
+    En mode itératif (approfondissement itératif), des parcours en profondeur
+    successifs sont bornés à 0, 1, 2... coups: la première solution trouvée
+    est optimale, et seul le chemin courant est gardé en mémoire.
+    
+    Args:
+        taquin: Instance du jeu de Taquin
+        limite_profondeur: Profondeur maximale de recherche
+        limite_temps: Limite de temps en secondes
+        iteratif: Approfondissement itératif au lieu d'un seul parcours
+        
+    Returns:
+        Chemin de résolution ou None si pas de solution trouvée
+    """
+    if taquin.etat_initial is None or taquin.etat_final is None:
+        return None
+        
+    # Vérifier que la configuration est résoluble
+    if not taquin.est_resoluble():
+        print(f"Cette configuration n'est pas résoluble ({taquin.resolubilite['raison']}).")
+        return None
+    
+    if iteratif:
+        return _resolution_dfs_iteratif(taquin, limite_profondeur, limite_temps)
+        
+    # Initialisation
+    debut_temps = time.time()
+    pile = [NoeudRecherche(taquin.etat_initial)]
+    etats_visites = EnsembleVisites(taquin.etat_initial)
+    nb_noeuds_explores = 0
+    
+    while pile and (time.time() - debut_temps) < limite_temps:
+        noeud_courant = pile.pop()  # Prendre le dernier nœud (LIFO - Last In, First Out)
+        nb_noeuds_explores += 1
+        
+        # Vérifier si l'état est le but
+        if noeud_courant.etat == taquin.etat_final:
+            print(f"Solution trouvée! Noeuds explorés: {nb_noeuds_explores}")
+            return noeud_courant.reconstruire_chemin()
+            
+        # Éviter les cycles et limiter la profondeur
+        if noeud_courant.profondeur >= limite_profondeur or not etats_visites.ajouter(noeud_courant.etat):
+            continue
+        
+        # Expanser le nœud si on n'a pas atteint la limite de profondeur
+        if noeud_courant.profondeur < limite_profondeur:
+            successeurs = taquin.obtenir_successeurs(noeud_courant.etat, noeud_courant.action)
+            
+            # Pour chaque direction possible, ajouter le nœud à la pile
+            for action, voisin in successeurs:
+                pile.append(NoeudRecherche(
+                    voisin, 
+                    noeud_courant, 
+                    action, 
+                    noeud_courant.profondeur + 1
+                ))
+    
+    # Si on sort de la boucle, c'est qu'on n'a pas trouvé de solution
+    print(f"Pas de solution trouvée. Noeuds explorés: {nb_noeuds_explores}")
+    return None
+
+
+def _resolution_dfs_iteratif(taquin: Taquin, limite_profondeur: int,
+                             limite_temps: float) -> Optional[List[Tuple[str, Etat]]]:
+    """
+    Parcours en profondeur à approfondissement itératif (IDDFS).
+    
+    La borne de profondeur croît d'un coup à chaque itération. Le parcours
+    travaille sur l'entier compact de l'état: seuls le chemin courant (codes
+    des directions dans un tableau) et l'ensemble des états de ce chemin
+    sont gardés, et un voisin n'est écarté que s'il est déjà sur le chemin.
+    La mémoire reste proportionnelle à la profondeur, quelle que soit la
+    durée de la recherche.
+    """
+    debut_temps = time.time()
+    codage = taquin.codage
+    decalages, masque = codage.decalages, codage.masque
+    deplacements = table_deplacements(taquin.taille_x, taquin.taille_y)
+    cle_but = taquin.etat_final.cle
+    coups = array('b')  # Codes des directions du chemin courant, indexés par profondeur
+    sur_chemin = {taquin.etat_initial.cle}
+    nb_noeuds_explores = 0
+    
+    def chercher(cle: int, vide: int, profondeur: int, borne: int, interdit: int) -> bool:
+        """Parcours borné depuis l'état (cle, vide); True si le but est atteint"""
+        nonlocal nb_noeuds_explores
+        nb_noeuds_explores += 1
+        if not nb_noeuds_explores & 0x3FF and time.time() - debut_temps >= limite_temps:
+            raise _ArretRecherche()
+        if cle == cle_but:
+            return True
+        if profondeur == borne:
+            return False
+        for cible, code in deplacements[vide]:
+            if code == interdit:
+                continue
+            # Glisser la tuile de la case cible dans la case vide, dans l'entier compact
+            tuile = (cle >> decalages[cible]) & masque
+            enfant = cle ^ (tuile << decalages[cible]) ^ (tuile << decalages[vide])
+            if enfant in sur_chemin:
+                continue
+            sur_chemin.add(enfant)
+            coups[profondeur] = code
+            trouve = chercher(enfant, cible, profondeur + 1, borne, code ^ 1)
+            sur_chemin.discard(enfant)
+            if trouve:
+                return True
+        return False
+    
+    borne = 0
+    try:
+        while True:
+            if len(coups) < borne:
+                coups.append(0)
+            if chercher(taquin.etat_initial.cle, taquin.etat_initial.vide, 0, borne, -1):
+                break
+            if borne >= limite_profondeur:
+                print(f"Pas de solution trouvée. Noeuds explorés: {nb_noeuds_explores}")
+                return None
+            borne += 1
+    except _ArretRecherche:
+        print(f"Pas de solution trouvée (profondeur {borne} en cours). Noeuds explorés: {nb_noeuds_explores}")
+        return None
+    
+    print(f"Solution trouvée! Noeuds explorés: {nb_noeuds_explores}")
+    
+    # Rejouer les directions depuis l'état initial pour construire le chemin
+    chemin = []
+    etat = taquin.etat_initial
+    for code in coups[:borne]:
+        etat = taquin.deplacer(etat, DIRECTIONS[code])
+        chemin.append((DIRECTIONS[code], etat))
+    return chemin
+
+
+def resolution_bfs(taquin: Taquin, limite_noeuds=100000, limite_temps=30,
+                   frontiere=False, travailleurs=1) -> Optional[List[Tuple[str, Etat]]]:
+    """
+    Résout le Taquin par parcours en largeur (BFS).
+    
+    L'algorithme BFS explore l'arbre de recherche niveau par niveau.
+    Il garantit de trouver la solution optimale (avec le moins d'étapes)
+    mais peut être coûteux en mémoire.
+    
+    En mode frontière, seules les couches courante et suivante sont gardées
+    (voir _resolution_bfs_frontiere): la mémoire est proportionnelle à la
+    couche la plus large, au prix de quelques parcours supplémentaires pour
+    reconstruire le chemin.
+    
+    Avec plusieurs travailleurs, les couches sont développées en parallèle
+    par des processus qui se partagent l'espace des états (voir
+    _resolution_bfs_parallele); le chemin est le même qu'en séquentiel.
+    
+    Args:
+        taquin: Instance du jeu de Taquin
+        limite_noeuds: Nombre maximal de nœuds à explorer
+        limite_temps: Limite de temps en secondes
+        frontiere: Recherche de frontière, sans ensemble des états visités
+        travailleurs: Nombre de processus du BFS parallèle (1: séquentiel)
+        
+    Returns:
+        Chemin de résolution ou None si pas de solution trouvée
+    """
+    if taquin.etat_initial is None or taquin.etat_final is None:
+        return None
+        
+    # Vérifier que la configuration est résoluble
+    if not taquin.est_resoluble():
+        print(f"Cette configuration n'est pas résoluble ({taquin.resolubilite['raison']}).")
+        return None
+    
+    if frontiere:
+        return _resolution_bfs_frontiere(taquin, limite_noeuds, limite_temps)
+    if travailleurs > 1:
+        return _resolution_bfs_parallele(taquin, limite_noeuds, limite_temps, travailleurs)
+        
+    # Initialisation
+    debut_temps = time.time()
+    file = deque([NoeudRecherche(taquin.etat_initial)])  # File FIFO (First In, First Out)
+    etats_visites = EnsembleVisites(taquin.etat_initial)
+    etats_visites.ajouter(taquin.etat_initial)
+    nb_noeuds_explores = 0
+    
+    while file and nb_noeuds_explores < limite_noeuds and (time.time() - debut_temps) < limite_temps:
+        noeud_courant = file.popleft()  # Prendre le premier nœud (FIFO)
+        nb_noeuds_explores += 1
+        
+        # Vérifier si l'état est le but
+        if noeud_courant.etat == taquin.etat_final:
+            print(f"Solution trouvée! Noeuds explorés: {nb_noeuds_explores}")
+            return noeud_courant.reconstruire_chemin()
+        
+        # Expanser le nœud (sans revenir vers le parent)
+        successeurs = taquin.obtenir_successeurs(noeud_courant.etat, noeud_courant.action)
+        
+        # Pour chaque voisin
+        for action, voisin in successeurs:
+            if etats_visites.ajouter(voisin):
+                file.append(NoeudRecherche(
+                    voisin, 
+                    noeud_courant, 
+                    action, 
+                    noeud_courant.profondeur + 1
+                ))
+    
+    # Si on sort de la boucle, c'est qu'on n'a pas trouvé de solution
+    print(f"Pas de solution trouvée. Noeuds explorés: {nb_noeuds_explores}")
+    return None
+
+
+def _resolution_bfs_frontiere(taquin: Taquin, limite_noeuds: int,
+                              limite_temps: float) -> Optional[List[Tuple[str, Etat]]]:
+    """
+    Parcours en largeur par recherche de frontière (frontier search).
+    
+    Le graphe du Taquin est non orienté et biparti (chaque coup déplace la
+    case vide sur une case voisine): les voisins d'un état de la couche d
+    sont dans la couche d - 1 ou d + 1. Chaque état de la couche courante
+    garde un masque des directions qui mènent à un voisin déjà connu (ses
+    parents de la couche précédente, qui l'ont tous engendré): ces directions
+    ne sont jamais développées et la couche précédente peut être oubliée.
+    Seules les couches courante et suivante sont en mémoire, sans ensemble
+    des états visités ni chaînes de parents.
+    
+    Le chemin est reconstruit par division: un premier parcours donne la
+    profondeur D du but, un second retient pour chaque état son ancêtre de
+    la couche D // 2, ce qui fournit un état milieu d'un chemin optimal; les
+    deux moitiés sont résolues de la même façon, récursivement.
+    """
+    debut_temps = time.time()
+    codage = taquin.codage
+    decalages, masque = codage.decalages, codage.masque
+    deplacements = table_deplacements(taquin.taille_x, taquin.taille_y)
+    nb_noeuds_explores = 0
+    largeur_max = 1
+    
+    def glisser(cle: int, vide: int, cible: int) -> int:
+        """Entier compact après le glissement de la tuile de `cible` vers `vide`"""
+        tuile = (cle >> decalages[cible]) & masque
+        return cle ^ (tuile << decalages[cible]) ^ (tuile << decalages[vide])
+    
+    def parcourir(depart: Tuple[int, int], cle_but: int, profondeur_milieu: int = -1):
+        """
+        Parcours en largeur de frontière depuis l'état (cle, vide) `depart`.
+        Retourne (profondeur du but, état (cle, vide) de la couche
+        `profondeur_milieu` sur le chemin trouvé), ou None si l'espace est épuisé.
+        """
+        nonlocal nb_noeuds_explores, largeur_max
+        if depart[0] == cle_but:
+            return 0, depart
+        # Couche: entier compact -> (case vide, directions déjà utilisées, ancêtre milieu)
+        courante = {depart[0]: (depart[1], 0, depart if profondeur_milieu == 0 else None)}
+        profondeur = 0
+        while courante:
+            suivante = {}
+            for cle, (vide, utilisees, milieu) in courante.items():
+                nb_noeuds_explores += 1
+                if nb_noeuds_explores >= limite_noeuds or (
+                        not nb_noeuds_explores & 0x3FF and time.time() - debut_temps >= limite_temps):
+                    raise _ArretRecherche()
+                for cible, code in deplacements[vide]:
+                    if utilisees >> code & 1:
+                        continue
+                    enfant = glisser(cle, vide, cible)
+                    # Le coup inverse mène au parent: il ne sera pas développé
+                    entree = suivante.get(enfant)
+                    if entree is not None:
+                        suivante[enfant] = (cible, entree[1] | 1 << (code ^ 1), entree[2])
+                        continue
+                    if profondeur + 1 == profondeur_milieu:
+                        milieu_enfant = (enfant, cible)
+                    else:
+                        milieu_enfant = milieu
+                    if enfant == cle_but:
+                        return profondeur + 1, milieu_enfant
+                    suivante[enfant] = (cible, 1 << (code ^ 1), milieu_enfant)
+            largeur_max = max(largeur_max, len(suivante))
+            courante = suivante
+            profondeur += 1
+        return None
+    
+    def relier(depart: Tuple[int, int], arrivee: Tuple[int, int], distance: int) -> List[int]:
+        """Codes des directions d'un chemin optimal de `distance` coups"""
+        if distance == 0:
+            return []
+        if distance == 1:
+            cle, vide = depart
+            for cible, code in deplacements[vide]:
+                if glisser(cle, vide, cible) == arrivee[0]:
+                    return [code]
+        moitie = distance // 2
+        _, milieu = parcourir(depart, arrivee[0], moitie)
+        return relier(depart, milieu, moitie) + relier(milieu, arrivee, distance - moitie)
+    
+    depart = (taquin.etat_initial.cle, taquin.etat_initial.vide)
+    but = (taquin.etat_final.cle, taquin.etat_final.vide)
+    try:
+        resultat = parcourir(depart, but[0])
+        if resultat is None:
+            print(f"Pas de solution trouvée. Noeuds explorés: {nb_noeuds_explores}")
+            return None
+        codes = relier(depart, but, resultat[0])
+    except _ArretRecherche:
+        print(f"Pas de solution trouvée. Noeuds explorés: {nb_noeuds_explores}")
+        return None
+    
+    print(f"Solution trouvée! Noeuds explorés: {nb_noeuds_explores} (couche la plus large: {largeur_max} états)")
+    
+    chemin = []
+    etat = taquin.etat_initial
+    for code in codes:
+        etat = taquin.deplacer(etat, DIRECTIONS[code])
+        chemin.append((DIRECTIONS[code], etat))
+    return chemin
+
+
+def _partition(cle: int, nb_partitions: int) -> int:
+    """Partition propriétaire d'un entier compact (hachage multiplicatif de Fibonacci)"""
+    # Replier les grands entiers (5x5: plus de 64 bits) pour que toutes les cases comptent
+    while cle >> 64:
+        cle = (cle & 0xFFFFFFFFFFFFFFFF) ^ (cle >> 64)
+    # Les bits de poids fort du produit dépendent de tous les bits de la clé:
+    # ce sont eux qui choisissent la partition
+    hachage = ((cle * 0x9E3779B97F4A7C15) & 0xFFFFFFFFFFFFFFFF) >> 32
+    return (hachage * nb_partitions) >> 32
+
+
+def _travailleur_bfs_parallele(numero: int, nb_travailleurs: int, decalages, masque: int,
+                               deplacements, depart: Tuple[int, int], cle_but: int,
+                               commandes, boites, resultats, taille_lot: int):
+    """
+    Processus d'une partition du BFS parallèle (voir _resolution_bfs_parallele).
+    
+    La partition garde les états qu'elle possède: l'ensemble de tous ceux
+    déjà atteints et la couche courante (entier compact -> (case vide, ordinal)).
+    Elle répond aux commandes du coordinateur: 'developper' une couche,
+    compter les états de la couche placés avant un 'rang' donné, ou None
+    pour s'arrêter.
+    """
+    visites = set()
+    courante = {}
+    if _partition(depart[0], nb_travailleurs) == numero:
+        visites.add(depart[0])
+        courante[depart[0]] = (depart[1], 0)
+    profondeur = 0
+    
+    while True:
+        commande = commandes.get()
+        if commande is None:
+            return
+        if commande[0] == 'rang':
+            resultats.put(sum(1 for _, ordinal in courante.values() if ordinal < commande[1]))
+            continue
+        
+        suivante = {}
+        
+        def recevoir(lot):
+            """Garde les enfants inconnus, avec le plus petit ordinal pour chacun"""
+            for enfant, vide, ordinal in lot:
+                if enfant in visites:
+                    continue
+                entree = suivante.get(enfant)
+                if entree is None or ordinal < entree[1]:
+                    suivante[enfant] = (vide, ordinal)
+        
+        # Développer la couche; les enfants des autres partitions leur sont envoyés par lots
+        lots = [[] for _ in range(nb_travailleurs)]
+        locaux = lots[numero]
+        for cle, (vide, ordinal) in courante.items():
+            interdit = (ordinal & 3) ^ 1 if profondeur else -1
+            for cible, code in deplacements[vide]:
+                if code == interdit:
+                    continue
+                tuile = (cle >> decalages[cible]) & masque
+                enfant = cle ^ (tuile << decalages[cible]) ^ (tuile << decalages[vide])
+                proprietaire = _partition(enfant, nb_travailleurs)
+                lot = lots[proprietaire]
+                lot.append((enfant, cible, ordinal << 2 | code))
+                if len(lot) >= taille_lot:
+                    if proprietaire == numero:
+                        recevoir(lot)
+                    else:
+                        boites[proprietaire].put(lot)
+                    lots[proprietaire] = []
+        recevoir(lots[numero])
+        for autre in range(nb_travailleurs):
+            if autre != numero:
+                if lots[autre]:
+                    boites[autre].put(lots[autre])
+                boites[autre].put(None)  # Fin de couche pour cette partition
+        
+        # Recevoir les enfants envoyés par les autres partitions
+        fins = 1
+        while fins < nb_travailleurs:
+            lot = boites[numero].get()
+            if lot is None:
+                fins += 1
+            else:
+                recevoir(lot)
+        
+        visites.update(suivante)
+        courante = suivante
+        profondeur += 1
+        but = courante.get(cle_but)
+        resultats.put((len(courante), None if but is None else but[1]))
+
+
+def _resolution_bfs_parallele(taquin: Taquin, limite_noeuds: int, limite_temps: float,
+                              travailleurs: int, taille_lot: int = 4096) -> Optional[List[Tuple[str, Etat]]]:
+    """
+    Parcours en largeur par couches, réparti entre plusieurs processus.
+    
+    Chaque processus possède une partition de l'espace des états (selon un
+    hachage de l'entier compact): il développe sa part de la couche courante
+    et envoie chaque enfant, par lots, à la partition qui le possède. La
+    détection des doublons reste locale à chaque partition.
+    
+    Pour retrouver le chemin de resolution_bfs, chaque état porte un ordinal:
+    les codes des directions depuis l'état initial, en base 4. Dans une
+    couche, l'ordre des ordinaux est celui de la file FIFO du BFS séquentiel
+    (parents dans l'ordre de la file, puis directions dans l'ordre de
+    DIRECTIONS); en gardant le plus petit ordinal de chaque état, on garde
+    le parent que le BFS séquentiel aurait retenu. L'ordinal du but suffit
+    alors à rejouer le chemin, sans chaînes de parents.
+    
+    Les limites sont vérifiées entre deux couches (et par un délai d'attente
+    pendant une couche).
+    """
+    import multiprocessing
+    import queue
+    
+    debut_temps = time.time()
+    codage = taquin.codage
+    deplacements = table_deplacements(taquin.taille_x, taquin.taille_y)
+    depart = (taquin.etat_initial.cle, taquin.etat_initial.vide)
+    cle_but = taquin.etat_final.cle
+    if depart[0] == cle_but:
+        print("Solution trouvée! Noeuds explorés: 1")
+        return []
+    
+    commandes = [multiprocessing.Queue() for _ in range(travailleurs)]
+    boites = [multiprocessing.Queue() for _ in range(travailleurs)]
+    resultats = multiprocessing.Queue()
+    processus = [multiprocessing.Process(
+        target=_travailleur_bfs_parallele,
+        args=(numero, travailleurs, codage.decalages, codage.masque, deplacements,
+              depart, cle_but, commandes[numero], boites, resultats, taille_lot),
+        daemon=True) for numero in range(travailleurs)]
+    for p in processus:
+        p.start()
+    
+    nb_noeuds_explores = 0
+    taille_couche = 1
+    profondeur = 0
+    ordinal_but = None
+    temps_couches = 0.0
+    try:
+        while ordinal_but is None:
+            if taille_couche == 0 or nb_noeuds_explores >= limite_noeuds:
+                print(f"Pas de solution trouvée. Noeuds explorés: {nb_noeuds_explores}")
+                return None
+            debut_couche = time.time()
+            for file in commandes:
+                file.put(('developper',))
+            nb_noeuds_explores += taille_couche
+            taille_couche = 0
+            for _ in range(travailleurs):
+                restant = limite_temps - (time.time() - debut_temps)
+                taille, ordinal = resultats.get(timeout=max(restant, 0.001))
+                taille_couche += taille
+                if ordinal is not None:
+                    ordinal_but = ordinal
+            temps_couches += time.time() - debut_couche
+            profondeur += 1
+        
+        # Position du but dans la file du BFS séquentiel, pour le même compte de nœuds
+        for file in commandes:
+            file.put(('rang', ordinal_but))
+        nb_noeuds_explores += sum(resultats.get() for _ in range(travailleurs)) + 1
+    except queue.Empty:
+        print(f"Pas de solution trouvée. Noeuds explorés: {nb_noeuds_explores}")
+        return None
+    finally:
+        for file in commandes:
+            file.put(None)
+        for p in processus:
+            p.join(timeout=1)
+            if p.is_alive():
+                p.terminate()
+    
+    debit = nb_noeuds_explores / temps_couches if temps_couches > 0 else 0.0
+    taquin.statistiques = {
+        'noeuds_explores': nb_noeuds_explores,
+        'travailleurs': travailleurs,
+        'etats_par_seconde': debit,
+    }
+    print(f"Solution trouvée! Noeuds explorés: {nb_noeuds_explores} "
+          f"({travailleurs} processus, {debit:.0f} états développés/s)")
+    
+    chemin = []
+    etat = taquin.etat_initial
+    for i in range(profondeur - 1, -1, -1):
+        code = ordinal_but >> (2 * i) & 3
+        etat = taquin.deplacer(etat, DIRECTIONS[code])
+        chemin.append((DIRECTIONS[code], etat))
+    return chemin
+
+
+def resolution_bfs_bidirectionnel(taquin: Taquin, limite_noeuds=100000,
+                                  limite_temps=30) -> Optional[List[Tuple[str, Etat]]]:
+    """
+    Résout le Taquin par parcours en largeur bidirectionnel.
+    
+    Deux parcours en largeur partent l'un de l'état initial, l'autre de
+    l'état final (les déplacements sont réversibles). À chaque étape, la
+    couche complète du côté dont la frontière est la plus petite est
+    développée; un état déjà atteint par l'autre côté (recherche exacte de
+    son entier compact) est un point de rencontre. La couche est terminée
+    pour retenir la rencontre de longueur totale minimale: le chemin est
+    optimal, et chaque côté ne descend qu'à environ la moitié de la
+    profondeur de la solution.
+    
+    Args:
+        taquin: Instance du jeu de Taquin
+        limite_noeuds: Nombre maximal de nœuds à explorer (des deux côtés)
+        limite_temps: Limite de temps en secondes
+        
+    Returns:
+        Chemin de résolution ou None si pas de solution trouvée
+    """
+    if taquin.etat_initial is None or taquin.etat_final is None:
+        return None
+        
+    # Vérifier que la configuration est résoluble
+    if not taquin.est_resoluble():
+        print(f"Cette configuration n'est pas résoluble ({taquin.resolubilite['raison']}).")
+        return None
+    
+    if taquin.etat_initial == taquin.etat_final:
+        return []
+    
+    # Pour chaque côté: entier compact -> (entier compact du parent, code de la
+    # direction menant du parent à l'état, profondeur), et la couche courante
+    debut_temps = time.time()
+    parents = ({taquin.etat_initial.cle: (None, -1, 0)}, {taquin.etat_final.cle: (None, -1, 0)})
+    frontieres = ([taquin.etat_initial], [taquin.etat_final])
+    nb_explores = [0, 0]
+    deplacements = table_deplacements(taquin.taille_x, taquin.taille_y)
+    meilleure = None  # (longueur, entier compact du point de rencontre)
+    
+    while frontieres[0] and frontieres[1] and meilleure is None:
+        # Développer la plus petite frontière
+        cote = 0 if len(frontieres[0]) <= len(frontieres[1]) else 1
+        parents_cote, parents_autre = parents[cote], parents[1 - cote]
+        suivante = []
+        for etat in frontieres[cote]:
+            if sum(nb_explores) >= limite_noeuds or (
+                    not sum(nb_explores) & 0x3FF and time.time() - debut_temps >= limite_temps):
+                taquin.statistiques = {'noeuds_explores': sum(nb_explores),
+                                       'noeuds_explores_avant': nb_explores[0],
+                                       'noeuds_explores_arriere': nb_explores[1]}
+                print(f"Pas de solution trouvée. Noeuds explorés: {sum(nb_explores)} "
+                      f"(depuis le départ: {nb_explores[0]}, depuis le but: {nb_explores[1]})")
+                return None
+            nb_explores[cote] += 1
+            profondeur = parents_cote[etat.cle][2] + 1
+            for cible, code in deplacements[etat.vide]:
+                voisin = taquin._glisser(etat, cible)
+                if voisin.cle in parents_cote:
+                    continue
+                parents_cote[voisin.cle] = (etat.cle, code, profondeur)
+                suivante.append(voisin)
+                rencontre = parents_autre.get(voisin.cle)
+                if rencontre is not None and (meilleure is None or profondeur + rencontre[2] < meilleure[0]):
+                    meilleure = (profondeur + rencontre[2], voisin.cle)
+        frontieres = (suivante, frontieres[1]) if cote == 0 else (frontieres[0], suivante)
+    
+    taquin.statistiques = {'noeuds_explores': sum(nb_explores),
+                           'noeuds_explores_avant': nb_explores[0],
+                           'noeuds_explores_arriere': nb_explores[1]}
+    if meilleure is None:
+        print(f"Pas de solution trouvée. Noeuds explorés: {sum(nb_explores)}")
+        return None
+    print(f"Solution trouvée! Noeuds explorés: {sum(nb_explores)} "
+          f"(depuis le départ: {nb_explores[0]}, depuis le but: {nb_explores[1]})")
+    
+    # Moitié avant: remonter les parents du point de rencontre jusqu'à l'état initial
+    codes = []
+    cle = meilleure[1]
+    while True:
+        cle, code, _ = parents[0][cle]
+        if cle is None:
+            break
+        codes.append(code)
+    codes.reverse()
+    # Moitié arrière: chaque pas va de l'état vers son parent, dans le sens inverse
+    cle = meilleure[1]
+    while True:
+        cle, code, _ = parents[1][cle]
+        if cle is None:
+            break
+        codes.append(code ^ 1)
+    
+    # Rejouer les directions depuis l'état initial pour construire le chemin
+    chemin = []
+    etat = taquin.etat_initial
+    for code in codes:
+        etat = taquin.deplacer(etat, DIRECTIONS[code])
+        chemin.append((DIRECTIONS[code], etat))
+    return chemin
+
+
+def resolution_best_first(taquin: Taquin, limite_noeuds=100000, limite_temps=30, 
+                          heuristique='combinee') -> Optional[List[Tuple[str, Etat]]]:
+    """
+    Résout le Taquin par parcours meilleur d'abord (Best-First Search).
+    
+    L'algorithme Best-First explore les nœuds selon une fonction heuristique
+    qui estime leur "proximité" à l'état but. Il n'est pas toujours optimal
+    mais explore généralement moins de nœuds que BFS. Les nœuds développés,
+    générés et ajoutés à la file sont comptés dans taquin.statistiques.
+    
+    Args:
+        taquin: Instance du jeu de Taquin
+        limite_noeuds: Nombre maximal de nœuds à explorer
+        limite_temps: Limite de temps en secondes
+        heuristique: Heuristique à utiliser ('lineaire' ou 'combinee')
+        
+    Returns:
+        Chemin de résolution ou None si pas de solution trouvée
+    """
+    if taquin.etat_initial is None or taquin.etat_final is None:
+        return None
+        
+    # Vérifier que la configuration est résoluble
+    if not taquin.est_resoluble():
+        print(f"Cette configuration n'est pas résoluble ({taquin.resolubilite['raison']}).")
+        return None
+        
+    # Sélectionner l'heuristique appropriée (et sa version incrémentale)
+    heuristique_func, heuristique_enfant = taquin.obtenir_heuristique(heuristique)
+        
+    # Initialisation
+    debut_temps = time.time()
+    priorite_initiale = heuristique_func(taquin.etat_initial)
+    
+    # File de priorité (à seaux si l'heuristique est entière); à priorité
+    # égale, le nœud le plus profond est exploré en premier
+    file_priorite = creer_file_priorite(heuristique)
+    file_priorite.ajouter(priorite_initiale, 0,
+                          NoeudPriorise(taquin.etat_initial, priorite=priorite_initiale, h=priorite_initiale))
+    
+    etats_visites = EnsembleVisites(taquin.etat_initial)
+    etats_visites.ajouter(taquin.etat_initial)
+    nb_noeuds_explores = 0
+    nb_noeuds_generes = 0
+    nb_noeuds_ajoutes = 0
+    
+    def enregistrer_statistiques():
+        taquin.statistiques = {'noeuds_explores': nb_noeuds_explores,
+                               'noeuds_generes': nb_noeuds_generes,
+                               'noeuds_ajoutes': nb_noeuds_ajoutes}
+    
+    while file_priorite and nb_noeuds_explores < limite_noeuds and (time.time() - debut_temps) < limite_temps:
+        noeud_courant = file_priorite.extraire()
+        nb_noeuds_explores += 1
+        
+        # Vérifier si l'état est le but
+        if noeud_courant.etat == taquin.etat_final:
+            enregistrer_statistiques()
+            print(f"Solution trouvée! Noeuds explorés: {nb_noeuds_explores}")
+            return noeud_courant.reconstruire_chemin()
+        
+        # Expanser le nœud (sans revenir vers le parent)
+        successeurs = taquin.obtenir_successeurs(noeud_courant.etat, noeud_courant.action)
+        
+        # Pour chaque voisin
+        for action, voisin in successeurs:
+            nb_noeuds_generes += 1
+            if etats_visites.ajouter(voisin):
+                nb_noeuds_ajoutes += 1
+                
+                # Calculer la priorité en utilisant l'heuristique sélectionnée,
+                # à partir de la valeur du parent et du déplacement effectué
+                # Dans Best-First, la priorité est simplement la valeur heuristique
+                priorite = heuristique_enfant(noeud_courant.etat, noeud_courant.h, voisin)
+                
+                nouveau_noeud = NoeudPriorise(
+                    voisin, 
+                    noeud_courant, 
+                    action, 
+                    noeud_courant.profondeur + 1,
+                    priorite=priorite,
+                    h=priorite
+                )
+                
+                file_priorite.ajouter(priorite, nouveau_noeud.profondeur, nouveau_noeud)
+    
+    # Si on sort de la boucle, c'est qu'on n'a pas trouvé de solution
+    enregistrer_statistiques()
+    print(f"Pas de solution trouvée. Noeuds explorés: {nb_noeuds_explores}")
+    return None
+
+
+def resolution_a_star(taquin: Taquin, limite_noeuds=100000, limite_temps=30, 
+                    heuristique='combinee') -> Optional[List[Tuple[str, Etat]]]:
+    """
+    Résout le Taquin par algorithme A* (A-Star).
+    
+    L'algorithme A* combine BFS avec une heuristique. Il considère à la fois
+    le coût réel du chemin parcouru (g(n)) et l'estimation jusqu'au but (h(n)).
+    C'est un algorithme optimal si l'heuristique est admissible.
+    
+    Le meilleur coût g connu de chaque état est gardé dans une table indexée
+    par son entier compact. Un état est ajouté à la file à chaque fois que
+    son coût diminue; les entrées devenues périmées sont ignorées au moment
+    de leur sortie (suppression paresseuse). Un état déjà développé qui est
+    atteint par un chemin plus court est ainsi rouvert, ce qui garde la
+    solution optimale même avec une heuristique admissible mais incohérente.
+    Les nœuds développés, générés (tous les successeurs), ajoutés à la file
+    et rouverts sont comptés séparément dans taquin.statistiques.
+    
+    Args:
+        taquin: Instance du jeu de Taquin
+        limite_noeuds: Nombre maximal de nœuds à explorer (développés)
+        limite_temps: Limite de temps en secondes
+        heuristique: Heuristique à utiliser ('lineaire', 'combinee', 'pdb' ou 'marche')
+        
+    Returns:
+        Chemin de résolution ou None si pas de solution trouvée
+    """
+    if taquin.etat_initial is None or taquin.etat_final is None:
+        return None
+        
+    # Vérifier que la configuration est résoluble
+    if not taquin.est_resoluble():
+        print(f"Cette configuration n'est pas résoluble ({taquin.resolubilite['raison']}).")
+        return None
+        
+    # Sélectionner l'heuristique appropriée (et sa version incrémentale)
+    heuristique_func, heuristique_enfant = taquin.obtenir_heuristique(heuristique)
+        
+    # Initialisation
+    debut_temps = time.time()
+    h_initial = heuristique_func(taquin.etat_initial)
+    
+    # Dans A*, la priorité est f(n) = g(n) + h(n) où:
+    # - g(n) est le coût du chemin de l'état initial à l'état n (ici, la profondeur)
+    # - h(n) est l'heuristique estimant le coût de n à l'état final
+    cout_initial = 0  # g(n) pour l'état initial
+    priorite_initiale = cout_initial + h_initial  # f(n) = g(n) + h(n)
+    
+    # File de priorité (à seaux si l'heuristique est entière); à f égal,
+    # le nœud de plus grand g est développé en premier
+    file_priorite = creer_file_priorite(heuristique)
+    file_priorite.ajouter(priorite_initiale, cout_initial,
+                          NoeudPriorise(taquin.etat_initial, priorite=priorite_initiale, h=h_initial))
+    
+    # Meilleur coût g connu de chaque état atteint (par entier compact)
+    couts = {taquin.etat_initial.cle: cout_initial}
+    etats_developpes = EnsembleVisites(taquin.etat_initial)
+    nb_noeuds_explores = 0
+    nb_noeuds_generes = 0
+    nb_noeuds_ajoutes = 0
+    nb_reouvertures = 0
+    
+    def enregistrer_statistiques():
+        taquin.statistiques = {'noeuds_explores': nb_noeuds_explores,
+                               'noeuds_generes': nb_noeuds_generes,
+                               'noeuds_ajoutes': nb_noeuds_ajoutes,
+                               'reouvertures': nb_reouvertures}
+    
+    while file_priorite and nb_noeuds_explores < limite_noeuds and (time.time() - debut_temps) < limite_temps:
+        noeud_courant = file_priorite.extraire()
+        
+        # Entrée périmée: un chemin plus court vers cet état a été trouvé depuis
+        if noeud_courant.profondeur > couts[noeud_courant.etat.cle]:
+            continue
+        nb_noeuds_explores += 1
+        if not etats_developpes.ajouter(noeud_courant.etat):
+            nb_reouvertures += 1
+        
+        # Vérifier si l'état est le but
+        if noeud_courant.etat == taquin.etat_final:
+            enregistrer_statistiques()
+            print(f"Solution trouvée! Noeuds explorés: {nb_noeuds_explores} "
+                  f"(générés: {nb_noeuds_generes}, ajoutés: {nb_noeuds_ajoutes}, rouverts: {nb_reouvertures})")
+            return noeud_courant.reconstruire_chemin()
+        
+        # Expanser le nœud (sans revenir vers le parent)
+        successeurs = taquin.obtenir_successeurs(noeud_courant.etat, noeud_courant.action)
+        
+        # Coût du chemin jusqu'aux voisins (g(n))
+        cout = noeud_courant.profondeur + 1
+        
+        # Pour chaque voisin
+        for action, voisin in successeurs:
+            nb_noeuds_generes += 1
+            # Ne garder le voisin que si ce chemin est strictement meilleur
+            if couts.get(voisin.cle, cout + 1) <= cout:
+                continue
+            couts[voisin.cle] = cout
+            nb_noeuds_ajoutes += 1
+            
+            # Valeur heuristique (h(n)), dérivée de celle du parent
+            h = heuristique_enfant(noeud_courant.etat, noeud_courant.h, voisin)
+            
+            # Priorité totale f(n) = g(n) + h(n)
+            # C'est la différence principale avec Best-First qui n'utilise que h(n)
+            priorite = cout + h
+            
+            nouveau_noeud = NoeudPriorise(
+                voisin, 
+                noeud_courant, 
+                action, 
+                cout,  # La profondeur correspond au coût du chemin
+                priorite=priorite,
+                h=h
+            )
+            
+            file_priorite.ajouter(priorite, cout, nouveau_noeud)
+    
+    # Si on sort de la boucle, c'est qu'on n'a pas trouvé de solution
+    enregistrer_statistiques()
+    print(f"Pas de solution trouvée. Noeuds explorés: {nb_noeuds_explores} "
+          f"(générés: {nb_noeuds_generes}, ajoutés: {nb_noeuds_ajoutes}, rouverts: {nb_reouvertures})")
+    return None
+
+
+def resolution_ara_star(taquin: Taquin, limite_noeuds=100000, limite_temps=30,
+                        heuristique='marche', poids_initial=3.0, pas_poids=0.5,
+                        rappel: Optional[Callable[[List[Tuple[str, Etat]], float], None]] = None
+                        ) -> Tuple[Optional[List[Tuple[str, Etat]]], float]:
+    """
+    Résout le Taquin par A* pondéré « anytime » (ARA*).
+    
+    Une première recherche avec f(n) = g(n) + w * h(n) et un poids w élevé
+    trouve rapidement une solution, de coût au plus w fois l'optimum si
+    l'heuristique est admissible. Le poids est ensuite abaissé de `pas_poids`
+    et la recherche reprise sans repartir de zéro: la liste ouverte est
+    réordonnée avec le nouveau poids et les états fermés dont le coût a
+    diminué pendant l'itération (liste des incohérents) y sont rouverts.
+    Chaque solution améliorée est affichée avec sa borne de sous-optimalité
+    prouvée min(w, g(but) / min(g + h)), le minimum portant sur les listes
+    ouverte et incohérente, puis transmise à `rappel` le cas échéant. Si une
+    limite interrompt l'itération, w n'est pas encore garanti: la borne est
+    g(but) / min(g + h), plafonnée par la borne précédente. La
+    recherche s'arrête aux limites de temps et de nœuds, ou quand la borne
+    atteint 1 (solution optimale).
+    
+    Args:
+        taquin: Instance du jeu de Taquin
+        limite_noeuds: Nombre maximal de nœuds à explorer
+        limite_temps: Limite de temps en secondes
+        heuristique: Heuristique à utiliser (clé de Taquin.HEURISTIQUES)
+        poids_initial: Poids w de l'heuristique pour la première solution
+        pas_poids: Diminution du poids entre deux itérations
+        rappel: Fonction appelée avec (chemin, borne) à chaque amélioration
+        
+    Returns:
+        Couple (meilleur chemin trouvé ou None, borne de sous-optimalité)
+    """
+    infini = float('inf')
+    if taquin.etat_initial is None or taquin.etat_final is None:
+        return None, infini
+        
+    # Vérifier que la configuration est résoluble
+    if not taquin.est_resoluble():
+        print(f"Cette configuration n'est pas résoluble ({taquin.resolubilite['raison']}).")
+        return None, infini
+    
+    debut_temps = time.time()
+    heuristique_func, heuristique_enfant = taquin.obtenir_heuristique(heuristique)
+    cle_but = taquin.etat_final.cle
+    
+    # Coût g, heuristique et parent (entier compact, code de la direction) des
+    # états atteints; les listes ouverte et incohérente associent leur entier
+    # compact à l'état. La file (priorité, compteur, g, état) est nettoyée
+    # paresseusement des entrées périmées.
+    couts = {taquin.etat_initial.cle: 0}
+    valeurs_h = {taquin.etat_initial.cle: heuristique_func(taquin.etat_initial)}
+    parents = {taquin.etat_initial.cle: (None, -1)}
+    ouverts = {taquin.etat_initial.cle: taquin.etat_initial}
+    fermes = set()
+    incoherents = {}
+    file_priorite = []
+    compteur = 0
+    nb_noeuds_explores = 0
+    poids = poids_initial
+    
+    def reordonner():
+        """Reconstruit la file avec le poids courant"""
+        nonlocal compteur
+        file_priorite.clear()
+        for cle, etat in ouverts.items():
+            compteur += 1
+            file_priorite.append((couts[cle] + poids * valeurs_h[cle], compteur, couts[cle], etat))
+        heapq.heapify(file_priorite)
+    
+    def ameliorer_chemin() -> bool:
+        """Développe les états tant que la solution courante peut être améliorée.
+        Retourne False si une limite est atteinte."""
+        nonlocal compteur, nb_noeuds_explores
+        while file_priorite:
+            priorite, _, g, etat = file_priorite[0]
+            if etat.cle not in ouverts or couts[etat.cle] != g:
+                heapq.heappop(file_priorite)
+                continue
+            if priorite >= couts.get(cle_but, infini):
+                return True
+            if nb_noeuds_explores >= limite_noeuds or time.time() - debut_temps >= limite_temps:
+                return False
+            heapq.heappop(file_priorite)
+            del ouverts[etat.cle]
+            fermes.add(etat.cle)
+            nb_noeuds_explores += 1
+            
+            code_parent = parents[etat.cle][1]
+            action = DIRECTIONS[code_parent] if code_parent >= 0 else None
+            for direction, voisin in taquin.obtenir_successeurs(etat, action):
+                cle = voisin.cle
+                if couts.get(cle, infini) <= g + 1:
+                    continue
+                couts[cle] = g + 1
+                parents[cle] = (etat.cle, CODES_DIRECTIONS[direction])
+                h = valeurs_h.get(cle)
+                if h is None:
+                    h = heuristique_enfant(etat, valeurs_h[etat.cle], voisin)
+                    valeurs_h[cle] = h
+                if cle in fermes:
+                    # Déjà développé avec ce poids: rouvert à l'itération suivante
+                    incoherents[cle] = voisin
+                else:
+                    ouverts[cle] = voisin
+                    compteur += 1
+                    heapq.heappush(file_priorite, (g + 1 + poids * h, compteur, g + 1, voisin))
+        return True
+    
+    def borne_sous_optimalite(termine: bool) -> float:
+        """Borne prouvée sur le rapport entre le coût trouvé et l'optimum;
+        le poids ne la plafonne que si l'itération est terminée"""
+        minorant = min((couts[cle] + valeurs_h[cle] for liste in (ouverts, incoherents) for cle in liste),
+                       default=infini)
+        if minorant >= couts[cle_but]:
+            return 1.0
+        return min(poids if termine else borne, couts[cle_but] / minorant)
+    
+    def construire_chemin() -> List[Tuple[str, Etat]]:
+        """Rejoue les directions depuis l'état initial jusqu'à l'état final"""
+        codes = []
+        cle = cle_but
+        while parents[cle][0] is not None:
+            cle, code = parents[cle]
+            codes.append(code)
+        chemin = []
+        etat = taquin.etat_initial
+        for code in reversed(codes):
+            etat = taquin.deplacer(etat, DIRECTIONS[code])
+            chemin.append((DIRECTIONS[code], etat))
+        return chemin
+    
+    meilleur_chemin = None
+    borne = infini
+    reordonner()
+    while True:
+        termine = ameliorer_chemin()
+        if cle_but in couts and (meilleur_chemin is None or couts[cle_but] < len(meilleur_chemin)):
+            meilleur_chemin = construire_chemin()
+            borne = borne_sous_optimalite(termine)
+            print(f"Solution améliorée: {len(meilleur_chemin)} étapes (poids {poids:g}, "
+                  f"borne de sous-optimalité {borne:.3f}) après {time.time() - debut_temps:.2f} s. "
+                  f"Noeuds explorés: {nb_noeuds_explores}")
+            if rappel is not None:
+                rappel(meilleur_chemin, borne)
+        elif meilleur_chemin is not None:
+            borne = borne_sous_optimalite(termine)
+        if not termine or meilleur_chemin is None or borne <= 1.0:
+            break
+        
+        # Abaisser le poids, rouvrir les états incohérents et reprendre
+        poids = max(1.0, poids - pas_poids)
+        ouverts.update(incoherents)
+        incoherents.clear()
+        fermes.clear()
+        reordonner()
+    
+    taquin.statistiques = {'noeuds_explores': nb_noeuds_explores, 'borne': borne, 'poids': poids}
+    if meilleur_chemin is None:
+        print(f"Pas de solution trouvée. Noeuds explorés: {nb_noeuds_explores}")
+        return None, infini
+    print(f"Solution trouvée! Noeuds explorés: {nb_noeuds_explores}")
+    print(f"Borne de sous-optimalité prouvée: {borne:.3f}")
+    return meilleur_chemin, borne
+
+
+def resolution_beam(taquin: Taquin, limite_noeuds=100000, limite_temps=30, heuristique='lineaire',
+                    largeur=100, facteur_elargissement=2, couches_memorisees=4,
+                    profondeur_max=None) -> Optional[List[Tuple[str, Etat]]]:
     """
-    Résout le Taquin par parcours en profondeur (DFS).
+    Résout le Taquin par recherche en faisceau (beam search).
     
-    L'algorithme DFS explore l'arbre de recherche en profondeur d'abord.
-    Il n'est pas optimal (ne garantit pas la solution la plus courte)
-    mais peut être efficace en espace mémoire.
+    La recherche avance couche par couche comme BFS, mais ne garde à chaque
+    profondeur que les `largeur` enfants de plus petite heuristique. Les
+    doublons sont éliminés dans la couche et avec les `couches_memorisees`
+    couches précédentes (par leur entier compact). Seuls les états du faisceau
+    courant sont conservés; pour reconstruire le chemin, chaque couche garde
+    l'indice du parent et la direction de ses états (deux tableaux compacts):
+    la mémoire est en O(largeur · profondeur). Si le faisceau s'éteint (plus
+    aucun enfant nouveau) ou s'égare au-delà de `profondeur_max`, la recherche
+    repart de l'état initial avec une largeur multipliée par
+    `facteur_elargissement` (1 pour ne pas relancer). La solution n'est pas
+    optimale en général.
     
     Args:
         taquin: Instance du jeu de Taquin
-        limite_profondeur: Profondeur maximale de recherche
+        limite_noeuds: Nombre maximal de nœuds à explorer
         limite_temps: Limite de temps en secondes
+        heuristique: Heuristique de classement (clé de Taquin.HEURISTIQUES)
+        largeur: Nombre d'états gardés par couche
+        facteur_elargissement: Multiplicateur de la largeur à chaque relance
+        couches_memorisees: Nombre de couches précédentes pour l'élimination des doublons
+        profondeur_max: Profondeur à partir de laquelle le faisceau est abandonné
+            (par défaut 10 fois le nombre de cases)
         
     Returns:
         Chemin de résolution ou None si pas de solution trouvée
@@ -764,65 +3661,122 @@ def resolution_dfs(taquin: Taquin, limite_profondeur=100, limite_temps=30) -> Op
         
     # Vérifier que la configuration est résoluble
     if not taquin.est_resoluble():
-        print("Cette configuration n'est pas résoluble.")
+        print(f"Cette configuration n'est pas résoluble ({taquin.resolubilite['raison']}).")
         return None
-        
-    # Initialisation
+    
+    # Le test du but ne porte que sur les enfants générés
+    etat_final = taquin.etat_final
+    if taquin.etat_initial == etat_final:
+        print("Solution trouvée! Noeuds explorés: 0")
+        return []
+    
     debut_temps = time.time()
-    pile = [NoeudRecherche(taquin.etat_initial)]
-    etats_visites = set()
+    heuristique_func, heuristique_enfant = taquin.obtenir_heuristique(heuristique)
+    if profondeur_max is None:
+        profondeur_max = 10 * taquin.taille_x * taquin.taille_y
     nb_noeuds_explores = 0
     
-    while pile and (time.time() - debut_temps) < limite_temps:
-        noeud_courant = pile.pop()  # Prendre le dernier nœud (LIFO - Last In, First Out)
-        nb_noeuds_explores += 1
+    while True:
+        # Faisceau courant: (h, état, code de la direction qui y mène); les
+        # couches gardent l'indice du parent et la direction de chaque état
+        faisceau = [(heuristique_func(taquin.etat_initial), taquin.etat_initial, -1)]
+        parents_couches = []
+        codes_couches = []
+        # Entiers compacts des couches récentes: chacun n'est que dans une couche,
+        # l'ensemble `vus` est leur union
+        recentes = deque([{taquin.etat_initial.cle}])
+        vus = {taquin.etat_initial.cle}
+        arrivee = None
         
-        # Vérifier si l'état est le but
-        if np.array_equal(noeud_courant.etat.grille, taquin.etat_final.grille):
-            print(f"Solution trouvée! Noeuds explorés: {nb_noeuds_explores}")
-            return noeud_courant.reconstruire_chemin()
+        while faisceau and arrivee is None and len(parents_couches) < profondeur_max:
+            if nb_noeuds_explores >= limite_noeuds or time.time() - debut_temps >= limite_temps:
+                print(f"Pas de solution trouvée. Noeuds explorés: {nb_noeuds_explores}")
+                return None
             
-        # Éviter les cycles et limiter la profondeur
-        etat_hash = hash(noeud_courant.etat)
-        if etat_hash in etats_visites or noeud_courant.profondeur >= limite_profondeur:
-            continue
+            # Développer tout le faisceau; les doublons de la couche sont écartés
+            couche = set()
+            candidats = []
+            for indice, (h_parent, etat, code) in enumerate(faisceau):
+                nb_noeuds_explores += 1
+                for direction, voisin in taquin.obtenir_successeurs(etat, DIRECTIONS[code] if code >= 0 else None):
+                    cle = voisin.cle
+                    if cle in vus or cle in couche:
+                        continue
+                    couche.add(cle)
+                    if voisin == etat_final:
+                        arrivee = (indice, CODES_DIRECTIONS[direction])
+                        break
+                    candidats.append((heuristique_enfant(etat, h_parent, voisin), len(candidats),
+                                      voisin, indice, CODES_DIRECTIONS[direction]))
+                if arrivee is not None:
+                    break
             
-        etats_visites.add(etat_hash)
+            if arrivee is None:
+                # Garder les meilleurs enfants (ordre de génération en cas d'égalité)
+                if len(candidats) > largeur:
+                    candidats = heapq.nsmallest(largeur, candidats)
+                faisceau = [(h, voisin, code) for h, _, voisin, _, code in candidats]
+                parents_couches.append(array('I', [indice for _, _, _, indice, _ in candidats]))
+                codes_couches.append(array('b', [code for _, _, _, _, code in candidats]))
+                cles = {voisin.cle for _, voisin, _ in faisceau}
+                recentes.append(cles)
+                vus |= cles
+                if len(recentes) > couches_memorisees + 1:
+                    vus -= recentes.popleft()
         
-        # Expanser le nœud si on n'a pas atteint la limite de profondeur
-        if noeud_courant.profondeur < limite_profondeur:
-            etats_voisins = taquin.obtenir_etats_voisins(noeud_courant.etat)
-            
-            # Les directions possibles
-            directions = ['haut', 'bas', 'gauche', 'droite']
-            
-            # Pour chaque direction possible, ajouter le nœud à la pile
-            for i, voisin in enumerate(etats_voisins):
-                action = directions[i] if i < len(directions) else "inconnu"
-                pile.append(NoeudRecherche(
-                    voisin, 
-                    noeud_courant, 
-                    action, 
-                    noeud_courant.profondeur + 1
-                ))
+        if arrivee is not None:
+            break
+        if facteur_elargissement <= 1:
+            print(f"Pas de solution trouvée. Noeuds explorés: {nb_noeuds_explores}")
+            return None
+        largeur *= facteur_elargissement
+        print(f"Faisceau {'éteint' if not faisceau else 'égaré'}, relance avec une largeur de {largeur}. "
+              f"Noeuds explorés: {nb_noeuds_explores}")
     
-    # Si on sort de la boucle, c'est qu'on n'a pas trouvé de solution
-    print(f"Pas de solution trouvée. Noeuds explorés: {nb_noeuds_explores}")
-    return None
+    print(f"Solution trouvée! Noeuds explorés: {nb_noeuds_explores}")
+    
+    # Remonter les indices des parents couche par couche
+    indice, code = arrivee
+    codes = [code]
+    for parents, codes_couche in zip(reversed(parents_couches), reversed(codes_couches)):
+        codes.append(codes_couche[indice])
+        indice = parents[indice]
+    
+    chemin = []
+    etat = taquin.etat_initial
+    for code in reversed(codes):
+        etat = taquin.deplacer(etat, DIRECTIONS[code])
+        chemin.append((DIRECTIONS[code], etat))
+    return chemin
 
 
-def resolution_bfs(taquin: Taquin, limite_noeuds=100000, limite_temps=30) -> Optional[List[Tuple[str, Etat]]]:
+def resolution_mm(taquin: Taquin, limite_noeuds=100000, limite_temps=30,
+                  heuristique='marche') -> Optional[List[Tuple[str, Etat]]]:
     """
-    Résout le Taquin par parcours en largeur (BFS).
+    Résout le Taquin par recherche heuristique bidirectionnelle MM.
     
-    L'algorithme BFS explore l'arbre de recherche niveau par niveau.
-    Il garantit de trouver la solution optimale (avec le moins d'étapes)
-    mais peut être coûteux en mémoire.
+    Une recherche part de l'état initial avec l'heuristique vers l'état
+    final, l'autre de l'état final avec la même heuristique calculée vers
+    l'état initial (Taquin.inverser). Chaque nœud ouvert a la priorité
+    pr(n) = max(f(n), 2 g(n)): aucun des deux côtés ne dépasse la moitié du
+    coût optimal C*. Le côté dont la plus petite priorité est la plus faible
+    est développé; un état atteint par les deux côtés donne un chemin de
+    coût U. La recherche s'arrête dès que U <= max(C, fmin avant,
+    fmin arrière, gmin avant + gmin arrière + 1), où C est la plus petite
+    priorité: le chemin est alors optimal si l'heuristique est admissible.
+    Les nœuds développés de chaque côté, ainsi que les nœuds générés et
+    ajoutés aux files, sont comptés dans taquin.statistiques.
+    
+    Avec 'pdb', seul le côté avant utilise les bases de motifs: celles de
+    l'état initial seraient reconstruites à chaque résolution, le cache
+    étant indexé par l'état final. Le côté arrière utilise alors la distance
+    de marche (ou Manhattan si elle est indisponible), elle aussi admissible.
     
     Args:
         taquin: Instance du jeu de Taquin
-        limite_noeuds: Nombre maximal de nœuds à explorer
+        limite_noeuds: Nombre maximal de nœuds à explorer (des deux côtés)
         limite_temps: Limite de temps en secondes
+        heuristique: Heuristique à utiliser (clé de Taquin.HEURISTIQUES)
         
     Returns:
         Chemin de résolution ou None si pas de solution trouvée
@@ -832,62 +3786,175 @@ def resolution_bfs(taquin: Taquin, limite_noeuds=100000, limite_temps=30) -> Opt
         
     # Vérifier que la configuration est résoluble
     if not taquin.est_resoluble():
-        print("Cette configuration n'est pas résoluble.")
+        print(f"Cette configuration n'est pas résoluble ({taquin.resolubilite['raison']}).")
         return None
-        
-    # Initialisation
+    
     debut_temps = time.time()
-    file = deque([NoeudRecherche(taquin.etat_initial)])  # File FIFO (First In, First Out)
-    etats_visites = set([hash(taquin.etat_initial)])
-    nb_noeuds_explores = 0
+    infini = float('inf')
+    departs = (taquin.etat_initial, taquin.etat_final)
+    # Heuristique vers l'état final (côté 0) et vers l'état initial (côté 1)
+    heuristique_arriere = heuristique
+    if heuristique == 'pdb':
+        print("Bases de motifs non construites pour le côté arrière. Utilisation de la distance de marche.")
+        heuristique_arriere = 'marche'
+    heuristiques = (taquin.obtenir_heuristique(heuristique),
+                    taquin.inverser().obtenir_heuristique(heuristique_arriere))
     
-    # Les directions possibles
-    directions = ['haut', 'bas', 'gauche', 'droite']
+    # Par côté: coût g et heuristique des états atteints, parent (entier compact,
+    # code de la direction) et états fermés; les files (priorité, f, g) sont
+    # nettoyées paresseusement des entrées périmées
+    couts = ({}, {})
+    valeurs_h = ({}, {})
+    parents = ({}, {})
+    fermes = (set(), set())
+    files = tuple(([], [], []) for _ in range(2))
+    nb_explores = [0, 0]
+    nb_generes = 0
+    nb_ajoutes = 0
+    compteur = 0
     
-    while file and nb_noeuds_explores < limite_noeuds and (time.time() - debut_temps) < limite_temps:
-        noeud_courant = file.popleft()  # Prendre le premier nœud (FIFO)
-        nb_noeuds_explores += 1
-        
-        # Vérifier si l'état est le but
-        if np.array_equal(noeud_courant.etat.grille, taquin.etat_final.grille):
-            print(f"Solution trouvée! Noeuds explorés: {nb_noeuds_explores}")
-            return noeud_courant.reconstruire_chemin()
+    def ouvrir(cote: int, etat: Etat, g: int, h: float):
+        """Ajoute (ou rouvre) un état dans les files d'un côté"""
+        nonlocal compteur
+        compteur += 1
+        file_priorite, file_f, file_g = files[cote]
+        heapq.heappush(file_priorite, (max(g + h, 2 * g), g, compteur, etat))
+        heapq.heappush(file_f, (g + h, compteur, etat.cle, g))
+        heapq.heappush(file_g, (g, compteur, etat.cle, g))
+    
+    def minimum(cote: int, numero: int) -> float:
+        """Plus petite valeur valide de la file `numero` d'un côté (infini si vide)"""
+        file = files[cote][numero]
+        while file:
+            entree = file[0]
+            cle, g = (entree[3].cle, entree[1]) if numero == 0 else (entree[2], entree[3])
+            if cle not in fermes[cote] and couts[cote][cle] == g:
+                return entree[0]
+            heapq.heappop(file)
+        return infini
+    
+    for cote in (0, 1):
+        h = heuristiques[cote][0](departs[cote])
+        couts[cote][departs[cote].cle] = 0
+        valeurs_h[cote][departs[cote].cle] = h
+        parents[cote][departs[cote].cle] = (None, -1)
+        ouvrir(cote, departs[cote], 0, h)
+    
+    # Coût du meilleur chemin connu et état de rencontre
+    meilleur_cout = 0 if departs[0] == departs[1] else infini
+    rencontre = departs[0].cle if meilleur_cout == 0 else None
+    
+    while True:
+        priorites = (minimum(0, 0), minimum(1, 0))
+        borne = max(min(priorites), minimum(0, 1), minimum(1, 1), minimum(0, 2) + minimum(1, 2) + 1)
+        if meilleur_cout <= borne or min(priorites) == infini:
+            break
+        if sum(nb_explores) >= limite_noeuds or time.time() - debut_temps >= limite_temps:
+            meilleur_cout = infini
+            break
         
-        # Expanser le nœud
-        etats_voisins = taquin.obtenir_etats_voisins(noeud_courant.etat)
+        # Développer le côté de plus petite priorité
+        cote = 0 if priorites[0] <= priorites[1] else 1
+        _, g, _, etat = heapq.heappop(files[cote][0])
+        fermes[cote].add(etat.cle)
+        nb_explores[cote] += 1
+        heuristique_enfant = heuristiques[cote][1]
+        code_parent = parents[cote][etat.cle][1]
+        action = DIRECTIONS[code_parent] if code_parent >= 0 else None
         
-        # Pour chaque voisin
-        for i, voisin in enumerate(etats_voisins):
-            etat_hash = hash(voisin)
-            if etat_hash not in etats_visites:
-                etats_visites.add(etat_hash)
-                action = directions[i] if i < len(directions) else "inconnu"
-                file.append(NoeudRecherche(
-                    voisin, 
-                    noeud_courant, 
-                    action, 
-                    noeud_courant.profondeur + 1
-                ))
+        for direction, voisin in taquin.obtenir_successeurs(etat, action):
+            nb_generes += 1
+            cle = voisin.cle
+            g_voisin = g + 1
+            if couts[cote].get(cle, infini) <= g_voisin:
+                continue
+            nb_ajoutes += 1
+            couts[cote][cle] = g_voisin
+            parents[cote][cle] = (etat.cle, CODES_DIRECTIONS[direction])
+            fermes[cote].discard(cle)  # Réouverture si un chemin plus court est trouvé
+            h = valeurs_h[cote].get(cle)
+            if h is None:
+                h = heuristique_enfant(etat, valeurs_h[cote][etat.cle], voisin)
+                valeurs_h[cote][cle] = h
+            ouvrir(cote, voisin, g_voisin, h)
+            
+            # L'autre côté a-t-il déjà atteint cet état?
+            g_autre = couts[1 - cote].get(cle)
+            if g_autre is not None and g_voisin + g_autre < meilleur_cout:
+                meilleur_cout = g_voisin + g_autre
+                rencontre = cle
     
-    # Si on sort de la boucle, c'est qu'on n'a pas trouvé de solution
-    print(f"Pas de solution trouvée. Noeuds explorés: {nb_noeuds_explores}")
-    return None
+    taquin.statistiques = {'noeuds_explores': sum(nb_explores),
+                           'noeuds_explores_avant': nb_explores[0],
+                           'noeuds_explores_arriere': nb_explores[1],
+                           'noeuds_generes': nb_generes,
+                           'noeuds_ajoutes': nb_ajoutes}
+    if meilleur_cout == infini:
+        print(f"Pas de solution trouvée. Noeuds explorés: {sum(nb_explores)} "
+              f"(depuis le départ: {nb_explores[0]}, depuis le but: {nb_explores[1]})")
+        return None
+    print(f"Solution trouvée! Noeuds explorés: {sum(nb_explores)} "
+          f"(depuis le départ: {nb_explores[0]}, depuis le but: {nb_explores[1]})")
+    
+    # Joindre les deux chaînes de parents; la moitié arrière est parcourue en sens inverse
+    codes = []
+    cle = rencontre
+    while parents[0][cle][0] is not None:
+        cle, code = parents[0][cle]
+        codes.append(code)
+    codes.reverse()
+    cle = rencontre
+    while parents[1][cle][0] is not None:
+        cle, code = parents[1][cle]
+        codes.append(code ^ 1)
+    
+    chemin = []
+    etat = taquin.etat_initial
+    for code in codes:
+        etat = taquin.deplacer(etat, DIRECTIONS[code])
+        chemin.append((DIRECTIONS[code], etat))
+    return chemin
 
 
-def resolution_best_first(taquin: Taquin, limite_noeuds=100000, limite_temps=30, 
-                          heuristique='combinee') -> Optional[List[Tuple[str, Etat]]]:
+class _ArretRecherche(Exception):
+    """Limite de nœuds ou de temps atteinte au fond d'une recherche récursive"""
+
+
+def resolution_ida_star(taquin: Taquin, limite_noeuds=10000000, limite_temps=30,
+                        heuristique='marche', memoire_transpositions=0,
+                        travailleurs=1) -> Optional[List[Tuple[str, Etat]]]:
     """
-    Résout le Taquin par parcours meilleur d'abord (Best-First Search).
+    Résout le Taquin par IDA* (A* à approfondissement itératif).
     
-    L'algorithme Best-First explore les nœuds selon une fonction heuristique
-    qui estime leur "proximité" à l'état but. Il n'est pas toujours optimal
-    mais explore généralement moins de nœuds que BFS.
+    Une recherche en profondeur est relancée avec un seuil croissant sur
+    f(n) = g(n) + h(n): chaque itération coupe les nœuds dont f dépasse le
+    seuil, et le seuil suivant est le plus petit f coupé. Aucun ensemble de
+    nœuds n'est conservé: une seule grille (liste de codes) est modifiée en
+    place à l'aller et restaurée au retour, le chemin courant est un tableau
+    de codes de directions, et le mouvement inverse du précédent n'est pas
+    essayé. La mémoire reste proportionnelle à la profondeur. Le chemin
+    retourné est optimal si l'heuristique est admissible ('marche', 'pdb',
+    'manhattan'); 'lineaire' (2 par paire inversée) et 'combinee' peuvent
+    surestimer la distance.
+    
+    Avec `memoire_transpositions` > 0, une TableTransposition de cette taille
+    retient la borne f remontée des états explorés: une transposition déjà
+    explorée au même coût ou moins est coupée sans être développée, et la
+    borne apprise relève l'heuristique aux itérations suivantes.
+    
+    Avec plusieurs travailleurs, chaque itération est découpée en
+    sous-problèmes répartis entre les processus d'un pool (voir
+    _resolution_ida_star_parallele); la table de transposition n'est alors
+    pas utilisée.
     
     Args:
         taquin: Instance du jeu de Taquin
-        limite_noeuds: Nombre maximal de nœuds à explorer
+        limite_noeuds: Nombre maximal de nœuds à explorer (toutes itérations confondues)
         limite_temps: Limite de temps en secondes
-        heuristique: Heuristique à utiliser ('lineaire' ou 'combinee')
+        heuristique: Heuristique à utiliser (clé de Taquin.HEURISTIQUES disposant
+            d'un calcul incrémental, ou 'marche')
+        memoire_transpositions: Mémoire de la table de transposition en Mo (0: sans table)
+        travailleurs: Nombre de processus (1: recherche séquentielle)
         
     Returns:
         Chemin de résolution ou None si pas de solution trouvée
@@ -897,176 +3964,619 @@ def resolution_best_first(taquin: Taquin, limite_noeuds=100000, limite_temps=30,
         
     # Vérifier que la configuration est résoluble
     if not taquin.est_resoluble():
-        print("Cette configuration n'est pas résoluble.")
+        print(f"Cette configuration n'est pas résoluble ({taquin.resolubilite['raison']}).")
         return None
-        
-    # Sélectionner l'heuristique appropriée
-    heuristique_func = None
-    if heuristique == 'lineaire':
-        heuristique_func = taquin.calculer_heuristique_lineaire
-    elif heuristique == 'combinee':
-        heuristique_func = taquin.calculer_heuristique_combinee
-    else:
-        print(f"Heuristique '{heuristique}' non reconnue. Utilisation de l'heuristique combinée par défaut.")
-        heuristique_func = taquin.calculer_heuristique_combinee
-        
-    # Initialisation
-    debut_temps = time.time()
-    priorite_initiale = heuristique_func(taquin.etat_initial)
     
-    # File de priorité : (priorité, compteur, nœud)
-    # Le compteur sert à départager les nœuds de même priorité
-    import heapq
-    compteur = 0
-    file_priorite = [(priorite_initiale, compteur, NoeudPriorise(taquin.etat_initial, priorite=priorite_initiale))]
-    heapq.heapify(file_priorite)
+    # L'heuristique doit se mettre à jour sur la grille mutable, coup par coup
+    marche = heuristique == 'marche' and taquin.tables_marche is not None
+    if heuristique == 'marche' and not marche:
+        print("Distance de marche indisponible pour cette grille (plus de 4 lignes ou colonnes, "
+              "ou lettres répétées). Utilisation de la distance de Manhattan.")
+        heuristique = 'manhattan'
+    elif not marche and heuristique not in Taquin.HEURISTIQUES_INCREMENTALES:
+        print(f"Heuristique '{heuristique}' non incrémentale. Utilisation de l'heuristique linéaire par défaut.")
+        heuristique = 'lineaire'
+    if travailleurs > 1:
+        if memoire_transpositions > 0:
+            print("Table de transposition non utilisée par l'IDA* parallèle.")
+        return _resolution_ida_star_parallele(taquin, limite_noeuds, limite_temps, heuristique, travailleurs)
+    complete, _ = taquin.obtenir_heuristique(heuristique)
+    if not marche:
+        delta = getattr(taquin, Taquin.HEURISTIQUES_INCREMENTALES[heuristique])
+    else:
+        distances_lignes = taquin.tables_marche[0].distances
+        distances_colonnes = taquin.tables_marche[1].distances
+        indices_enfant = taquin.indices_marche_enfant
     
-    etats_visites = set([hash(taquin.etat_initial)])
+    debut_temps = time.time()
+    plateau = list(taquin.etat_initial.cases)
+    finales = list(taquin.etat_final.cases)
+    deplacements = table_deplacements(taquin.taille_x, taquin.taille_y)
+    coups = array('b')  # Codes des directions du chemin courant, indexés par profondeur
     nb_noeuds_explores = 0
+    seuil = complete(taquin.etat_initial)
+    infini = float('inf')
+    trouve = -1.0  # Valeur de retour de chercher quand le but est atteint
     
-    # Les directions possibles
-    directions = ['haut', 'bas', 'gauche', 'droite']
+    # Clé compacte et hachage de Zobrist de la grille, tenus à jour coup par coup pour la table
+    codage = taquin.codage
+    table = None
+    if memoire_transpositions > 0:
+        table = TableTransposition(codage, memoire_transpositions * 1024 * 1024)
+        decalages, zobrist, nb_cases = codage.decalages, codage.zobrist, codage.nb_cases
     
-    while file_priorite and nb_noeuds_explores < limite_noeuds and (time.time() - debut_temps) < limite_temps:
-        _, _, noeud_courant = heapq.heappop(file_priorite)
-        nb_noeuds_explores += 1
+    def chercher(g: int, h: float, vide: int, interdit: int, indices,
+                 cle: int, hachage: int, h_parent: float) -> float:
+        """
+        Explore sous le nœud courant avec le seuil courant.
         
-        # Vérifier si l'état est le but
-        if np.array_equal(noeud_courant.etat.grille, taquin.etat_final.grille):
-            print(f"Solution trouvée! Noeuds explorés: {nb_noeuds_explores}")
-            return noeud_courant.reconstruire_chemin()
+        `h` est la valeur de l'heuristique (mise à jour coup par coup) et
+        `h_parent` le minorant de la distance du parent au but.
         
-        # Expanser le nœud
-        etats_voisins = taquin.obtenir_etats_voisins(noeud_courant.etat)
+        Returns:
+            `trouve` si le but est atteint (chemin dans `coups`), sinon le plus petit f coupé
+        """
+        nonlocal nb_noeuds_explores
+        estimation = h
+        if table is not None:
+            entree = table.consulter(hachage, cle)
+            if entree is not None:
+                g_entree, borne, distance, iteration_entree = entree
+                if iteration_entree == iteration and g >= g_entree:
+                    # Déjà exploré dans cette itération avec au moins autant de marge
+                    return borne + g - g_entree
+                if distance > estimation:
+                    estimation = distance
+        f = g + estimation
+        if f > seuil:
+            return f
+        # Toute heuristique disponible vaut au moins 1 hors du but
+        if h < 1 and plateau == finales:
+            return trouve
         
-        # Pour chaque voisin
-        for i, voisin in enumerate(etats_voisins):
-            etat_hash = hash(voisin)
-            if etat_hash not in etats_visites:
-                etats_visites.add(etat_hash)
-                action = directions[i] if i < len(directions) else "inconnu"
-                
-                # Calculer la priorité en utilisant l'heuristique sélectionnée
-                # Dans Best-First, la priorité est simplement la valeur heuristique
-                priorite = heuristique_func(voisin)
-                compteur += 1
-                
-                nouveau_noeud = NoeudPriorise(
-                    voisin, 
-                    noeud_courant, 
-                    action, 
-                    noeud_courant.profondeur + 1,
-                    priorite=priorite
-                )
-                
-                heapq.heappush(file_priorite, (priorite, compteur, nouveau_noeud))
+        nb_noeuds_explores += 1
+        if nb_noeuds_explores >= limite_noeuds or (
+                not nb_noeuds_explores & 0x3FF and time.time() - debut_temps >= limite_temps):
+            raise _ArretRecherche
+        
+        minimum = infini
+        for cible, code in deplacements[vide]:
+            if code == interdit:
+                continue
+            # Appliquer le coup: la tuile de `cible` glisse dans la case vide
+            tuile = plateau[cible]
+            plateau[vide] = tuile
+            plateau[cible] = 0
+            if marche:
+                indices_suivants = indices_enfant(indices, tuile, cible, vide)
+                h_enfant = distances_lignes[indices_suivants[0]] + distances_colonnes[indices_suivants[1]]
+            else:
+                indices_suivants = None
+                h_enfant = h + delta(plateau, tuile, cible, vide)
+            if table is not None:
+                cle_enfant = cle ^ (tuile << decalages[cible]) ^ (tuile << decalages[vide])
+                hachage_enfant = hachage ^ zobrist[tuile * nb_cases + cible] ^ zobrist[tuile * nb_cases + vide]
+            else:
+                cle_enfant = hachage_enfant = 0
+            coups[g] = code
+            resultat = chercher(g + 1, h_enfant, cible, code ^ 1, indices_suivants,
+                                cle_enfant, hachage_enfant, estimation)
+            if resultat == trouve:
+                return trouve
+            if resultat < minimum:
+                minimum = resultat
+            # Annuler le coup
+            plateau[cible] = tuile
+            plateau[vide] = 0
+        
+        if table is not None:
+            # Le mouvement vers le parent n'a pas été essayé: par lui, la distance
+            # au but vaut au moins 1 + h_parent
+            table.enregistrer(hachage, cle, g, minimum, min(minimum - g, 1 + h_parent), iteration)
+        return minimum
     
-    # Si on sort de la boucle, c'est qu'on n'a pas trouvé de solution
-    print(f"Pas de solution trouvée. Noeuds explorés: {nb_noeuds_explores}")
-    return None
+    indices_initiaux = taquin.indices_marche(plateau) if marche else None
+    h_initial = seuil
+    etat_initial = taquin.etat_initial
+    iteration = 0
+    try:
+        while seuil < infini:
+            # Le chemin ne peut pas dépasser le seuil: le tableau est alloué une fois par itération
+            if len(coups) <= seuil:
+                coups.extend([0] * (int(seuil) + 1 - len(coups)))
+            iteration += 1
+            prochain_seuil = chercher(0, h_initial, etat_initial.vide, -1, indices_initiaux,
+                                      etat_initial.cle, hash(etat_initial), infini)
+            if prochain_seuil == trouve:
+                break
+            print(f"Seuil {seuil} épuisé, nouveau seuil {prochain_seuil}. Noeuds explorés: {nb_noeuds_explores}")
+            seuil = prochain_seuil
+        else:
+            print(f"Pas de solution trouvée. Noeuds explorés: {nb_noeuds_explores}")
+            return None
+    except _ArretRecherche:
+        print(f"Pas de solution trouvée. Noeuds explorés: {nb_noeuds_explores}")
+        return None
+    finally:
+        taquin.statistiques = {'noeuds_explores': nb_noeuds_explores}
+        if table is not None:
+            print(f"Table de transposition: {table.succes} succès, {table.echecs} échecs, "
+                  f"{table.evictions} évictions ({table.taille}/{table.capacite} entrées, "
+                  f"{table.memoire_octets() / (1024 * 1024):.1f} Mo)")
+    
+    print(f"Solution trouvée! Noeuds explorés: {nb_noeuds_explores}")
+    
+    # Rejouer les directions depuis l'état initial pour construire le chemin
+    chemin = []
+    etat = taquin.etat_initial
+    profondeur = 0
+    while etat != taquin.etat_final:
+        action = DIRECTIONS[coups[profondeur]]
+        etat = taquin.deplacer(etat, action)
+        chemin.append((action, etat))
+        profondeur += 1
+    return chemin
 
 
-def resolution_a_star(taquin: Taquin, limite_noeuds=100000, limite_temps=30, 
-                    heuristique='combinee') -> Optional[List[Tuple[str, Etat]]]:
+# Contexte en lecture seule des processus d'IDA* parallèle (voir _initialiser_ida_parallele)
+_CONTEXTE_IDA_PARALLELE: Dict[str, Any] = {}
+
+
+def _initialiser_ida_parallele(taille: Tuple[int, int], caracteres: Tuple[str, ...], finale: Tuple[str, ...],
+                               vide_final: int, plateau: List[int], heuristique: str,
+                               taille_max_motifs: Optional[int], dossier: str, limite_noeuds: int,
+                               echeance: float, compteur, arret):
     """
-    Résout le Taquin par algorithme A* (A-Star).
+    Initialise un processus du pool d'IDA* parallèle.
     
-    L'algorithme A* combine BFS avec une heuristique. Il considère à la fois
-    le coût réel du chemin parcouru (g(n)) et l'estimation jusqu'au but (h(n)).
-    C'est un algorithme optimal si l'heuristique est admissible.
+    Les arguments sont de simples données (dimensions, alphabet du codage,
+    caractères de l'état final, codes de l'état initial), transmissibles
+    quel que soit le mode de démarrage des processus (fork, spawn ou
+    forkserver). Le processus reconstruit un Taquin réduit à son état final:
+    ses tables d'heuristique (distance de marche, base de motifs), déjà
+    construites par le processus principal, sont relues dans le cache disque
+    `dossier` et projetées en mémoire, donc partagées en lecture entre les
+    processus. `compteur` (multiprocessing.Value) totalise les nœuds de tous
+    les processus et `arret` (multiprocessing.Event) annule les recherches
+    en cours.
+    """
+    os.environ['TAQUIN_CACHE_DIR'] = dossier
+    taille_x, taille_y = taille
+    codage = CodageEtat.pour(taille_x, taille_y, caracteres, caracteres[0])
+    taquin = Taquin(taille_x, taille_y)
+    taquin.caractere_vide = caracteres[0]
+    taquin.taille_max_motifs = taille_max_motifs
+    taquin.etat_final = Etat(np.array(finale).reshape(taille_x, taille_y), divmod(vide_final, taille_y), codage)
+    if heuristique == 'pdb':
+        # Relire les tables avant la première tâche, sans le message de la propriété
+        taquin._base_motifs = BaseMotifs(taquin.etat_final, taille_max_motifs)
+    
+    contexte = _CONTEXTE_IDA_PARALLELE
+    contexte['plateau'] = plateau
+    contexte['finales'] = list(taquin.etat_final.cases)
+    contexte['deplacements'] = table_deplacements(taille_x, taille_y)
+    contexte['marche'] = heuristique == 'marche'
+    if contexte['marche']:
+        contexte['distances'] = (taquin.tables_marche[0].distances, taquin.tables_marche[1].distances)
+        contexte['indices_enfant'] = taquin.indices_marche_enfant
+    else:
+        contexte['delta'] = getattr(taquin, Taquin.HEURISTIQUES_INCREMENTALES[heuristique])
+    contexte['limite_noeuds'] = limite_noeuds
+    contexte['echeance'] = echeance
+    contexte['compteur'] = compteur
+    contexte['arret'] = arret
+
+
+def _sous_probleme_ida(tache) -> Tuple[str, int, Any]:
+    """
+    Recherche IDA* bornée sous un nœud de la découpe (exécutée par le pool).
     
     Args:
-        taquin: Instance du jeu de Taquin
-        limite_noeuds: Nombre maximal de nœuds à explorer
-        limite_temps: Limite de temps en secondes
-        heuristique: Heuristique à utiliser ('lineaire' ou 'combinee')
+        tache: (seuil, codes des directions depuis la racine, case vide, h, indices de marche)
         
     Returns:
-        Chemin de résolution ou None si pas de solution trouvée
+        ('trouve', nœuds explorés, codes du chemin complet), ('epuise', nœuds
+        explorés, plus petit f coupé) ou ('arret', nœuds explorés, None) si
+        la recherche est annulée ou une limite atteinte
     """
-    if taquin.etat_initial is None or taquin.etat_final is None:
-        return None
+    seuil, codes, vide, h, indices = tache
+    contexte = _CONTEXTE_IDA_PARALLELE
+    deplacements = contexte['deplacements']
+    finales = contexte['finales']
+    marche = contexte['marche']
+    if marche:
+        distances_lignes, distances_colonnes = contexte['distances']
+        indices_enfant = contexte['indices_enfant']
+    else:
+        delta = contexte['delta']
+    limite_noeuds, echeance = contexte['limite_noeuds'], contexte['echeance']
+    compteur, arret = contexte['compteur'], contexte['arret']
+    
+    # Rejouer les directions de la découpe depuis l'état initial
+    plateau = list(contexte['plateau'])
+    case_vide = plateau.index(0)
+    for code in codes:
+        for cible, code_possible in deplacements[case_vide]:
+            if code_possible == code:
+                plateau[case_vide], plateau[cible] = plateau[cible], 0
+                case_vide = cible
+                break
+    coups = array('b', codes)
+    coups.extend([0] * (int(seuil) + 1 - len(coups)))
+    nb_noeuds_explores = 0
+    longueur = 0
+    infini = float('inf')
+    trouve = -1.0
+    
+    def chercher(g: int, h: float, vide: int, interdit: int, indices) -> float:
+        """Même exploration que resolution_ida_star, sans table de transposition"""
+        nonlocal nb_noeuds_explores, longueur
+        f = g + h
+        if f > seuil:
+            return f
+        if h < 1 and plateau == finales:
+            longueur = g
+            return trouve
         
-    # Vérifier que la configuration est résoluble
-    if not taquin.est_resoluble():
-        print("Cette configuration n'est pas résoluble.")
-        return None
+        nb_noeuds_explores += 1
+        if not nb_noeuds_explores & 0x3FF:
+            with compteur.get_lock():
+                compteur.value += 0x400
+                total = compteur.value
+            if total >= limite_noeuds or arret.is_set() or time.time() >= echeance:
+                raise _ArretRecherche
         
-    # Sélectionner l'heuristique appropriée
-    heuristique_func = None
-    if heuristique == 'lineaire':
-        heuristique_func = taquin.calculer_heuristique_lineaire
-    elif heuristique == 'combinee':
-        heuristique_func = taquin.calculer_heuristique_combinee
+        minimum = infini
+        for cible, code in deplacements[vide]:
+            if code == interdit:
+                continue
+            tuile = plateau[cible]
+            plateau[vide] = tuile
+            plateau[cible] = 0
+            if marche:
+                indices_suivants = indices_enfant(indices, tuile, cible, vide)
+                h_enfant = distances_lignes[indices_suivants[0]] + distances_colonnes[indices_suivants[1]]
+            else:
+                indices_suivants = None
+                h_enfant = h + delta(plateau, tuile, cible, vide)
+            coups[g] = code
+            resultat = chercher(g + 1, h_enfant, cible, code ^ 1, indices_suivants)
+            if resultat == trouve:
+                return trouve
+            if resultat < minimum:
+                minimum = resultat
+            plateau[cible] = tuile
+            plateau[vide] = 0
+        return minimum
+    
+    try:
+        if arret.is_set():
+            raise _ArretRecherche
+        resultat = chercher(len(codes), h, vide, codes[-1] ^ 1 if codes else -1, indices)
+    except _ArretRecherche:
+        return 'arret', nb_noeuds_explores, None
+    finally:
+        # Compter les nœuds restants, pour la limite commune à tous les processus
+        with compteur.get_lock():
+            compteur.value += nb_noeuds_explores & 0x3FF
+    if resultat == trouve:
+        return 'trouve', nb_noeuds_explores, list(coups[:longueur])
+    return 'epuise', nb_noeuds_explores, resultat
+
+
+def _resolution_ida_star_parallele(taquin: Taquin, limite_noeuds: int, limite_temps: float,
+                                   heuristique: str, travailleurs: int,
+                                   nb_sous_problemes: Optional[int] = None) -> Optional[List[Tuple[str, Etat]]]:
+    """
+    IDA* parallèle par découpe de la racine.
+    
+    À chaque seuil, le processus principal développe l'arbre couche par
+    couche (les doublons d'une même couche sont fusionnés: leurs sous-arbres
+    sont identiques) jusqu'à obtenir au moins `nb_sous_problemes` nœuds.
+    Chaque nœud de cette découpe devient un sous-problème, exploré par un
+    processus d'un multiprocessing.Pool avec le seuil courant. Dès qu'un
+    sous-problème atteint le but, les autres sont annulés: tout chemin
+    trouvé sous le seuil est optimal, puisque les seuils précédents sont
+    épuisés. Sinon, le seuil suivant est le plus petit f coupé, dans la
+    découpe comme dans tous les sous-problèmes.
+    
+    `heuristique` est déjà vérifiée par resolution_ida_star ('marche' si
+    les tables sont disponibles, sinon une heuristique incrémentale).
+    """
+    import multiprocessing
+    
+    debut_temps = time.time()
+    complete, _ = taquin.obtenir_heuristique(heuristique)
+    marche = heuristique == 'marche'
+    if marche:
+        distances_lignes = taquin.tables_marche[0].distances
+        distances_colonnes = taquin.tables_marche[1].distances
+        indices_enfant = taquin.indices_marche_enfant
     else:
-        print(f"Heuristique '{heuristique}' non reconnue. Utilisation de l'heuristique combinée par défaut.")
-        heuristique_func = taquin.calculer_heuristique_combinee
+        delta = getattr(taquin, Taquin.HEURISTIQUES_INCREMENTALES[heuristique])
+    if nb_sous_problemes is None:
+        nb_sous_problemes = max(2000, 64 * travailleurs)
+    
+    codage = taquin.codage
+    decalages, masque = codage.decalages, codage.masque
+    deplacements = table_deplacements(taquin.taille_x, taquin.taille_y)
+    etat_initial = taquin.etat_initial
+    cle_but = taquin.etat_final.cle
+    plateau_initial = list(etat_initial.cases)
+    # Calculer h construit aussi les tables de l'heuristique (et les écrit dans
+    # le cache disque, où les processus du pool les relisent)
+    seuil = h_initial = complete(etat_initial)
+    indices_initiaux = taquin.indices_marche(plateau_initial) if marche else None
+    infini = float('inf')
+    nb_noeuds_explores = 0
+    codes_solution = None if etat_initial.cle != cle_but else []
+    
+    # Compteur, événement et pool d'un même contexte (mode de démarrage par défaut)
+    contexte = multiprocessing.get_context()
+    compteur = contexte.Value('q', 0)
+    arret = contexte.Event()
+    pool = contexte.Pool(travailleurs, initializer=_initialiser_ida_parallele,
+                         initargs=((taquin.taille_x, taquin.taille_y), codage.caracteres,
+                                   tuple(codage.caracteres[code] for code in taquin.etat_final.cases),
+                                   taquin.etat_final.vide, plateau_initial, heuristique,
+                                   taquin.taille_max_motifs, dossier_cache(), limite_noeuds,
+                                   debut_temps + limite_temps, compteur, arret))
+    try:
+        while codes_solution is None:
+            if seuil == infini:
+                print(f"Pas de solution trouvée. Noeuds explorés: {nb_noeuds_explores}")
+                return None
+            
+            # Découpe: couche -> {entier compact: (codes, case vide, h, indices, plateau)}
+            minimum = infini
+            couche = {etat_initial.cle: ((), etat_initial.vide, h_initial, indices_initiaux, plateau_initial)}
+            g = 0
+            while couche and len(couche) < nb_sous_problemes and codes_solution is None:
+                suivante = {}
+                for cle, (codes, vide, h, indices, plateau) in couche.items():
+                    nb_noeuds_explores += 1
+                    interdit = codes[-1] ^ 1 if codes else -1
+                    for cible, code in deplacements[vide]:
+                        if code == interdit:
+                            continue
+                        tuile = plateau[cible]
+                        enfant = plateau[:]
+                        enfant[vide] = tuile
+                        enfant[cible] = 0
+                        if marche:
+                            indices_suivants = indices_enfant(indices, tuile, cible, vide)
+                            h_enfant = distances_lignes[indices_suivants[0]] + distances_colonnes[indices_suivants[1]]
+                        else:
+                            indices_suivants = None
+                            h_enfant = h + delta(enfant, tuile, cible, vide)
+                        if g + 1 + h_enfant > seuil:
+                            minimum = min(minimum, g + 1 + h_enfant)
+                            continue
+                        cle_enfant = cle ^ (tuile << decalages[cible]) ^ (tuile << decalages[vide])
+                        if cle_enfant == cle_but:
+                            codes_solution = list(codes) + [code]
+                            break
+                        if cle_enfant not in suivante:
+                            suivante[cle_enfant] = (codes + (code,), cible, h_enfant, indices_suivants, enfant)
+                    if codes_solution is not None:
+                        break
+                couche = suivante
+                g += 1
+            if codes_solution is not None:
+                break
+            with compteur.get_lock():
+                compteur.value = nb_noeuds_explores
+            if nb_noeuds_explores >= limite_noeuds:
+                print(f"Pas de solution trouvée. Noeuds explorés: {nb_noeuds_explores}")
+                return None
+            
+            # Explorer les sous-problèmes dans le pool, dans l'ordre où ils se terminent
+            taches = [(seuil, codes, vide, h, indices) for codes, vide, h, indices, _ in couche.values()]
+            taille_lot = max(1, len(taches) // (travailleurs * 16))
+            for statut, noeuds, valeur in pool.imap_unordered(_sous_probleme_ida, taches, taille_lot):
+                nb_noeuds_explores += noeuds
+                if statut == 'trouve':
+                    codes_solution = valeur
+                    arret.set()  # Annuler les sous-problèmes en cours
+                    break
+                if statut == 'arret':
+                    print(f"Pas de solution trouvée. Noeuds explorés: {nb_noeuds_explores}")
+                    return None
+                minimum = min(minimum, valeur)
+            if codes_solution is not None:
+                break
+            if time.time() - debut_temps >= limite_temps:
+                print(f"Pas de solution trouvée. Noeuds explorés: {nb_noeuds_explores}")
+                return None
+            print(f"Seuil {seuil} épuisé, nouveau seuil {minimum}. Noeuds explorés: {nb_noeuds_explores}"
+                  + (f" ({len(taches)} sous-problèmes à la profondeur {g})" if taches else ""))
+            seuil = minimum
+    finally:
+        arret.set()
+        pool.terminate()
+        pool.join()
+        taquin.statistiques = {'noeuds_explores': nb_noeuds_explores, 'travailleurs': travailleurs}
+    
+    print(f"Solution trouvée! Noeuds explorés: {nb_noeuds_explores}")
+    
+    chemin = []
+    etat = etat_initial
+    for code in codes_solution:
+        etat = taquin.deplacer(etat, DIRECTIONS[code])
+        chemin.append((DIRECTIONS[code], etat))
+    return chemin
+
+
+def _lire_couche(chemin: str, largeur: int):
+    """Lit un fichier d'enregistrements triés (entiers de `largeur` octets, gros-boutistes)"""
+    with open(chemin, 'rb') as fichier:
+        while True:
+            bloc = fichier.read(largeur * 65536)
+            if not bloc:
+                return
+            for debut in range(0, len(bloc), largeur):
+                yield int.from_bytes(bloc[debut:debut + largeur], 'big')
+
+
+def parcours_largeur_externe(taquin: Taquin, repertoire: Optional[str] = None, memoire_mo: float = 256,
+                             fichier_distances: Optional[str] = None, depart: Optional[Etat] = None,
+                             profondeur_max: Optional[int] = None) -> List[int]:
+    """
+    Énumère les états atteignables par un parcours en largeur sur disque.
+    
+    Chaque couche est un fichier d'enregistrements triés: l'entier compact de
+    l'état suivi de la position de la case vide, sur un nombre fixe d'octets
+    gros-boutistes (l'ordre des octets est celui des entiers). Les enfants
+    d'une couche sont accumulés en mémoire jusqu'au budget `memoire_mo`, puis
+    triés et écrits en séquences. La détection des doublons est différée:
+    une fusion en flux (heapq.merge) des séquences élimine les doublons entre
+    elles et avec les deux couches précédentes, seules à pouvoir contenir un
+    voisin (le graphe est non orienté). La mémoire vive reste bornée par le
+    budget, quel que soit le nombre d'états.
+    
+    Args:
+        taquin: Instance du jeu de Taquin
+        repertoire: Dossier des fichiers de couches; les comptes par profondeur
+            y sont écrits (comptes.json). Dossier temporaire supprimé à la fin
+            si None.
+        memoire_mo: Budget de mémoire vive pour les enfants d'une couche, en Mo
+        fichier_distances: Fichier optionnel d'un octet par état, indexé par le
+            rang de ClassementEtats(etat_final): profondeur de l'état, 255 s'il
+            n'est pas atteint
+        depart: État de départ (par défaut l'état final: profondeurs = distances au but)
+        profondeur_max: Profondeur à laquelle arrêter l'énumération
         
-    # Initialisation
+    Returns:
+        List[int]: Nombre d'états à chaque profondeur
+    """
+    depart = depart if depart is not None else taquin.etat_final
+    if depart is None:
+        return []
+    
+    import shutil
     debut_temps = time.time()
-    h_initial = heuristique_func(taquin.etat_initial)
+    temporaire = repertoire is None
+    if temporaire:
+        repertoire = tempfile.mkdtemp(prefix='taquin_bfs_')
+    else:
+        os.makedirs(repertoire, exist_ok=True)
     
-    # Dans A*, la priorité est f(n) = g(n) + h(n) où:
-    # - g(n) est le coût du chemin de l'état initial à l'état n (ici, la profondeur)
-    # - h(n) est l'heuristique estimant le coût de n à l'état final
-    cout_initial = 0  # g(n) pour l'état initial
-    priorite_initiale = cout_initial + h_initial  # f(n) = g(n) + h(n)
+    codage = depart.codage
+    decalages, masque = codage.decalages, codage.masque
+    deplacements = table_deplacements(taquin.taille_x, taquin.taille_y)
+    # Enregistrement: entier compact puis case vide (un octet)
+    largeur = (codage.bits * codage.nb_cases + 7) // 8 + 1
+    capacite = max(1024, int(memoire_mo * 1024 * 1024) // (largeur + 56))
     
-    # File de priorité : (priorité, compteur, nœud)
-    import heapq
-    compteur = 0
-    file_priorite = [(priorite_initiale, compteur, NoeudPriorise(taquin.etat_initial, priorite=priorite_initiale))]
-    heapq.heapify(file_priorite)
+    distances = None
+    if fichier_distances is not None:
+        classement = ClassementEtats(taquin.etat_final)
+        if classement.nb_permutations > 1 << 34:
+            print(f"Fichier de distances trop grand ({classement.nb_permutations} états), non écrit.")
+        else:
+            with open(fichier_distances, 'wb') as fichier:
+                fichier.truncate(classement.nb_permutations)
+            fichier_ouvert = open(fichier_distances, 'r+b')
+            distances = mmap.mmap(fichier_ouvert.fileno(), 0)
+            for position in range(0, len(distances), 1 << 24):
+                fin = min(len(distances), position + (1 << 24))
+                distances[position:fin] = b'\xff' * (fin - position)
     
-    etats_visites = set([hash(taquin.etat_initial)])
-    nb_noeuds_explores = 0
+    def couche(profondeur: int) -> str:
+        return os.path.join(repertoire, f"couche_{profondeur}.bin")
     
-    # Les directions possibles
-    directions = ['haut', 'bas', 'gauche', 'droite']
+    def ecrire_sequence(valeurs: List[int], numero: int) -> str:
+        """Trie, dédoublonne et écrit les enfants accumulés"""
+        valeurs.sort()
+        chemin = os.path.join(repertoire, f"sequence_{numero}.bin")
+        with open(chemin, 'wb') as fichier:
+            precedente = -1
+            tampon = bytearray()
+            for valeur in valeurs:
+                if valeur != precedente:
+                    tampon += valeur.to_bytes(largeur, 'big')
+                    precedente = valeur
+            fichier.write(tampon)
+        return chemin
     
-    while file_priorite and nb_noeuds_explores < limite_noeuds and (time.time() - debut_temps) < limite_temps:
-        _, _, noeud_courant = heapq.heappop(file_priorite)
-        nb_noeuds_explores += 1
-        
-        # Vérifier si l'état est le but
-        if np.array_equal(noeud_courant.etat.grille, taquin.etat_final.grille):
-            print(f"Solution trouvée! Noeuds explorés: {nb_noeuds_explores}")
-            return noeud_courant.reconstruire_chemin()
-        
-        # Expanser le nœud
-        etats_voisins = taquin.obtenir_etats_voisins(noeud_courant.etat)
-        
-        # Pour chaque voisin
-        for i, voisin in enumerate(etats_voisins):
-            etat_hash = hash(voisin)
-            if etat_hash not in etats_visites:
-                etats_visites.add(etat_hash)
-                action = directions[i] if i < len(directions) else "inconnu"
-                
-                # Coût du chemin jusqu'ici (g(n))
-                cout = noeud_courant.profondeur + 1
-                
-                # Valeur heuristique (h(n))
-                h = heuristique_func(voisin)
-                
-                # Priorité totale f(n) = g(n) + h(n)
-                # C'est la différence principale avec Best-First qui n'utilise que h(n)
-                priorite = cout + h
-                compteur += 1
-                
-                nouveau_noeud = NoeudPriorise(
-                    voisin, 
-                    noeud_courant, 
-                    action, 
-                    cout,  # La profondeur correspond au coût du chemin
-                    priorite=priorite
-                )
-                
-                heapq.heappush(file_priorite, (priorite, compteur, nouveau_noeud))
+    with open(couche(0), 'wb') as fichier:
+        fichier.write((depart.cle << 8 | depart.vide).to_bytes(largeur, 'big'))
+    if distances is not None:
+        distances[classement.rang(depart.cle)] = 0
+    comptes = [1]
+    print("Profondeur 0: 1 état")
     
-    # Si on sort de la boucle, c'est qu'on n'a pas trouvé de solution
-    print(f"Pas de solution trouvée. Noeuds explorés: {nb_noeuds_explores}")
-    return None
+    try:
+        profondeur = 0
+        while comptes[-1] and (profondeur_max is None or profondeur < profondeur_max):
+            # Développer la couche courante en séquences triées de taille bornée
+            sequences = []
+            enfants = []
+            for valeur in _lire_couche(couche(profondeur), largeur):
+                cle, vide = valeur >> 8, valeur & 0xFF
+                for cible, _ in deplacements[vide]:
+                    tuile = (cle >> decalages[cible]) & masque
+                    enfant = cle ^ (tuile << decalages[cible]) ^ (tuile << decalages[vide])
+                    enfants.append(enfant << 8 | cible)
+                if len(enfants) >= capacite:
+                    sequences.append(ecrire_sequence(enfants, len(sequences)))
+                    enfants = []
+            if enfants:
+                sequences.append(ecrire_sequence(enfants, len(sequences)))
+            del enfants
+            
+            # Fusionner les séquences en écartant les doublons et les deux couches précédentes
+            anciennes = heapq.merge(*(_lire_couche(couche(p), largeur)
+                                      for p in (profondeur - 1, profondeur) if p >= 0))
+            ancienne = next(anciennes, None)
+            precedente = -1
+            nombre = 0
+            tampon = bytearray()
+            with open(couche(profondeur + 1), 'wb') as fichier:
+                for valeur in heapq.merge(*(_lire_couche(chemin, largeur) for chemin in sequences)):
+                    if valeur == precedente:
+                        continue
+                    precedente = valeur
+                    while ancienne is not None and ancienne < valeur:
+                        ancienne = next(anciennes, None)
+                    if ancienne == valeur:
+                        continue
+                    nombre += 1
+                    tampon += valeur.to_bytes(largeur, 'big')
+                    if distances is not None:
+                        distances[classement.rang(valeur >> 8)] = min(profondeur + 1, 254)
+                    if len(tampon) >= 1 << 20:
+                        fichier.write(tampon)
+                        tampon = bytearray()
+                fichier.write(tampon)
+            for chemin in sequences:
+                os.remove(chemin)
+            if profondeur >= 1:
+                os.remove(couche(profondeur - 1))
+            
+            profondeur += 1
+            comptes.append(nombre)
+            print(f"Profondeur {profondeur}: {nombre} états (total {sum(comptes)}, "
+                  f"{len(sequences)} séquence(s), {time.time() - debut_temps:.1f} s)")
+        if not comptes[-1]:
+            comptes.pop()
+    finally:
+        if distances is not None:
+            distances.flush()
+            distances.close()
+            fichier_ouvert.close()
+        if temporaire:
+            shutil.rmtree(repertoire, ignore_errors=True)
+        else:
+            for profondeur_restante in range(len(comptes) + 1):
+                if os.path.exists(couche(profondeur_restante)):
+                    os.remove(couche(profondeur_restante))
+            with open(os.path.join(repertoire, 'comptes.json'), 'w') as fichier:
+                json.dump({'comptes': comptes, 'total': sum(comptes)}, fichier, indent=2)
+    
+    print(f"{sum(comptes)} états atteignables, profondeur maximale {len(comptes) - 1} "
+          f"({time.time() - debut_temps:.1f} s)")
+    return comptes
 
 
 def comparer_heuristiques(taquin: Taquin, limite_noeuds=10000, limite_temps=30) -> Dict:
@@ -1083,7 +4593,8 @@ def comparer_heuristiques(taquin: Taquin, limite_noeuds=10000, limite_temps=30)
     """
     heuristiques = [
         'lineaire', 
-        'combinee'
+        'combinee',
+        'marche'
     ]
     
     resultats = {}
@@ -1386,15 +4897,15 @@ def main():
     parser.add_argument("--instance", "-i", choices=INSTANCES.keys(), help="Utiliser une instance prédéfinie")
     parser.add_argument(
         "--algorithme", "-a",
-        choices=["dfs", "bfs", "best-first", "a-star"],
+        choices=["dfs", "bfs", "bfs-bidirectionnel", "best-first", "beam", "a-star", "ara-star", "ida-star", "mm"],
         default="bfs",
         help="Algorithme à utiliser (par défaut: bfs)"
     )
     parser.add_argument(
         "--heuristique", "-u",
-        choices=["lineaire", "combinee"],
+        choices=["lineaire", "combinee", "pdb", "marche"],
         default="combinee",
-        help="Heuristique à utiliser pour Best-First ou A* (par défaut: combinee)"
+        help="Heuristique à utiliser pour Best-First, faisceau, A*, ARA*, IDA* ou MM (par défaut: combinee)"
     )
     parser.add_argument(
         "--temps", "-t",
@@ -1408,6 +4919,63 @@ def main():
         default=100000,
         help="Limite de nœuds ou de profondeur (par défaut: 100000)"
     )
+    parser.add_argument(
+        "--frontiere",
+        action="store_true",
+        help="BFS par recherche de frontière: mémoire proportionnelle à la couche la plus large"
+    )
+    parser.add_argument(
+        "--travailleurs", "-j",
+        type=int,
+        default=1,
+        help="Nombre de processus du BFS (partition de l'espace des états) ou d'IDA* (découpe de la racine) (par défaut: 1)"
+    )
+    parser.add_argument(
+        "--iteratif",
+        action="store_true",
+        help="DFS à approfondissement itératif: solution optimale, mémoire proportionnelle à la profondeur"
+    )
+    parser.add_argument(
+        "--memoire-tt",
+        type=int,
+        default=0,
+        help="Mémoire de la table de transposition d'IDA* en Mo (par défaut: 0, sans table)"
+    )
+    parser.add_argument(
+        "--poids",
+        type=float,
+        default=3.0,
+        help="Poids initial de l'heuristique pour ARA* (par défaut: 3.0)"
+    )
+    parser.add_argument(
+        "--largeur",
+        type=int,
+        default=100,
+        help="Nombre d'états gardés par couche pour la recherche en faisceau (par défaut: 100)"
+    )
+    parser.add_argument(
+        "--elargissement",
+        type=int,
+        default=2,
+        help="Facteur d'élargissement du faisceau à chaque relance, 1 pour ne pas relancer (par défaut: 2)"
+    )
+    parser.add_argument(
+        "--enumerer",
+        metavar="REPERTOIRE",
+        help="Énumérer tous les états atteignables depuis l'état final par BFS sur disque, "
+             "couches et comptes par profondeur dans REPERTOIRE"
+    )
+    parser.add_argument(
+        "--memoire-bfs",
+        type=float,
+        default=256,
+        help="Budget de mémoire vive de l'énumération sur disque en Mo (par défaut: 256)"
+    )
+    parser.add_argument(
+        "--distances",
+        metavar="FICHIER",
+        help="Fichier des distances au but écrit par l'énumération (un octet par état)"
+    )
     parser.add_argument(
         "--comparer", "-c",
         action="store_true",
@@ -1445,6 +5013,13 @@ def main():
     print("\nÉtat final à atteindre:")
     taquin.afficher_grille(taquin.etat_final)
     
+    # Énumérer l'espace des états plutôt que résoudre
+    if args.enumerer:
+        print("\nÉnumération des états atteignables depuis l'état final...")
+        parcours_largeur_externe(taquin, repertoire=args.enumerer, memoire_mo=args.memoire_bfs,
+                                 fichier_distances=args.distances)
+        return 0
+    
     # Vérifier si la grille est déjà résolue
     if taquin.est_resolu():
         print("La grille est déjà résolue!")
@@ -1471,17 +5046,35 @@ def main():
     
     # Résoudre le problème avec l'algorithme choisi
     print(f"\nRésolution avec l'algorithme {args.algorithme}" + 
-          (f" (heuristique: {args.heuristique})" if args.algorithme in ['best-first', 'a-star'] else "") + 
+          (f" (heuristique: {args.heuristique})" if args.algorithme in ['best-first', 'beam', 'a-star', 'ara-star', 'ida-star', 'mm'] else "") + 
           "...")
     debut = time.time()
     
     if args.algorithme == "dfs":
-        chemin = resolution_dfs(taquin, limite_profondeur=args.limite, limite_temps=args.temps)
+        chemin = resolution_dfs(taquin, limite_profondeur=args.limite, limite_temps=args.temps,
+                                iteratif=args.iteratif)
     elif args.algorithme == "bfs":
-        chemin = resolution_bfs(taquin, limite_noeuds=args.limite, limite_temps=args.temps)
+        chemin = resolution_bfs(taquin, limite_noeuds=args.limite, limite_temps=args.temps,
+                                frontiere=args.frontiere, travailleurs=args.travailleurs)
+    elif args.algorithme == "bfs-bidirectionnel":
+        chemin = resolution_bfs_bidirectionnel(taquin, limite_noeuds=args.limite, limite_temps=args.temps)
     elif args.algorithme == "best-first":
         chemin = resolution_best_first(taquin, limite_noeuds=args.limite, limite_temps=args.temps, 
                                     heuristique=args.heuristique)
+    elif args.algorithme == "beam":
+        chemin = resolution_beam(taquin, limite_noeuds=args.limite, limite_temps=args.temps,
+                                 heuristique=args.heuristique, largeur=args.largeur,
+                                 facteur_elargissement=args.elargissement)
+    elif args.algorithme == "ara-star":
+        chemin, _ = resolution_ara_star(taquin, limite_noeuds=args.limite, limite_temps=args.temps,
+                                        heuristique=args.heuristique, poids_initial=args.poids)
+    elif args.algorithme == "mm":
+        chemin = resolution_mm(taquin, limite_noeuds=args.limite, limite_temps=args.temps,
+                               heuristique=args.heuristique)
+    elif args.algorithme == "ida-star":
+        chemin = resolution_ida_star(taquin, limite_noeuds=args.limite, limite_temps=args.temps,
+                                     heuristique=args.heuristique, memoire_transpositions=args.memoire_tt,
+                                     travailleurs=args.travailleurs)
     else:  # a-star
         chemin = resolution_a_star(taquin, limite_noeuds=args.limite, limite_temps=args.temps, 
                                  heuristique=args.heuristique)
@@ -0,0 +1,380 @@
+"""
+Tests unitaires pour l'évaluation des heuristiques de taquin_complet.
+"""
+import os
+import sys
+import random
+import itertools
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+
+# Ajouter le répertoire parent au chemin de recherche des modules
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import numpy as np
+
+from src.taquin_complet import (
+    Taquin, Etat, CodageEtat, IndexBut, BaseMotifs, TableMarche, INSTANCES, resolution_bfs,
+    affectation_minimale
+)
+
+
+def setUpModule():
+    """Les tables des tests sont écrites dans un cache temporaire."""
+    global _dossier_cache, _environnement
+    _dossier_cache = tempfile.mkdtemp(prefix='taquin_cache_')
+    _environnement = mock.patch.dict(os.environ, {'TAQUIN_CACHE_DIR': _dossier_cache})
+    _environnement.start()
+
+
+def tearDownModule():
+    """Supprime le cache temporaire."""
+    _environnement.stop()
+    shutil.rmtree(_dossier_cache, ignore_errors=True)
+
+
+def marche_aleatoire(taquin, nb_pas, graine=0):
+    """Retourne les couples (parent, enfant) d'une marche aléatoire depuis l'état initial."""
+    generateur = random.Random(graine)
+    etat = taquin.etat_initial
+    couples = []
+    for _ in range(nb_pas):
+        enfant = generateur.choice(taquin.obtenir_etats_voisins(etat))
+        couples.append((etat, enfant))
+        etat = enfant
+    return couples
+
+
+def manhattan_force_brute(etat, finale, taille_y):
+    """Distance de Manhattan avec la meilleure affectation des exemplaires, par énumération."""
+    distance = 0
+    for code in set(etat.cases) - {0}:
+        courantes = [case for case, c in enumerate(etat.cases) if c == code]
+        finales = [case for case, c in enumerate(finale.cases) if c == code]
+        distance += min(sum(abs(c1 // taille_y - c2 // taille_y) + abs(c1 % taille_y - c2 % taille_y)
+                            for c1, c2 in zip(courantes, p))
+                        for p in itertools.permutations(finales))
+    return distance
+
+
+class TestHeuristiquesIncrementales(unittest.TestCase):
+    """Classe de tests pour le calcul incrémental des heuristiques."""
+
+    def test_incremental_egal_complet(self):
+        """La valeur dérivée du parent égale le calcul complet sur l'enfant."""
+        for nom_instance in ("taquin_3x4", "taquin_4x4d", "taquin_5x5b"):
+            taquin = Taquin()
+            taquin.taille_max_motifs = 50000  # Petites tables pour garder le test rapide
+            self.assertTrue(taquin.charger_depuis_chaine(INSTANCES[nom_instance]))
+            for nom in Taquin.HEURISTIQUES:
+                complete, enfant = taquin.obtenir_heuristique(nom)
+                h = complete(taquin.etat_initial)
+                for parent, etat in marche_aleatoire(taquin, 200):
+                    h = enfant(parent, h, etat)
+                    self.assertAlmostEqual(h, complete(etat), places=6,
+                                           msg=f"{nom} sur {nom_instance}")
+
+
+class TestEvaluationLot(unittest.TestCase):
+    """Classe de tests pour l'évaluation des heuristiques par lots."""
+
+    def test_lot_egal_complet(self):
+        """Chaque valeur du lot égale le calcul complet sur l'état."""
+        for nom_instance in ("taquin_2x4d", "taquin_3x4", "taquin_5x5b"):
+            taquin = Taquin()
+            self.assertTrue(taquin.charger_depuis_chaine(INSTANCES[nom_instance]))
+            etats = [enfant for _, enfant in marche_aleatoire(taquin, 300)]
+            plateaux = Taquin.tableau_etats(etats)
+            self.assertEqual(plateaux.shape, (300, taquin.taille_x * taquin.taille_y))
+            for nom in Taquin.HEURISTIQUES_LOT:
+                complete = getattr(taquin, Taquin.HEURISTIQUES[nom])
+                valeurs = taquin.evaluer_lot(nom, plateaux)
+                self.assertEqual(len(valeurs), len(etats))
+                for etat, valeur in zip(etats, valeurs):
+                    self.assertAlmostEqual(valeur, complete(etat), places=6,
+                                           msg=f"{nom} sur {nom_instance}")
+
+    def test_lot_liste_etats(self):
+        """Une liste d'états est acceptée directement."""
+        taquin = Taquin()
+        self.assertTrue(taquin.charger_depuis_chaine(INSTANCES["taquin_3x3b"]))
+        valeurs = taquin.evaluer_lot('manhattan', [taquin.etat_initial, taquin.etat_final])
+        self.assertEqual(list(valeurs), [taquin.calculer_distance_manhattan(taquin.etat_initial), 0])
+
+
+class TestDistanceMarche(unittest.TestCase):
+    """Classe de tests pour la distance de marche."""
+
+    def test_table_4x4(self):
+        """La table des lignes d'une grille 4x4 a 24964 états, jusqu'à 35 coups."""
+        table = TableMarche(4, 4, 3)
+        self.assertEqual(len(table.cles), 24964)
+        self.assertEqual(max(table.distances), 35)
+        self.assertTrue(TableMarche(4, 4, 3).depuis_cache)
+
+    def test_encadrement(self):
+        """Manhattan <= distance de marche <= distance optimale."""
+        taquin = Taquin()
+        self.assertTrue(taquin.charger_depuis_chaine(INSTANCES["taquin_2x4d"]))
+        for _, etat in marche_aleatoire(taquin, 200):
+            self.assertGreaterEqual(taquin.calculer_heuristique_marche(etat),
+                                    taquin.calculer_distance_manhattan(etat))
+        chemin = resolution_bfs(taquin, limite_noeuds=50000, limite_temps=30)
+        self.assertEqual(taquin.calculer_heuristique_marche(taquin.etat_initial), 20)
+        self.assertLessEqual(20, len(chemin))
+
+    def test_lettres_differentes(self):
+        """Un état dont les lettres diffèrent de celles du but n'a pas de numéro dans les tables."""
+        taquin = Taquin()
+        self.assertTrue(taquin.charger_depuis_chaine(INSTANCES["taquin_2x4d"]))
+        grille = taquin.etat_final.grille
+        codage = CodageEtat.pour(2, 4, set(grille.ravel()) | {'z'})
+        taquin.etat_final = Etat(grille, taquin.etat_final.pos_vide, codage)
+        grille = grille.copy()
+        grille[1, 0] = 'z'  # Dernière ligne: l'ancien calcul y comptait le code absent
+        etat = Etat(grille, taquin.etat_final.pos_vide, codage)
+        self.assertEqual(taquin.indices_marche(etat), (-1, -1))
+        self.assertEqual(taquin.calculer_heuristique_marche(etat), taquin.calculer_distance_manhattan(etat))
+        self.assertGreaterEqual(min(taquin.indices_marche(taquin.etat_final)), 0)
+
+    def test_grille_trop_grande(self):
+        """Sur une grille 5x5, la distance de marche se replie sur Manhattan."""
+        taquin = Taquin()
+        self.assertTrue(taquin.charger_depuis_chaine(INSTANCES["taquin_5x5b"]))
+        self.assertIsNone(taquin.tables_marche)
+        complete, _ = taquin.obtenir_heuristique('marche')
+        self.assertEqual(complete(taquin.etat_initial), taquin.calculer_distance_manhattan(taquin.etat_initial))
+
+
+class TestIndexBut(unittest.TestCase):
+    """Classe de tests pour les tables précalculées de l'état final."""
+
+    def setUp(self):
+        """Initialisation avant chaque test."""
+        self.taquin = Taquin()
+        self.assertTrue(self.taquin.charger_depuis_chaine(INSTANCES["taquin_3x3b"]))
+
+    def test_tables(self):
+        """Les tables reflètent les positions finales des caractères."""
+        index = self.taquin.index_but
+        self.assertIsInstance(index, IndexBut)
+        self.assertIs(self.taquin.index_but, index)
+        for case, code in enumerate(self.taquin.etat_final.cases):
+            i, j = divmod(case, self.taquin.taille_y)
+            self.assertEqual((index.lignes_finales[code], index.colonnes_finales[code]), (i, j))
+            if code:
+                self.assertTrue(index.masques_lignes[i] >> code & 1)
+                self.assertTrue(index.masques_colonnes[j] >> code & 1)
+                self.assertEqual(index.distances[code * index.nb_cases + case], 0)
+        # Distance de Manhattan d'un caractère du coin haut gauche vers le coin opposé
+        coin = self.taquin.etat_final[0]
+        self.assertEqual(index.distances[coin * index.nb_cases + 8], 4)
+        self.assertEqual(index.penalites_coins[coin * index.nb_cases + 8], 12)
+
+    def test_invalidation(self):
+        """Changer l'état final reconstruit l'index et les heuristiques suivent."""
+        index = self.taquin.index_but
+        ancien_final = self.taquin.etat_final
+        nouveau_final = self.taquin.deplacer(ancien_final, self.taquin.obtenir_successeurs(ancien_final)[0][0])
+        self.taquin.etat_final = nouveau_final
+        self.assertIsNot(self.taquin.index_but, index)
+        for nom in Taquin.HEURISTIQUES:
+            complete, _ = self.taquin.obtenir_heuristique(nom)
+            self.assertEqual(complete(nouveau_final), 0, msg=nom)
+        self.assertEqual(self.taquin.calculer_distance_manhattan(ancien_final), 1)
+
+
+class TestLettresRepetees(unittest.TestCase):
+    """Classe de tests pour les heuristiques avec des lettres répétées."""
+
+    def setUp(self):
+        """Initialisation avant chaque test: un but avec trois 'a' et deux 'b'."""
+        self.taquin = Taquin()
+        finale = Etat(np.array([['a', 'b', 'a'], ['c', 'a', 'b'], ['d', 'e', ' ']]), (2, 2))
+        self.taquin.etat_final = finale
+        self.taquin.etat_initial = finale
+        self.taquin.taille_x, self.taquin.taille_y = 3, 3
+        etat = finale
+        for _, etat in marche_aleatoire(self.taquin, 40, graine=3):
+            pass
+        self.taquin.etat_initial = etat
+        self.taquin.etat_courant = etat.copier()
+
+    def test_affectation_minimale(self):
+        """La méthode hongroise trouve le même coût que l'énumération."""
+        generateur = random.Random(1)
+        for n, m in ((1, 1), (3, 3), (4, 4), (2, 5), (5, 3)):
+            couts = [[generateur.randint(0, 9) for _ in range(m)] for _ in range(n)]
+            if n <= m:
+                attendu = min(sum(couts[i][j] for i, j in enumerate(p))
+                              for p in itertools.permutations(range(m), n))
+            else:
+                attendu = min(sum(couts[i][j] for j, i in enumerate(p))
+                              for p in itertools.permutations(range(n), m))
+            self.assertEqual(affectation_minimale(couts), attendu)
+
+    def test_manhattan_affectation(self):
+        """Les exemplaires d'une lettre sont affectés au mieux à leurs cases finales."""
+        index = self.taquin.index_but
+        self.assertEqual(sorted(index.codes_repetes), sorted(self.taquin.codage.codes[c] for c in 'ab'))
+        for _, etat in marche_aleatoire(self.taquin, 100):
+            self.assertEqual(self.taquin.calculer_distance_manhattan(etat),
+                             manhattan_force_brute(etat, self.taquin.etat_final, 3))
+
+    def test_incremental_et_lot(self):
+        """Les valeurs incrémentales et par lots égalent le calcul complet."""
+        etats = [enfant for _, enfant in marche_aleatoire(self.taquin, 200)]
+        for nom in Taquin.HEURISTIQUES_INCREMENTALES:
+            if nom == 'pdb':
+                continue
+            complete, enfant = self.taquin.obtenir_heuristique(nom)
+            h = complete(self.taquin.etat_initial)
+            for parent, etat in marche_aleatoire(self.taquin, 200):
+                h = enfant(parent, h, etat)
+                self.assertAlmostEqual(h, complete(etat), places=6, msg=nom)
+        for nom in Taquin.HEURISTIQUES_LOT:
+            complete = getattr(self.taquin, Taquin.HEURISTIQUES[nom])
+            for etat, valeur in zip(etats, self.taquin.evaluer_lot(nom, etats)):
+                self.assertAlmostEqual(valeur, complete(etat), places=6, msg=nom)
+
+    def test_admissible(self):
+        """Manhattan et conflits linéaires ne dépassent pas la distance optimale."""
+        chemin = resolution_bfs(self.taquin, limite_noeuds=200000, limite_temps=60)
+        self.assertIsNotNone(chemin)
+        self.assertLessEqual(self.taquin.calculer_heuristique_lineaire(self.taquin.etat_initial), len(chemin))
+        for i, (_, etat) in enumerate(chemin):
+            self.assertLessEqual(self.taquin.calculer_distance_manhattan(etat), len(chemin) - 1 - i)
+
+    def test_marche_indisponible(self):
+        """Une lettre répétée désactive la distance de marche, remplacée par Manhattan."""
+        self.assertIsNone(self.taquin.tables_marche)
+        complete, _ = self.taquin.obtenir_heuristique('marche')
+        etat = self.taquin.etat_initial
+        self.assertEqual(complete(etat), self.taquin.calculer_distance_manhattan(etat))
+
+    def test_pattern_comme_auparavant(self):
+        """La pénalité des coins d'une lettre répétée est celle de l'ancien calcul (dernière occurrence)."""
+        finale = self.taquin.etat_final.grille
+        taille_x, taille_y = finale.shape
+        coins = [(0, 0), (0, taille_y - 1), (taille_x - 1, 0), (taille_x - 1, taille_y - 1)]
+        for _, etat in marche_aleatoire(self.taquin, 100, graine=5):
+            grille = etat.grille
+            positions = {grille[i, j]: (i, j) for i in range(taille_x) for j in range(taille_y)}
+            penalite = 0
+            for i_coin, j_coin in coins:
+                caractere = finale[i_coin, j_coin]
+                if caractere != ' ' and caractere in positions:
+                    i, j = positions[caractere]
+                    penalite += 3 * (abs(i - i_coin) + abs(j - j_coin))
+            self.assertEqual(self.taquin.calculer_heuristique_pattern_database(etat),
+                             self.taquin.calculer_distance_manhattan(etat) + penalite)
+
+    def test_exemplaires_echanges(self):
+        """Un exemplaire échangé avec une autre tuile est affecté à la case finale la plus avantageuse."""
+        finale = self.taquin.etat_final
+        # Chaque exemplaire de 'a' (puis de 'b') tour à tour échangé avec 'd', puis avec 'e'
+        for lettre in 'ab':
+            for case_autre in ((2, 0), (2, 1)):
+                for case_lettre in zip(*np.nonzero(finale.grille == lettre)):
+                    grille = finale.grille.copy()
+                    grille[case_lettre], grille[case_autre] = grille[case_autre], grille[case_lettre]
+                    etat = Etat(grille, finale.pos_vide, finale.codage)
+                    self.assertNotEqual(etat, finale)
+                    self.assertEqual(self.taquin.calculer_distance_manhattan(etat),
+                                     manhattan_force_brute(etat, finale, 3), msg=str(grille))
+        # 'a' de (0, 0) en (2, 0): affecté à la case finale (0, 0), et non à la dernière (1, 1)
+        grille = finale.grille.copy()
+        grille[0, 0], grille[2, 0] = 'd', 'a'
+        self.assertEqual(self.taquin.calculer_distance_manhattan(Etat(grille, finale.pos_vide, finale.codage)), 4)
+
+
+class TestBaseMotifs(unittest.TestCase):
+    """Classe de tests pour les bases de motifs additives disjointes."""
+
+    def setUp(self):
+        """Initialisation avant chaque test."""
+        self.taquin = Taquin()
+        self.assertTrue(self.taquin.charger_depuis_chaine(INSTANCES["taquin_2x4d"]))
+
+    def test_partition(self):
+        """La taille des groupes dépend du budget par table."""
+        base = BaseMotifs(self.taquin.etat_final, taille_max_table=1000)
+        self.assertEqual(base.description, "3-3-1")  # 8 x 7 x 6 = 336 <= 1000 < 8 x 7 x 6 x 5
+        self.assertEqual(sorted(code for groupe in base.groupes for code in groupe),
+                         list(range(1, 8)))
+        self.assertEqual(base.tailles_tables, [336, 336, 8])
+
+    def test_admissible_et_superieure_a_manhattan(self):
+        """La somme des tables encadre la distance réelle par Manhattan."""
+        base = BaseMotifs(self.taquin.etat_final, taille_max_table=1000)
+        for _, etat in marche_aleatoire(self.taquin, 200):
+            self.assertGreaterEqual(base.evaluer(etat.cases), self.taquin.calculer_distance_manhattan(etat))
+        # Sur l'état initial, la distance optimale (BFS) majore l'heuristique
+        chemin = resolution_bfs(self.taquin, limite_noeuds=50000, limite_temps=30)
+        self.assertLessEqual(base.evaluer(self.taquin.etat_initial.cases), len(chemin))
+
+    def test_groupe_complet_exact(self):
+        """Avec toutes les tuiles dans un groupe, la table donne la distance exacte."""
+        h = self.taquin.calculer_heuristique_pdb(self.taquin.etat_initial)
+        chemin = resolution_bfs(self.taquin, limite_noeuds=50000, limite_temps=30)
+        self.assertEqual(self.taquin.base_motifs.description, "7")
+        self.assertEqual(h, len(chemin))
+
+    def test_lettres_repetees(self):
+        """Les exemplaires d'une même lettre restent dans le même groupe."""
+        finale = Etat(np.array([['a', 'b', 'a'], ['c', 'a', ' ']]), (1, 2))
+        base = BaseMotifs(finale, taille_max_table=200)
+        codes = finale.codage.codes
+        self.assertIn([codes['a']] * 3, base.groupes)
+        self.assertEqual(base.evaluer(finale.cases), 0)
+        decale = Etat(np.array([['a', 'b', 'a'], ['c', ' ', 'a']]), (1, 1), finale.codage)
+        self.assertEqual(base.evaluer(decale.cases), 1)
+
+    def test_grille_6x6(self):
+        """Sur 36 cases, les tables se construisent et encadrent la distance réelle."""
+        finale = Etat(np.array(list('abcdefghijklmnopqrstuvwxyzABCDEFGHI ')).reshape(6, 6), (5, 5))
+        taquin = Taquin(6, 6)
+        taquin.etat_final = finale
+        taquin.etat_initial = finale
+        base = BaseMotifs(finale, taille_max_table=50000)
+        self.assertEqual(base.description, "3-3-3-3-3-3-3-3-3-3-3-2")
+        self.assertEqual(base.evaluer(finale.cases), 0)
+        for nb_pas, (_, etat) in enumerate(marche_aleatoire(taquin, 60, graine=2), 1):
+            valeur = base.evaluer(etat.cases)
+            self.assertGreaterEqual(valeur, taquin.calculer_distance_manhattan(etat))
+            self.assertLessEqual(valeur, nb_pas)
+
+    def test_cache_disque(self):
+        """La deuxième construction relit les tables du cache."""
+        premiere = BaseMotifs(self.taquin.etat_final, taille_max_table=1000)
+        seconde = BaseMotifs(self.taquin.etat_final, taille_max_table=1000)
+        self.assertTrue(os.path.isfile(premiere.chemin))
+        self.assertEqual(seconde.chemin, premiere.chemin)
+        self.assertTrue(seconde.depuis_cache)
+        self.assertEqual(bytes(seconde.octets), bytes(premiere.octets))
+        for _, etat in marche_aleatoire(self.taquin, 100):
+            self.assertEqual(seconde.evaluer(etat.cases), premiere.evaluer(etat.cases))
+        # Une autre partition a son propre fichier
+        autre = BaseMotifs(self.taquin.etat_final, taille_max_table=100)
+        self.assertNotEqual(autre.chemin, premiere.chemin)
+
+    def test_cache_corrompu(self):
+        """Un fichier corrompu est détecté et la table reconstruite."""
+        base = BaseMotifs(self.taquin.etat_final, taille_max_table=1000)
+        valeurs = [base.evaluer(etat.cases) for _, etat in marche_aleatoire(self.taquin, 100)]
+        with open(base.chemin, 'r+b') as fichier:
+            fichier.seek(-1, os.SEEK_END)
+            octet = fichier.read(1)
+            fichier.seek(-1, os.SEEK_END)
+            fichier.write(bytes([octet[0] ^ 0xFF]))
+        reconstruite = BaseMotifs(self.taquin.etat_final, taille_max_table=1000)
+        self.assertFalse(reconstruite.depuis_cache)
+        self.assertEqual([reconstruite.evaluer(etat.cases) for _, etat in marche_aleatoire(self.taquin, 100)],
+                         valeurs)
+        self.assertTrue(BaseMotifs(self.taquin.etat_final, taille_max_table=1000).depuis_cache)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,764 @@
+"""
+Tests unitaires pour le moteur d'états du Taquin (taquin_complet).
+"""
+import io
+import os
+import re
+import sys
+import json
+import random
+import shutil
+import tempfile
+import itertools
+import contextlib
+import multiprocessing
+import unittest
+from unittest import mock
+import numpy as np
+
+# Ajouter le répertoire parent au chemin de recherche des modules
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.taquin_complet import (
+    Taquin, Etat, CodageEtat, ClassementEtats, EnsembleVisites, TableTransposition, FileSeaux, FileTas, INSTANCES,
+    table_deplacements, creer_file_priorite, parcours_largeur_externe,
+    resolution_dfs, resolution_bfs, resolution_best_first, resolution_bfs_bidirectionnel, resolution_beam, resolution_a_star, resolution_ara_star,
+    resolution_ida_star, resolution_mm, _partition
+)
+
+
+def setUpModule():
+    """Les tables des tests sont écrites dans un cache temporaire."""
+    global _dossier_cache, _environnement
+    _dossier_cache = tempfile.mkdtemp(prefix='taquin_cache_')
+    _environnement = mock.patch.dict(os.environ, {'TAQUIN_CACHE_DIR': _dossier_cache})
+    _environnement.start()
+
+
+def tearDownModule():
+    """Supprime le cache temporaire."""
+    _environnement.stop()
+    shutil.rmtree(_dossier_cache, ignore_errors=True)
+
+
+class TestEtatCompact(unittest.TestCase):
+    """Classe de tests pour la représentation compacte des états."""
+
+    def setUp(self):
+        """Initialisation avant chaque test."""
+        self.taquin = Taquin()
+        self.assertTrue(self.taquin.charger_depuis_chaine(INSTANCES["taquin_2x4d"]))
+
+    def test_codage_partage(self):
+        """Les états initial et final partagent le même codage, vide = 0."""
+        codage = self.taquin.codage
+        self.assertIs(self.taquin.etat_initial.codage, codage)
+        self.assertIs(self.taquin.etat_final.codage, codage)
+        self.assertEqual(codage.codes[' '], 0)
+        self.assertEqual(codage.bits, 3)  # 7 lettres + la case vide
+
+    def test_grille_aller_retour(self):
+        """La grille numpy reste disponible et reflète l'état compact."""
+        etat = self.taquin.etat_initial
+        self.assertEqual(etat.grille.dtype, np.dtype('U1'))
+        self.assertEqual(''.join(etat.grille.ravel()), "isfnl ue")
+        self.assertEqual(etat.pos_vide, (1, 1))
+        self.assertEqual(Etat(etat.grille, etat.pos_vide), etat)
+
+    def test_slots(self):
+        """Les états n'ont pas de dictionnaire d'attributs."""
+        self.assertFalse(hasattr(self.taquin.etat_initial, '__dict__'))
+
+    def test_deplacer(self):
+        """Un déplacement échange la case vide et la tuile voisine."""
+        etat = self.taquin.etat_initial
+        voisin = self.taquin.deplacer(etat, 'haut')
+        self.assertEqual(''.join(voisin.grille.ravel()), "i fnlsue")
+        self.assertEqual(voisin.pos_vide, (0, 1))
+        self.assertIsNone(self.taquin.deplacer(voisin, 'haut'))
+        # Revenir en arrière redonne exactement l'état de départ
+        retour = self.taquin.deplacer(voisin, 'bas')
+        self.assertEqual(retour, etat)
+        self.assertEqual(hash(retour), hash(etat))
+
+    def test_hachage_zobrist_incremental(self):
+        """Le hachage mis à jour par deplacer égale le hachage complet."""
+        etat = self.taquin.etat_initial
+        for direction in ['haut', 'droite', 'bas', 'droite', 'haut', 'gauche'] * 3:
+            voisin = self.taquin.deplacer(etat, direction)
+            if voisin is None:
+                continue
+            self.assertEqual(hash(voisin), voisin.codage.hacher(voisin.cle))
+            etat = voisin
+
+    def test_egalite_codages_differents(self):
+        """Des états de codages différents sont distincts, ce qui garde l'égalité cohérente avec le hachage."""
+        grille = np.array([['a', 'b'], ['c', ' ']])
+        etat = Etat(grille, (1, 1))
+        autre = Etat(grille, (1, 1), CodageEtat.pour(2, 2, 'abcd'))
+        self.assertIsNot(etat.codage, autre.codage)
+        self.assertNotEqual(etat, autre)
+        self.assertEqual(len({etat, autre, Etat(grille, (1, 1))}), 2)
+
+    def test_resolution(self):
+        """Les solveurs fonctionnent sur la représentation compacte."""
+        chemin = resolution_bfs(self.taquin, limite_noeuds=50000, limite_temps=30)
+        self.assertIsNotNone(chemin)
+        self.assertEqual(chemin[-1][1], self.taquin.etat_final)
+
+    def test_table_deplacements(self):
+        """La table de déplacements respecte les bords de la grille."""
+        table = table_deplacements(2, 4)
+        self.assertEqual(table[0], ((4, 1), (1, 3)))
+        self.assertEqual(table[5], ((1, 0), (4, 2), (6, 3)))
+
+    def test_successeurs_sans_retour(self):
+        """Le mouvement inverse de l'action précédente n'est pas généré."""
+        etat = self.taquin.etat_initial
+        actions = [action for action, _ in self.taquin.obtenir_successeurs(etat)]
+        self.assertEqual(actions, ['haut', 'gauche', 'droite'])
+        actions = [action for action, _ in self.taquin.obtenir_successeurs(etat, 'droite')]
+        self.assertEqual(actions, ['haut', 'droite'])
+
+    def test_actions_du_chemin(self):
+        """Rejouer les actions du chemin redonne exactement ses états."""
+        for solveur in (resolution_bfs, resolution_a_star):
+            chemin = solveur(self.taquin, limite_noeuds=50000, limite_temps=30)
+            etat = self.taquin.etat_initial
+            for action, etat_attendu in chemin:
+                etat = self.taquin.deplacer(etat, action)
+                self.assertEqual(etat, etat_attendu)
+
+
+def verifier_chemin(test, taquin, chemin):
+    """Rejouer les actions du chemin mène de l'état initial à l'état final."""
+    etat = taquin.etat_initial
+    for action, etat_attendu in chemin:
+        etat = taquin.deplacer(etat, action)
+        test.assertEqual(etat, etat_attendu)
+    test.assertEqual(etat, taquin.etat_final)
+
+
+class TestBfsFrontiere(unittest.TestCase):
+    """Classe de tests pour le parcours en largeur par recherche de frontière."""
+
+    def test_optimal(self):
+        """La longueur égale celle du BFS simple."""
+        for nom_instance in ("taquin_2x4d", "taquin_3x3b"):
+            taquin = Taquin()
+            self.assertTrue(taquin.charger_depuis_chaine(INSTANCES[nom_instance]))
+            chemin = resolution_bfs(taquin, limite_noeuds=1000000, limite_temps=60, frontiere=True)
+            verifier_chemin(self, taquin, chemin)
+            self.assertEqual(len(chemin), len(resolution_bfs(taquin, limite_noeuds=200000, limite_temps=60)))
+
+    def test_3x4(self):
+        """Sur des grilles 3x4, la longueur égale celle du BFS bidirectionnel."""
+        taquin = Taquin()
+        self.assertTrue(taquin.charger_depuis_chaine(INSTANCES["taquin_3x4"]))
+        generateur = random.Random(5)
+        for _ in range(3):
+            etat = taquin.etat_final
+            for _ in range(30):
+                etat = generateur.choice(taquin.obtenir_etats_voisins(etat))
+            taquin.etat_initial = etat
+            taquin.etat_courant = etat.copier()
+            chemin = resolution_bfs(taquin, limite_noeuds=5000000, limite_temps=60, frontiere=True)
+            verifier_chemin(self, taquin, chemin)
+            self.assertEqual(len(chemin), len(resolution_bfs_bidirectionnel(taquin, limite_noeuds=500000)))
+
+    def test_limite_et_deja_resolu(self):
+        """La limite de nœuds arrête la recherche; un état déjà résolu donne un chemin vide."""
+        taquin = Taquin()
+        self.assertTrue(taquin.charger_depuis_chaine(INSTANCES["taquin_3x3b"]))
+        self.assertIsNone(resolution_bfs(taquin, limite_noeuds=1000, frontiere=True))
+        taquin.etat_initial = taquin.etat_final
+        self.assertEqual(resolution_bfs(taquin, frontiere=True), [])
+
+
+class TestParcoursExterne(unittest.TestCase):
+    """Classe de tests pour l'énumération des états par BFS sur disque."""
+
+    def test_comptes_et_distances(self):
+        """Comptes par profondeur et distances identiques à un BFS en mémoire, malgré un petit budget."""
+        taquin = Taquin()
+        self.assertTrue(taquin.charger_depuis_chaine(INSTANCES["taquin_2x4d"]))
+        
+        # Référence: BFS en mémoire depuis l'état final
+        profondeurs = {taquin.etat_final: 0}
+        couche = [taquin.etat_final]
+        attendus = [1]
+        while couche:
+            suivante = []
+            for etat in couche:
+                for voisin in taquin.obtenir_etats_voisins(etat):
+                    if voisin not in profondeurs:
+                        profondeurs[voisin] = len(attendus)
+                        suivante.append(voisin)
+            if suivante:
+                attendus.append(len(suivante))
+            couche = suivante
+        
+        with tempfile.TemporaryDirectory() as repertoire:
+            fichier_distances = os.path.join(repertoire, "distances.bin")
+            # Budget minimal: chaque couche large est écrite en plusieurs séquences
+            comptes = parcours_largeur_externe(taquin, repertoire=repertoire, memoire_mo=0.01,
+                                               fichier_distances=fichier_distances)
+            self.assertEqual(comptes, attendus)
+            self.assertEqual(sum(comptes), 20160)
+            with open(os.path.join(repertoire, "comptes.json")) as fichier:
+                self.assertEqual(json.load(fichier)["comptes"], attendus)
+            
+            with open(fichier_distances, "rb") as fichier:
+                distances = fichier.read()
+            classement = ClassementEtats(taquin.etat_final)
+            self.assertEqual(len(distances), classement.nb_permutations)
+            for etat, profondeur in profondeurs.items():
+                self.assertEqual(distances[classement.rang(etat.cle)], profondeur)
+            self.assertEqual(distances.count(255), classement.nb_permutations - 20160)
+            self.assertEqual(sorted(os.listdir(repertoire)), ["comptes.json", "distances.bin"])
+
+    def test_profondeur_max(self):
+        """L'énumération s'arrête à la profondeur demandée."""
+        taquin = Taquin()
+        self.assertTrue(taquin.charger_depuis_chaine(INSTANCES["taquin_3x3b"]))
+        self.assertEqual(parcours_largeur_externe(taquin, profondeur_max=4), [1, 2, 4, 8, 16])
+
+
+class TestBfsParallele(unittest.TestCase):
+    """Classe de tests pour le parcours en largeur réparti entre plusieurs processus."""
+
+    def test_meme_chemin(self):
+        """Le chemin et le nombre de nœuds sont ceux du BFS séquentiel."""
+        for nom_instance in ("taquin_2x4d", "taquin_3x3b"):
+            taquin = Taquin()
+            self.assertTrue(taquin.charger_depuis_chaine(INSTANCES[nom_instance]))
+            sortie = io.StringIO()
+            with contextlib.redirect_stdout(sortie):
+                reference = resolution_bfs(taquin, limite_noeuds=200000, limite_temps=60)
+            for travailleurs in (2, 3):
+                with contextlib.redirect_stdout(sortie):
+                    chemin = resolution_bfs(taquin, limite_noeuds=200000, limite_temps=60,
+                                            travailleurs=travailleurs)
+                verifier_chemin(self, taquin, chemin)
+                self.assertEqual([action for action, _ in chemin], [action for action, _ in reference])
+                self.assertEqual(taquin.statistiques['noeuds_explores'],
+                                 int(re.findall(r"Noeuds explorés: (\d+)", sortie.getvalue())[0]))
+
+    def test_partitions_equilibrees(self):
+        """Sur 5x5 (clés de 125 bits), permuter les premières ou les dernières cases répartit les états."""
+        taquin = Taquin()
+        self.assertTrue(taquin.charger_depuis_chaine(INSTANCES["taquin_5x5b"]))
+        codage = taquin.codage
+        cases = list(taquin.etat_final.cases)
+        for debut in (0, len(cases) - 5):
+            comptes = [0] * 8
+            for permutation in itertools.permutations(cases[debut:debut + 5]):
+                valeurs = cases[:debut] + list(permutation) + cases[debut + 5:]
+                comptes[_partition(codage.encoder(codage.caracteres[code] for code in valeurs), 8)] += 1
+            self.assertGreater(min(comptes), 120 // 8 // 3, msg=str(comptes))
+
+    def test_limite_et_deja_resolu(self):
+        """La limite de nœuds arrête la recherche; un état déjà résolu donne un chemin vide."""
+        taquin = Taquin()
+        self.assertTrue(taquin.charger_depuis_chaine(INSTANCES["taquin_3x3b"]))
+        self.assertIsNone(resolution_bfs(taquin, limite_noeuds=1000, travailleurs=2))
+        taquin.etat_initial = taquin.etat_final
+        self.assertEqual(resolution_bfs(taquin, travailleurs=2), [])
+
+
+class TestDfsIteratif(unittest.TestCase):
+    """Classe de tests pour le DFS à approfondissement itératif."""
+
+    def test_optimal(self):
+        """La première solution trouvée a la longueur optimale donnée par BFS."""
+        for nom_instance in ("taquin_2x4d", "taquin_3x3b"):
+            taquin = Taquin()
+            self.assertTrue(taquin.charger_depuis_chaine(INSTANCES[nom_instance]))
+            chemin = resolution_dfs(taquin, limite_profondeur=50, limite_temps=60, iteratif=True)
+            verifier_chemin(self, taquin, chemin)
+            self.assertEqual(len(chemin), len(resolution_bfs(taquin, limite_noeuds=200000, limite_temps=60)))
+
+    def test_limite_profondeur(self):
+        """Sans solution dans la borne de profondeur, le parcours échoue proprement."""
+        taquin = Taquin()
+        self.assertTrue(taquin.charger_depuis_chaine(INSTANCES["taquin_3x3b"]))
+        self.assertIsNone(resolution_dfs(taquin, limite_profondeur=10, iteratif=True))
+        taquin.etat_initial = taquin.etat_final
+        self.assertEqual(resolution_dfs(taquin, limite_profondeur=10, iteratif=True), [])
+
+
+class TestBfsBidirectionnel(unittest.TestCase):
+    """Classe de tests pour le parcours en largeur bidirectionnel."""
+
+    def test_optimal(self):
+        """La longueur égale celle du BFS simple, avec bien moins de nœuds."""
+        for nom_instance in ("taquin_2x4d", "taquin_3x3b"):
+            taquin = Taquin()
+            self.assertTrue(taquin.charger_depuis_chaine(INSTANCES[nom_instance]))
+            chemin = resolution_bfs_bidirectionnel(taquin, limite_noeuds=200000, limite_temps=60)
+            verifier_chemin(self, taquin, chemin)
+            self.assertEqual(len(chemin), len(resolution_bfs(taquin, limite_noeuds=200000, limite_temps=60)))
+
+    def test_3x4(self):
+        """Sur une grille 3x4, la longueur égale celle d'IDA*."""
+        taquin = Taquin()
+        self.assertTrue(taquin.charger_depuis_chaine(INSTANCES["taquin_3x4"]))
+        etat = taquin.etat_final
+        generateur = random.Random(4)
+        for _ in range(60):
+            etat = generateur.choice(taquin.obtenir_etats_voisins(etat))
+        taquin.etat_initial = etat
+        taquin.etat_courant = etat.copier()
+        chemin = resolution_bfs_bidirectionnel(taquin, limite_noeuds=500000, limite_temps=60)
+        verifier_chemin(self, taquin, chemin)
+        self.assertEqual(len(chemin), len(resolution_ida_star(taquin, heuristique='marche')))
+
+    def test_deja_resolu(self):
+        """Un état initial égal à l'état final donne un chemin vide."""
+        taquin = Taquin()
+        self.assertTrue(taquin.charger_depuis_chaine(INSTANCES["taquin_2x4d"]))
+        taquin.etat_initial = taquin.etat_final
+        taquin.etat_courant = taquin.etat_final.copier()
+        self.assertEqual(resolution_bfs_bidirectionnel(taquin), [])
+
+
+class TestFilesPriorite(unittest.TestCase):
+    """Classe de tests pour les files de priorité à seaux et sur tas."""
+
+    def test_meme_ordre(self):
+        """Les deux files rendent les éléments dans le même ordre (f croissant, g décroissant, LIFO)."""
+        generateur = random.Random(3)
+        seaux, tas = FileSeaux(), FileTas()
+        attendus = []
+        for numero in range(2000):
+            # Ajouts et extractions entremêlés, avec beaucoup d'égalités
+            if attendus and generateur.random() < 0.3:
+                self.assertEqual(seaux.extraire(), tas.extraire())
+                attendus.pop()
+                continue
+            f, g = generateur.randrange(5, 15), generateur.randrange(0, 10)
+            seaux.ajouter(f, g, (f, g, numero))
+            tas.ajouter(f, g, (f, g, numero))
+            attendus.append(numero)
+        extraits = []
+        while seaux:
+            extraits.append(seaux.extraire())
+            self.assertEqual(extraits[-1], tas.extraire())
+        self.assertEqual(len(tas), 0)
+        self.assertEqual(extraits, sorted(extraits, key=lambda e: (e[0], -e[1], -e[2])))
+        with self.assertRaises(IndexError):
+            seaux.extraire()
+
+    def test_choix_automatique(self):
+        """Les heuristiques entières utilisent la file à seaux."""
+        self.assertIsInstance(creer_file_priorite('marche'), FileSeaux)
+        self.assertIsInstance(creer_file_priorite('combinee'), FileSeaux)
+        self.assertIsInstance(creer_file_priorite('euclidienne'), FileTas)
+
+
+class TestAStar(unittest.TestCase):
+    """Classe de tests pour A* avec table des coûts et réouverture."""
+
+    def test_optimal(self):
+        """Avec une heuristique admissible, A* rend la longueur optimale donnée par IDA*."""
+        for nom_instance in ("taquin_3x3b", "taquin_4x4e"):
+            taquin = Taquin()
+            self.assertTrue(taquin.charger_depuis_chaine(INSTANCES[nom_instance]))
+            longueur = len(resolution_ida_star(taquin, heuristique='marche'))
+            chemin = resolution_a_star(taquin, limite_noeuds=1000000, limite_temps=60, heuristique='marche')
+            verifier_chemin(self, taquin, chemin)
+            self.assertEqual(len(chemin), longueur, msg=nom_instance)
+
+    def test_compteurs(self):
+        """Nœuds développés, générés, ajoutés et rouverts sont comptés séparément."""
+        taquin = Taquin()
+        self.assertTrue(taquin.charger_depuis_chaine(INSTANCES["taquin_4x4"]))
+        self.assertIsNotNone(resolution_a_star(taquin, limite_noeuds=100000, heuristique='lineaire'))
+        statistiques = taquin.statistiques
+        self.assertGreater(statistiques['reouvertures'], 0)
+        self.assertLess(statistiques['reouvertures'], statistiques['noeuds_explores'])
+        
+        # Sans le coup inverse, la racine a au moins deux successeurs et tout autre
+        # nœud développé hors but au moins un; les doublons ne sont pas ajoutés
+        for resolution, heuristique in ((resolution_a_star, 'lineaire'), (resolution_best_first, 'combinee'),
+                                        (resolution_mm, 'marche')):
+            with self.subTest(resolution=resolution.__name__):
+                self.assertIsNotNone(resolution(taquin, limite_noeuds=100000, heuristique=heuristique))
+                statistiques = taquin.statistiques
+                self.assertGreaterEqual(statistiques['noeuds_generes'], statistiques['noeuds_explores'])
+                self.assertLess(statistiques['noeuds_ajoutes'], statistiques['noeuds_generes'])
+                self.assertGreater(statistiques['noeuds_ajoutes'], 0)
+
+
+class TestBeam(unittest.TestCase):
+    """Classe de tests pour la recherche en faisceau."""
+
+    def test_largeur_illimitee(self):
+        """Sans élagage, le faisceau avance comme BFS et trouve la longueur optimale."""
+        taquin = Taquin()
+        self.assertTrue(taquin.charger_depuis_chaine(INSTANCES["taquin_2x4d"]))
+        chemin = resolution_beam(taquin, limite_noeuds=1000000, limite_temps=60, largeur=100000)
+        verifier_chemin(self, taquin, chemin)
+        self.assertEqual(len(chemin), len(resolution_bfs(taquin, limite_noeuds=200000, limite_temps=60)))
+
+    def test_grandes_grilles(self):
+        """Un faisceau étroit résout les grilles 4x4 et 5x5."""
+        for nom_instance in ("taquin_4x4", "taquin_5x5c"):
+            taquin = Taquin()
+            self.assertTrue(taquin.charger_depuis_chaine(INSTANCES[nom_instance]))
+            chemin = resolution_beam(taquin, heuristique='manhattan', largeur=50, limite_noeuds=200000)
+            verifier_chemin(self, taquin, chemin)
+
+    def test_elargissement(self):
+        """Un faisceau qui s'égare est relancé plus large; sans relance, pas de solution."""
+        taquin = Taquin()
+        self.assertTrue(taquin.charger_depuis_chaine(INSTANCES["taquin_3x3b"]))
+        self.assertIsNone(resolution_beam(taquin, heuristique='manhattan', largeur=1,
+                                          facteur_elargissement=1, profondeur_max=10))
+        chemin = resolution_beam(taquin, heuristique='manhattan', largeur=1, profondeur_max=30)
+        verifier_chemin(self, taquin, chemin)
+
+    def test_deja_resolu(self):
+        """Un état déjà résolu donne un chemin vide."""
+        taquin = Taquin()
+        self.assertTrue(taquin.charger_depuis_chaine(INSTANCES["taquin_3x3b"]))
+        taquin.etat_initial = taquin.etat_final
+        self.assertEqual(resolution_beam(taquin), [])
+
+
+class TestAraStar(unittest.TestCase):
+    """Classe de tests pour A* pondéré « anytime » (ARA*)."""
+
+    def test_ameliorations(self):
+        """Les solutions publiées raccourcissent et respectent leur borne; la dernière est optimale."""
+        taquin = Taquin()
+        self.assertTrue(taquin.charger_depuis_chaine(INSTANCES["taquin_3x4"]))
+        etat = taquin.etat_final
+        generateur = random.Random(0)
+        for _ in range(200):
+            etat = generateur.choice(taquin.obtenir_etats_voisins(etat))
+        taquin.etat_initial = etat
+        taquin.etat_courant = etat.copier()
+        longueur = len(resolution_ida_star(taquin, heuristique='marche'))
+        
+        ameliorations = []
+        chemin, borne = resolution_ara_star(taquin, limite_noeuds=1000000, limite_temps=60, poids_initial=3.0,
+                                            rappel=lambda chemin, borne: ameliorations.append((len(chemin), borne)))
+        verifier_chemin(self, taquin, chemin)
+        self.assertGreater(len(ameliorations), 1)
+        for (avant, _), (apres, _) in zip(ameliorations, ameliorations[1:]):
+            self.assertLess(apres, avant)
+        for longueur_trouvee, borne_trouvee in ameliorations:
+            self.assertLessEqual(borne_trouvee, 3.0)
+            self.assertLessEqual(longueur_trouvee, borne_trouvee * longueur + 1e-9)
+        self.assertEqual(len(chemin), longueur)
+        self.assertEqual(borne, 1.0)
+
+    def test_limite(self):
+        """À la limite de nœuds, la meilleure solution est rendue avec sa borne."""
+        taquin = Taquin()
+        self.assertTrue(taquin.charger_depuis_chaine(INSTANCES["taquin_4x4"]))
+        chemin, borne = resolution_ara_star(taquin, limite_noeuds=3000, poids_initial=3.0)
+        verifier_chemin(self, taquin, chemin)
+        self.assertGreater(borne, 1.0)
+        self.assertLessEqual(borne, 3.0)
+        self.assertLessEqual(len(chemin), borne * 30 + 1e-9)
+
+    def test_limite_premiere_iteration(self):
+        """Une limite atteinte avant la fin de la première itération donne une borne finie."""
+        taquin = Taquin()
+        self.assertTrue(taquin.charger_depuis_chaine(INSTANCES["taquin_2x4d"]))
+        longueur = len(resolution_bfs(taquin, limite_noeuds=200000, limite_temps=60))
+        # Avec h nulle, des états de priorité inférieure au coût du but restent
+        # ouverts après sa découverte: la limite interrompt la première itération
+        nulle = (lambda etat: 0, lambda parent, h_parent, enfant: 0)
+        with mock.patch.object(taquin, 'obtenir_heuristique', return_value=nulle):
+            chemin, borne = resolution_ara_star(taquin, limite_noeuds=10500, limite_temps=60, poids_initial=3.0)
+        verifier_chemin(self, taquin, chemin)
+        self.assertEqual(taquin.statistiques['poids'], 3.0)
+        self.assertLess(borne, float('inf'))
+        self.assertLessEqual(len(chemin), borne * longueur + 1e-9)
+
+
+class TestMM(unittest.TestCase):
+    """Classe de tests pour la recherche heuristique bidirectionnelle MM."""
+
+    def test_inverser(self):
+        """Le problème inverse échange les états initial et final."""
+        taquin = Taquin()
+        self.assertTrue(taquin.charger_depuis_chaine(INSTANCES["taquin_3x3b"]))
+        inverse = taquin.inverser()
+        self.assertEqual(inverse.etat_initial, taquin.etat_final)
+        self.assertEqual(inverse.etat_final, taquin.etat_initial)
+        complete, _ = inverse.obtenir_heuristique('manhattan')
+        self.assertEqual(complete(inverse.etat_final), 0)
+
+    def test_optimal(self):
+        """La longueur égale celle du BFS, avec les nœuds comptés par direction."""
+        for nom_instance in ("taquin_2x4d", "taquin_3x3b"):
+            taquin = Taquin()
+            self.assertTrue(taquin.charger_depuis_chaine(INSTANCES[nom_instance]))
+            longueur = len(resolution_bfs(taquin, limite_noeuds=200000, limite_temps=60))
+            for heuristique in ('marche', 'manhattan'):
+                chemin = resolution_mm(taquin, limite_temps=60, heuristique=heuristique)
+                verifier_chemin(self, taquin, chemin)
+                self.assertEqual(len(chemin), longueur, msg=f"{heuristique} sur {nom_instance}")
+                statistiques = taquin.statistiques
+                self.assertGreater(statistiques['noeuds_explores_avant'], 0)
+                self.assertGreater(statistiques['noeuds_explores_arriere'], 0)
+                self.assertEqual(statistiques['noeuds_explores'],
+                                 statistiques['noeuds_explores_avant'] + statistiques['noeuds_explores_arriere'])
+
+    def test_3x4(self):
+        """Sur une grille 3x4, la longueur égale celle d'IDA*."""
+        taquin = Taquin()
+        self.assertTrue(taquin.charger_depuis_chaine(INSTANCES["taquin_3x4"]))
+        etat = taquin.etat_final
+        generateur = random.Random(7)
+        for _ in range(80):
+            etat = generateur.choice(taquin.obtenir_etats_voisins(etat))
+        taquin.etat_initial = etat
+        taquin.etat_courant = etat.copier()
+        chemin = resolution_mm(taquin, limite_temps=60, heuristique='marche')
+        verifier_chemin(self, taquin, chemin)
+        self.assertEqual(len(chemin), len(resolution_ida_star(taquin, heuristique='marche')))
+
+    def test_pdb_cote_avant(self):
+        """Avec 'pdb', seules les bases de l'état final sont construites; le chemin reste optimal."""
+        from src import taquin_complet
+        taquin = Taquin()
+        self.assertTrue(taquin.charger_depuis_chaine(INSTANCES["taquin_3x3b"]))
+        longueur = len(resolution_bfs(taquin, limite_noeuds=200000, limite_temps=60))
+        with mock.patch.object(taquin_complet, 'BaseMotifs', wraps=taquin_complet.BaseMotifs) as construction:
+            chemin = resolution_mm(taquin, limite_temps=60, heuristique='pdb')
+        verifier_chemin(self, taquin, chemin)
+        self.assertEqual(len(chemin), longueur)
+        self.assertEqual([appel.args[0] for appel in construction.call_args_list], [taquin.etat_final])
+
+    def test_deja_resolu(self):
+        """Un état initial égal à l'état final donne un chemin vide."""
+        taquin = Taquin()
+        self.assertTrue(taquin.charger_depuis_chaine(INSTANCES["taquin_2x4d"]))
+        taquin.etat_initial = taquin.etat_final
+        taquin.etat_courant = taquin.etat_final.copier()
+        self.assertEqual(resolution_mm(taquin), [])
+
+
+class TestIdaStar(unittest.TestCase):
+    """Classe de tests pour IDA* sur grille mutable."""
+
+    def _codage(self):
+        """Codage d'une instance 3x3."""
+        taquin = Taquin()
+        self.assertTrue(taquin.charger_depuis_chaine(INSTANCES["taquin_3x3b"]))
+        return taquin.codage
+
+    def test_optimal(self):
+        """IDA* retrouve la longueur optimale donnée par BFS."""
+        for nom_instance in ("taquin_2x4d", "taquin_3x3b"):
+            taquin = Taquin()
+            self.assertTrue(taquin.charger_depuis_chaine(INSTANCES[nom_instance]))
+            longueur = len(resolution_bfs(taquin, limite_noeuds=200000, limite_temps=60))
+            for heuristique in ('marche', 'manhattan'):
+                chemin = resolution_ida_star(taquin, limite_temps=60, heuristique=heuristique)
+                self.assertEqual(len(chemin), longueur, msg=f"{heuristique} sur {nom_instance}")
+                etat = taquin.etat_initial
+                for action, etat_attendu in chemin:
+                    etat = taquin.deplacer(etat, action)
+                    self.assertEqual(etat, etat_attendu)
+                self.assertEqual(etat, taquin.etat_final)
+
+    def test_4x4(self):
+        """Une instance 4x4 est résolue de façon optimale (30 coups)."""
+        taquin = Taquin()
+        self.assertTrue(taquin.charger_depuis_chaine(INSTANCES["taquin_4x4"]))
+        chemin = resolution_ida_star(taquin, limite_temps=60, heuristique='marche')
+        self.assertEqual(len(chemin), 30)
+
+    def test_limite_noeuds(self):
+        """La recherche s'arrête à la limite de nœuds."""
+        taquin = Taquin()
+        self.assertTrue(taquin.charger_depuis_chaine(INSTANCES["taquin_4x4"]))
+        self.assertIsNone(resolution_ida_star(taquin, limite_noeuds=100, heuristique='manhattan'))
+
+    def test_table_transposition(self):
+        """Avec une table, même petite, les chemins restent optimaux."""
+        taquin = Taquin()
+        self.assertTrue(taquin.charger_depuis_chaine(INSTANCES["taquin_3x3b"]))
+        longueur = len(resolution_ida_star(taquin, heuristique='manhattan'))
+        for memoire in (0.002, 1):  # 2 Ko: remplacements fréquents
+            chemin = resolution_ida_star(taquin, heuristique='manhattan', memoire_transpositions=memoire)
+            self.assertEqual(len(chemin), longueur)
+        chemin = resolution_ida_star(taquin, heuristique='marche', memoire_transpositions=1)
+        self.assertEqual(len(chemin), longueur)
+
+    def test_remplacement_profondeur(self):
+        """La première place du panier garde le sous-arbre le plus profond."""
+        codage = self._codage()
+        table = TableTransposition(codage, 1)  # Un seul panier de deux places
+        self.assertEqual(table.capacite, 2)
+        table.enregistrer(0, 1, 2, 30, 20, 1)
+        table.enregistrer(0, 2, 2, 10, 8, 1)   # Moins profond: seconde place
+        table.enregistrer(0, 3, 2, 12, 10, 1)  # Remplace la seconde place
+        self.assertEqual(table.evictions, 1)
+        self.assertIsNotNone(table.consulter(0, 1))
+        self.assertIsNone(table.consulter(0, 2))
+        self.assertEqual(table.consulter(0, 3), (2, 12, 10, 1))
+        table.enregistrer(0, 4, 0, 40, 40, 1)  # Plus profond: prend la première place, 1 descend
+        self.assertIsNone(table.consulter(0, 3))
+        self.assertEqual(table.consulter(0, 1), (2, 30, 20, 1))
+        self.assertEqual((table.succes, table.echecs, table.taille), (3, 2, 2))
+
+
+class TestIdaStarParallele(unittest.TestCase):
+    """Classe de tests pour IDA* parallèle par découpe de la racine."""
+
+    def test_optimal(self):
+        """Les longueurs sont celles d'IDA* séquentiel, avec ou sans sous-problèmes."""
+        for nom_instance, heuristique, longueur in (("taquin_3x3b", 'marche', 21),
+                                                     ("taquin_4x4", 'manhattan', 30)):
+            taquin = Taquin()
+            self.assertTrue(taquin.charger_depuis_chaine(INSTANCES[nom_instance]))
+            chemin = resolution_ida_star(taquin, limite_temps=60, heuristique=heuristique, travailleurs=2)
+            verifier_chemin(self, taquin, chemin)
+            self.assertEqual(len(chemin), longueur, msg=f"{heuristique} sur {nom_instance}")
+            self.assertEqual(taquin.statistiques['travailleurs'], 2)
+
+    def test_demarrage_spawn(self):
+        """Les processus démarrés sans fork relisent les tables du cache disque."""
+        taquin = Taquin()
+        self.assertTrue(taquin.charger_depuis_chaine(INSTANCES["taquin_4x4"]))
+        with mock.patch('multiprocessing.get_context', return_value=multiprocessing.get_context('spawn')):
+            chemin = resolution_ida_star(taquin, limite_temps=60, heuristique='marche', travailleurs=2)
+        verifier_chemin(self, taquin, chemin)
+        self.assertEqual(len(chemin), 30)
+
+    def test_limite_et_deja_resolu(self):
+        """La limite de nœuds arrête tous les processus; un état déjà résolu donne un chemin vide."""
+        taquin = Taquin()
+        self.assertTrue(taquin.charger_depuis_chaine(INSTANCES["taquin_4x4"]))
+        self.assertIsNone(resolution_ida_star(taquin, limite_noeuds=20000, heuristique='manhattan',
+                                              travailleurs=2))
+        self.assertLess(taquin.statistiques['noeuds_explores'], 40000)
+        taquin.etat_initial = taquin.etat_final
+        self.assertEqual(resolution_ida_star(taquin, travailleurs=2), [])
+
+
+class TestResolubilite(unittest.TestCase):
+    """Classe de tests pour le test de résolubilité par parité."""
+
+    def _taquin(self, nom_instance):
+        """Charge une instance."""
+        taquin = Taquin()
+        self.assertTrue(taquin.charger_depuis_chaine(INSTANCES[nom_instance]))
+        return taquin
+
+    def test_instances(self):
+        """Les instances connues sont classées selon leur parité."""
+        for nom_instance in ("taquin_2x4d", "taquin_3x3b", "taquin_4x4", "taquin_5x5b"):
+            taquin = self._taquin(nom_instance)
+            self.assertTrue(taquin.est_resoluble(), nom_instance)
+            self.assertEqual(taquin.resolubilite['classe'], 'paire')
+        taquin = self._taquin("taquin_4x4b")  # 'o' et 'n' échangés
+        self.assertFalse(taquin.est_resoluble())
+        self.assertEqual(taquin.resolubilite['classe'], 'impaire')
+        self.assertIsNone(resolution_a_star(taquin, limite_noeuds=1000000, limite_temps=60))
+        taquin = self._taquin("taquin_2x4")  # Caractères différents de ceux du but
+        self.assertFalse(taquin.est_resoluble())
+        self.assertIsNone(taquin.resolubilite['classe'])
+
+    def test_exact_sur_petites_grilles(self):
+        """La parité sépare exactement les états atteignables des autres (grille 2x3)."""
+        finale = Etat(np.array([['a', 'b', 'c'], ['d', 'e', ' ']]), (1, 2))
+        taquin = Taquin(2, 3)
+        taquin.etat_final = finale
+        atteignables = {finale}
+        file = [finale]
+        for etat in file:
+            for voisin in taquin.obtenir_etats_voisins(etat):
+                if voisin not in atteignables:
+                    atteignables.add(voisin)
+                    file.append(voisin)
+        self.assertEqual(len(atteignables), 360)  # 6! / 2
+        for lettres in itertools.permutations('abcde '):
+            grille = np.array(lettres).reshape(2, 3)
+            vide = divmod(lettres.index(' '), 3)
+            etat = Etat(grille, vide, finale.codage)
+            self.assertEqual(taquin.analyser_resolubilite(etat)['resoluble'], etat in atteignables)
+
+    def test_lettres_repetees(self):
+        """Avec une lettre répétée, échanger deux tuiles reste résoluble."""
+        finale = Etat(np.array([['a', 'b', 'a'], ['c', 'd', ' ']]), (1, 2))
+        taquin = Taquin(2, 3)
+        taquin.etat_final = finale
+        echange = Etat(np.array([['a', 'c', 'a'], ['b', 'd', ' ']]), (1, 2), finale.codage)
+        diagnostic = taquin.analyser_resolubilite(echange)
+        self.assertTrue(diagnostic['resoluble'])
+        self.assertTrue(diagnostic['lettres_repetees'])
+
+    def test_une_ligne(self):
+        """Sur une seule ligne, l'ordre des lettres doit être conservé."""
+        finale = Etat(np.array([['a', 'b', ' ']]), (0, 2))
+        taquin = Taquin(1, 3)
+        taquin.etat_final = finale
+        self.assertTrue(taquin.analyser_resolubilite(Etat(np.array([['a', ' ', 'b']]), (0, 1), finale.codage))['resoluble'])
+        self.assertFalse(taquin.analyser_resolubilite(Etat(np.array([['b', 'a', ' ']]), (0, 2), finale.codage))['resoluble'])
+
+
+class TestEnsembleVisites(unittest.TestCase):
+    """Classe de tests pour le classement des états et les ensembles visités."""
+
+    def _etats_atteignables(self, nom_instance, nombre):
+        """Énumère les premiers états atteignables en largeur d'abord."""
+        taquin = Taquin()
+        self.assertTrue(taquin.charger_depuis_chaine(INSTANCES[nom_instance]))
+        vus = {taquin.etat_initial}
+        file = [taquin.etat_initial]
+        for etat in file:
+            for voisin in taquin.obtenir_etats_voisins(etat):
+                if voisin not in vus:
+                    vus.add(voisin)
+                    file.append(voisin)
+            if len(file) >= nombre:
+                break
+        return file
+
+    def test_rang_bijectif(self):
+        """Deux états distincts ont deux rangs distincts dans l'intervalle."""
+        etats = self._etats_atteignables("taquin_3x3b", 3000)
+        classement = ClassementEtats(etats[0])
+        self.assertEqual(classement.nb_permutations, 362880)
+        rangs = {classement.rang(etat.cle) for etat in etats}
+        self.assertEqual(len(rangs), len(etats))
+        self.assertTrue(all(0 <= rang < classement.nb_permutations for rang in rangs))
+
+    def test_rang_lettres_repetees(self):
+        """Le classement tient compte des lettres répétées."""
+        etat = Etat(np.array([['a', 'a'], ['b', ' ']]), (1, 1))
+        classement = ClassementEtats(etat)
+        self.assertEqual(classement.nb_permutations, 12)  # 4! / 2!
+        self.assertEqual(classement.rang(etat.cle), 6)
+
+    def test_bitmap_et_table(self):
+        """Le bitmap et la table compacte se comportent comme un set exact."""
+        etats = self._etats_atteignables("taquin_3x4", 5000)
+        for taille_max in (None, 0):
+            visites = EnsembleVisites(etats[0], taille_max_bitmap=taille_max)
+            for etat in etats:
+                self.assertTrue(visites.ajouter(etat))
+            for etat in etats:
+                self.assertFalse(visites.ajouter(etat))
+                self.assertIn(etat, visites)
+            self.assertEqual(len(visites), len(etats))
+
+    def test_table_cles_longues(self):
+        """Les grilles 5x5 (clés de plus de 64 bits) restent exactes."""
+        etats = self._etats_atteignables("taquin_5x5b", 70000)
+        visites = EnsembleVisites(etats[0])
+        self.assertGreater(visites._mots, 1)
+        self.assertTrue(all(visites.ajouter(etat) for etat in etats))
+        self.assertFalse(any(visites.ajouter(etat) for etat in etats))
+
+
+if __name__ == '__main__':
+    unittest.main()